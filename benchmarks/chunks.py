@@ -0,0 +1,79 @@
+"""Compares reading of SVG files from ``examples/`` done serially and in chunks by worker processes.
+
+Each file is read ``--repeat`` times per mode, and SSA converted from chunks is checked to be identical to that converted from serially read SVG. Reading in chunks only pays off with several CPUs, whose number is reported along with the results:
+
+    python benchmarks/chunks.py --workers 4
+"""
+
+
+import sys
+from argparse import ArgumentParser
+from glob import glob
+from os import cpu_count, path as os_path
+from time import perf_counter
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from svg2ssa.chunks import CHUNKS_PER_WORKER, read_in_chunks, split_document
+from svg2ssa.document import SVG
+from svg2ssa.utilities import make_executor
+
+
+def read(filepath, xml_parser, executor, workers):
+    """Reads SVG file serially if ``executor`` is ``None``, otherwise in chunks.
+
+    Returns:
+        tuple[float, SVG]: Wall time in seconds, and model of document.
+    """
+
+    svg = SVG()
+    start = perf_counter()
+    if executor is None:
+        svg.from_svg_file(filepath, xml_parser)
+    else:
+        read_in_chunks(svg, filepath, xml_parser, svg.ssa_repr_config["on_error"], workers, executor)
+        svg.resolve_uses()
+    return perf_counter() - start, svg
+
+
+def main():
+    """Reads every file in both modes and prints table."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--workers", type=int, default=min(4, cpu_count() or 1), help="Number of worker processes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs is taken.")
+    parser.add_argument("-p", "--xml_parser", default="auto", help="Name of an XML parser.")
+    parser.add_argument("files", nargs="*", help="SVG files; all SVGs from 'examples/' by default.")
+    args = parser.parse_args()
+
+    filepaths = args.files or sorted(glob(os_path.join(ROOT, "examples", "**", "*.svg"), recursive=True))
+    xml_parser = SVG.get_xml_parser(args.xml_parser)
+    print(f"{cpu_count()} CPUs, {args.workers} workers")
+    print(f"    {'file':<40} {'chunks':>6} {'serial, s':>10} {'chunks, s':>10} {'speedup':>8}")
+    # Pool is started once, so that its start-up isn't measured.
+    with make_executor(args.workers, threads=False) as executor:
+        for filepath in filepaths:
+            with open(filepath, "rb") as file:
+                document = split_document(file.read(), CHUNKS_PER_WORKER * args.workers)
+            serial = min(
+                (read(filepath, xml_parser, None, args.workers) for _ in range(args.repeat)),
+                key=lambda result: result[0],
+            )
+            chunked = min(
+                (read(filepath, xml_parser, executor, args.workers) for _ in range(args.repeat)),
+                key=lambda result: result[0],
+            )
+            config = serial[1].ssa_repr_config
+            if chunked[1].ssa_repr(config) != serial[1].ssa_repr(config):
+                print(f"    {filepath}: output differs from that of serial reading!", file=sys.stderr)
+                sys.exit(1)
+            name = os_path.basename(filepath)[-40:]
+            chunks = len(document[1]) if document else 1
+            print(f"    {name:<40} {chunks:>6} {serial[0]:>10.3f} {chunked[0]:>10.3f} {serial[0] / chunked[0]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
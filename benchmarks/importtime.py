@@ -0,0 +1,82 @@
+"""Checks cold start of svg2ssa against a budget measured with ``python -X importtime``.
+
+Two cases are measured: ``python -m svg2ssa --help`` and conversion of an SVG with a single path. For each case the sum of "self" import times of all modules is compared with its budget (in milliseconds), and the script exits with non-zero code if any budget was exceeded.
+
+Run it from the root of the repo: ``python benchmarks/importtime.py [--help-budget ms] [--convert-budget ms]``.
+"""
+
+
+import sys
+from argparse import ArgumentParser
+from os import path as os_path
+from subprocess import run
+from tempfile import TemporaryDirectory
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+
+ONE_PATH_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+    '<g transform="translate(10,10)" style="fill:#ff0000"><path d="M 0 0 L 50 0 L 50 50 Z"/></g>'
+    "</svg>"
+)
+
+
+def measure(args):
+    """Returns sum of "self" import times in milliseconds, along with the ten slowest imports.
+
+    Args:
+        args (list[str]): Arguments for ``python -m svg2ssa``.
+    Returns:
+        tuple[float, list[tuple[int, str]]]: Total time, and pairs of cumulative time in microseconds and module name.
+    """
+
+    result = run(
+        [sys.executable, "-X", "importtime", "-m", "svg2ssa", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    total = 0
+    cumulative = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        total += int(self_us)
+        cumulative.append((int(cumulative_us), name.strip()))
+    cumulative.sort(reverse=True)
+    return total / 1000, cumulative[:10]
+
+
+def main():
+    """Measures both cases and reports them against budgets."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--help-budget", type=float, default=50.0, help="Budget for '--help', ms.")
+    parser.add_argument("--convert-budget", type=float, default=100.0, help="Budget for one-path conversion, ms.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is taken.")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        file_in = os_path.join(tmp, "one-path.svg")
+        with open(file_in, "w", encoding="utf-8") as file:
+            file.write(ONE_PATH_SVG)
+        cases = (
+            ("--help", ["--help"], args.help_budget),
+            ("one-path conversion", ["-i", file_in, "-o", os_path.join(tmp, "one-path.ass")], args.convert_budget),
+        )
+        failed = False
+        for name, cli_args, budget in cases:
+            total, slowest = min((measure(cli_args) for _ in range(args.repeat)), key=lambda obj: obj[0])
+            verdict = "OK" if total <= budget else "OVER BUDGET"
+            failed |= total > budget
+            print(f"{name}: {total:.1f} ms of imports (budget {budget:.1f} ms) -- {verdict}")
+            for cumulative_us, module in slowest:
+                print(f"    {cumulative_us / 1000:8.1f} ms  {module}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
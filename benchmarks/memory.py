@@ -0,0 +1,86 @@
+"""Reports peak memory of conversion of SVG files from ``examples/``, as traced by :mod:`tracemalloc`.
+
+Peak is measured separately for parsing (:meth:`SVG.from_svg_file`) and for the whole conversion, and so is the number of live objects after parsing. Report can be saved to JSON and later used as a baseline to show the difference, e.g. before and after some change:
+
+    python benchmarks/memory.py --save before.json
+    python benchmarks/memory.py --baseline before.json
+"""
+
+
+import gc
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from glob import glob
+from os import path as os_path
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from svg2ssa.document import SVG
+from svg2ssa.attributes.d import SVGD
+
+
+def measure(filepath, xml_parser):
+    """Converts SVG file under :mod:`tracemalloc`.
+
+    Args:
+        filepath (str): Path to SVG file.
+        xml_parser (Any): XML parser, see :meth:`SVG.get_xml_parser`.
+    Returns:
+        dict[str, int]: Peak memory for parsing and for the whole conversion, in bytes, and number of objects tracked by GC after parsing.
+    """
+
+    # Start from scratch, as if each file were converted by a separate process.
+    SVGD.parse_memo.clear()
+    SVGD.geometry_memo.clear()
+    gc.collect()
+    tracemalloc.start()
+    svg = SVG()
+    svg.from_svg_file(filepath, xml_parser)
+    _, parse_peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    objects = len(gc.get_objects())
+    svg.ssa_repr(svg.ssa_repr_config)
+    _, total_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(parse_peak=parse_peak, total_peak=total_peak, objects=objects)
+
+
+def main():
+    """Measures every example and prints the report."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--save", metavar="json", help="Save report to this file.")
+    parser.add_argument("--baseline", metavar="json", help="Show difference with report saved earlier.")
+    parser.add_argument("-p", "--xml_parser", choices=SVG.xml_parsers, default="defusedxml.ElementTree")
+    args = parser.parse_args()
+
+    xml_parser = SVG.get_xml_parser(args.xml_parser)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "rt", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    report = {}
+    for filepath in sorted(glob(os_path.join(ROOT, "examples", "**", "*.svg"), recursive=True)):
+        name = os_path.relpath(filepath, ROOT).replace(os_path.sep, "/")
+        report[name] = result = measure(filepath, xml_parser)
+        print(name)
+        for key, val in result.items():
+            line = f"    {key:>10}: {val:>12,}"
+            if name in baseline and key in baseline[name]:
+                before = baseline[name][key]
+                line += f"  (before {before:>12,}, {(val - before) / before:+.1%})" if before else ""
+            print(line)
+
+    if args.save:
+        with open(args.save, "wt", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
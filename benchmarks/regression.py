@@ -0,0 +1,150 @@
+"""Converts every SVG from ``examples/`` end to end and gates regressions of output, time and memory.
+
+Each file is converted by a separate ``python -m svg2ssa`` process with default options, ``--repeat`` times. Output is compared byte for byte with the reference SSA file stored next to SVG (``*.svg.ass``), if there's one. Best time of ``parse``, ``convert`` and ``write`` phases and lowest peak RSS are taken from ``--metrics_out`` of conversion, and compared with baseline JSON saved earlier on the same machine:
+
+    python benchmarks/regression.py --save              # record baseline
+    python benchmarks/regression.py                     # compare with it
+    python benchmarks/regression.py --write-references  # after an intended change of output
+
+Script exits with non-zero code if any output differs from its reference, or if time or memory grew by more than ``--max-time-regression`` or ``--max-memory-regression`` percent. Baselines depend on the machine, therefore they aren't stored in the repo.
+"""
+
+
+import json
+import sys
+from argparse import ArgumentParser
+from glob import glob
+from os import path as os_path
+from shutil import copyfile
+from subprocess import run
+from tempfile import TemporaryDirectory
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+
+BASELINE = os_path.join(ROOT, "benchmarks", "baseline.json")
+"""str: Default path to baseline JSON."""
+
+
+def convert(filepath, tmp, xml_parser):
+    """Converts SVG file by a separate process.
+
+    Args:
+        filepath (str): Path to SVG file.
+        tmp (str): Dir for output and metrics.
+        xml_parser (str): Name of an XML parser for ``-p``.
+    Returns:
+        tuple[str, dict]: Path to SSA file and metrics of conversion.
+    """
+
+    file_out = os_path.join(tmp, "out.ass")
+    metrics_out = os_path.join(tmp, "metrics.json")
+    run(
+        [
+            sys.executable,
+            "-m",
+            "svg2ssa",
+            "-i",
+            filepath,
+            "-o",
+            file_out,
+            "-p",
+            xml_parser,
+            "--metrics_out",
+            metrics_out,
+        ],
+        cwd=ROOT,
+        check=True,
+    )
+    with open(metrics_out, "rt", encoding="utf-8") as file:
+        return file_out, json.load(file)
+
+
+def same_bytes(filepath1, filepath2):
+    """Returns whether two files are identical byte for byte."""
+
+    with open(filepath1, "rb") as file1, open(filepath2, "rb") as file2:
+        while True:
+            chunk1 = file1.read(1 << 20)
+            if chunk1 != file2.read(1 << 20):
+                return False
+            if not chunk1:
+                return True
+
+
+def main():
+    """Converts every example, then prints the report and exits with non-zero code on regression."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--baseline", metavar="json", default=BASELINE, help="Baseline to compare with or to save.")
+    parser.add_argument("--save", action="store_true", help="Save results as baseline instead of comparing with it.")
+    parser.add_argument(
+        "--write-references", action="store_true", help="Overwrite reference SSA files with current output."
+    )
+    parser.add_argument("--max-time-regression", type=float, default=15.0, help="Allowed growth of time, %%.")
+    parser.add_argument("--max-memory-regression", type=float, default=10.0, help="Allowed growth of peak RSS, %%.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs is taken.")
+    parser.add_argument("-p", "--xml_parser", default="auto", help="Name of an XML parser.")
+    args = parser.parse_args()
+
+    baseline = {}
+    if not args.save:
+        if os_path.isfile(args.baseline):
+            with open(args.baseline, "rt", encoding="utf-8") as file:
+                baseline = json.load(file)
+        else:
+            print(f"No baseline at '{args.baseline}', only output is checked; record one with '--save'.")
+
+    report = {}
+    failures = []
+    with TemporaryDirectory() as tmp:
+        for filepath in sorted(glob(os_path.join(ROOT, "examples", "**", "*.svg"), recursive=True)):
+            name = os_path.relpath(filepath, ROOT).replace(os_path.sep, "/")
+            times = []
+            peaks = []
+            for _ in range(args.repeat):
+                file_out, metrics = convert(filepath, tmp, args.xml_parser)
+                times.append(sum(metrics["timings"].values()))
+                peaks.append(metrics["peak_rss"])
+            report[name] = result = dict(time=min(times), peak_rss=min(peaks))
+
+            reference = f"{filepath}.ass"
+            if args.write_references:
+                copyfile(file_out, reference)
+                output = "reference written"
+            elif not os_path.isfile(reference):
+                output = "no reference"
+            elif same_bytes(file_out, reference):
+                output = "identical to reference"
+            else:
+                output = "DIFFERS FROM REFERENCE"
+                failures.append(f"{name}: output differs from '{os_path.basename(reference)}'")
+            print(f"{name}: {output}")
+
+            for key, limit, unit, scale in (
+                ("time", args.max_time_regression, "s", 1),
+                ("peak_rss", args.max_memory_regression, "MB", 2**20),
+            ):
+                line = f"    {key:>8}: {result[key] / scale:>10.3f} {unit}"
+                before = baseline.get(name, {}).get(key)
+                if before:
+                    change = (result[key] - before) / before * 100
+                    line += f"  (baseline {before / scale:.3f} {unit}, {change:+.1f}%, limit +{limit:g}%)"
+                    if change > limit:
+                        line += " -- REGRESSION"
+                        failures.append(f"{name}: {key} grew by {change:.1f}%")
+                print(line)
+
+    if args.save:
+        with open(args.baseline, "wt", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+        print(f"Baseline saved to '{args.baseline}'.")
+    if failures:
+        print("Regressions:", file=sys.stderr)
+        for failure in failures:
+            print(f"    {failure}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Generates synthetic SVGs and measures how conversion scales along each axis of complexity on its own.
+
+Axes are: number of paths, segments per path, depth of nesting of groups, number of transforms per element, variety of style strings, and size of file (padded with non-rendered ``metadata``). Each axis is swept while all others stay at their base values; for each point wall time and peak memory (separate run under :mod:`tracemalloc`) are tabulated along with growth exponent relative to the previous point, i.e. ``log(t2 / t1) / log(x2 / x1)``: ``1`` is linear, anything noticeably higher is superlinear.
+
+Run it from the root of the repo: ``python benchmarks/synthetic.py [--axis paths ...] [--plot file.png]``. Generated SVGs can be kept with ``--keep dir``.
+"""
+
+
+import gc
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from math import log
+from os import path as os_path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from svg2ssa.document import SVG
+from svg2ssa.attributes.d import SVGD
+
+
+BASE = dict(paths=500, segments=20, depth=1, transforms=1, styles=10, padding=0)
+"""dict[str, int]: Base values of axes."""
+
+SWEEPS = dict(
+    paths=[250, 500, 1000, 2000, 4000],
+    segments=[5, 10, 20, 40, 80],
+    depth=[1, 2, 4, 8, 16],
+    transforms=[1, 2, 4, 8, 16],
+    styles=[1, 10, 100, 1000],
+    padding=[0, 100_000, 1_000_000, 4_000_000],
+)
+"""dict[str, list[int]]: Values of axes to be swept."""
+
+
+def generate(filepath, paths, segments, depth, transforms, styles, padding, seed=0):
+    """Writes synthetic SVG.
+
+    Args:
+        filepath (str): Path to SVG file to be written.
+        paths (int): Number of ``path`` elements.
+        segments (int): Number of segments per path; mix of ``l``, ``c``, ``q`` and ``h``/``v``.
+        depth (int): Number of nested ``g`` elements around each path.
+        transforms (int): Number of trafos in attr ``transform`` of each element.
+        styles (int): Number of distinct style strings.
+        padding (int): Approximate number of bytes of non-rendered ``metadata``.
+        seed (int): Seed for random numbers.
+    """
+
+    rnd = Random(seed)
+
+    def number():
+        return f"{rnd.uniform(-50, 50):.3f}"
+
+    # Trafos of path are followed by those of its ancestors, and non-consecutive repetition of a trafo makes converter collapse trafos into matrix, which can't be represented by override tags. Hence runs of rotations and scales on paths, followed by translations, and only translations on groups.
+    def translate():
+        return f"translate({rnd.randint(-20, 20)},{rnd.randint(-20, 20)})"
+
+    def transform(group):
+        if group:
+            return " ".join(translate() for _ in range(transforms))
+        trafos = []
+        for i in range(transforms):
+            kind = 3 * i // transforms
+            if kind == 0:
+                trafos.append(f"rotate({rnd.randint(0, 359)})")
+            elif kind == 1:
+                trafos.append(f"scale(1.{rnd.randint(0, 9)})")
+            else:
+                trafos.append(translate())
+        return " ".join(trafos)
+
+    style_strings = [
+        f"fill:#{rnd.randrange(0x1000000):06x};fill-opacity:{rnd.random():.3f};"
+        f"stroke:#{rnd.randrange(0x1000000):06x};stroke-width:{rnd.uniform(0, 4):.2f};opacity:{rnd.random():.3f}"
+        for _ in range(styles)
+    ]
+
+    with open(filepath, "wt", encoding="utf-8") as file:
+        file.write('<svg xmlns="http://www.w3.org/2000/svg" width="1920" height="1080">\n')
+        if padding:
+            chunk = "<desc>" + "x" * 1000 + "</desc>\n"
+            file.write("<metadata>\n" + chunk * (padding // len(chunk)) + "</metadata>\n")
+        for i in range(paths):
+            for _ in range(depth):
+                file.write(f'<g transform="{transform(True)}" style="{rnd.choice(style_strings)}">')
+            segs = [f"m {rnd.uniform(0, 1920):.3f} {rnd.uniform(0, 1080):.3f}"]
+            for j in range(segments):
+                kind = j % 4
+                if kind == 0:
+                    segs.append(f"l {number()} {number()}")
+                elif kind == 1:
+                    segs.append(f"c {' '.join(number() for _ in range(6))}")
+                elif kind == 2:
+                    segs.append(f"q {' '.join(number() for _ in range(4))}")
+                else:
+                    segs.append(f"h {number()} v {number()}")
+            file.write(
+                f'<path id="p{i}" d="{" ".join(segs)} z" transform="{transform(False)}" '
+                f'style="{rnd.choice(style_strings)}"/>'
+            )
+            file.write("</g>" * depth + "\n")
+        file.write("</svg>\n")
+
+
+def convert(filepath, xml_parser):
+    """Converts SVG file from scratch, as if by a separate process."""
+
+    SVGD.parse_memo.clear()
+    SVGD.geometry_memo.clear()
+    svg = SVG()
+    svg.from_svg_file(filepath, xml_parser)
+    return svg.ssa_repr(svg.ssa_repr_config)
+
+
+def measure(filepath, xml_parser, repeat):
+    """Returns best wall time of ``repeat`` runs in seconds, and peak memory in bytes of conversion of SVG file."""
+
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        convert(filepath, xml_parser)
+        elapsed = min(elapsed, perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    convert(filepath, xml_parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def exponent(prev, curr, prev_x, curr_x):
+    """Returns growth exponent between two points, or ``None`` if it can't be computed."""
+
+    if prev is None or prev <= 0 or curr <= 0 or prev_x <= 0 or curr_x == prev_x:
+        return None
+    return log(curr / prev) / log(curr_x / prev_x)
+
+
+def main():
+    """Sweeps axes and prints tables."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--axis", nargs="*", choices=list(SWEEPS), default=list(SWEEPS), help="Axes to sweep.")
+    parser.add_argument("--keep", metavar="dir", help="Write generated SVGs to this dir instead of temporary one.")
+    parser.add_argument("--plot", metavar="png", help="Plot results to this file; requires matplotlib.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs is taken for time.")
+    parser.add_argument("-p", "--xml_parser", choices=SVG.xml_parsers, default="defusedxml.ElementTree")
+    args = parser.parse_args()
+
+    xml_parser = SVG.get_xml_parser(args.xml_parser)
+    results = {}
+    with TemporaryDirectory() as tmp:
+        outdir = args.keep or tmp
+        for axis in args.axis:
+            print(f"{axis}:")
+            print(f"    {'value':>10} {'bytes':>12} {'time, s':>9} {'exp':>6} {'peak, MB':>9} {'exp':>6}")
+            results[axis] = rows = []
+            prev = None
+            for val in SWEEPS[axis]:
+                params = {**BASE, axis: val}
+                filepath = os_path.join(outdir, "-".join(f"{key}{num}" for key, num in params.items()) + ".svg")
+                generate(filepath, **params)
+                elapsed, peak = measure(filepath, xml_parser, args.repeat)
+                time_exp = mem_exp = None
+                if prev is not None:
+                    time_exp = exponent(prev[1], elapsed, prev[0], val)
+                    mem_exp = exponent(prev[2], peak, prev[0], val)
+                rows.append((val, elapsed, peak))
+                prev = (val, elapsed, peak)
+                print(
+                    f"    {val:>10} {os_path.getsize(filepath):>12,} {elapsed:>9.3f} "
+                    f"{'' if time_exp is None else f'{time_exp:.2f}':>6} {peak / 2 ** 20:>9.1f} "
+                    f"{'' if mem_exp is None else f'{mem_exp:.2f}':>6}"
+                )
+
+    if args.plot:
+        plot(results, args.plot)
+
+
+# pylint: disable=import-outside-toplevel
+def plot(results, filepath):
+    """Plots time and peak memory against each axis on log-log scale."""
+
+    try:
+        from matplotlib import pyplot
+    except ImportError:
+        print("matplotlib is not installed, skipping plot.", file=sys.stderr)
+        return
+    fig, axes = pyplot.subplots(2, len(results), figsize=(4 * len(results), 7), squeeze=False)
+    for i, (axis, rows) in enumerate(results.items()):
+        xs = [max(row[0], 1) for row in rows]
+        axes[0][i].loglog(xs, [row[1] for row in rows], marker="o")
+        axes[0][i].set_title(axis)
+        axes[0][i].set_ylabel("time, s")
+        axes[1][i].loglog(xs, [row[2] / 2**20 for row in rows], marker="o")
+        axes[1][i].set_ylabel("peak, MB")
+    fig.tight_layout()
+    fig.savefig(filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compares throughput of conversion of SVG files from ``examples/`` done serially, in thread pool and in process pool.
+
+Each file is converted ``--copies`` times per mode, and results of all modes are checked to be identical to those of serial conversion. Thread pool only scales when GIL is disabled, i.e. under free-threaded build of CPython (``python3.13t`` with ``PYTHON_GIL=0``), which is reported along with the results:
+
+    python benchmarks/threads.py --workers 4 --copies 8
+"""
+
+
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from glob import glob
+from os import cpu_count, path as os_path
+from time import perf_counter
+
+
+ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from svg2ssa.batch import convert
+from svg2ssa.attributes.d import SVGD
+from svg2ssa.utilities import is_gil_enabled
+
+
+def run(mode, sources, workers, xml_parser):
+    """Converts all ``sources`` in given mode.
+
+    Args:
+        mode (str): ``serial``, ``threads`` or ``processes``.
+        sources (list[bytes]): Contents of SVG documents.
+        workers (int): Number of workers of pool.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+    Returns:
+        tuple[float, list[str]]: Wall time in seconds, and contents of SSA documents.
+    """
+
+    # Start from scratch, so that no mode benefits from memos filled by the previous one.
+    SVGD.parse_memo.clear()
+    SVGD.geometry_memo.clear()
+    start = perf_counter()
+    if mode == "serial":
+        results = [convert(data, xml_parser) for data in sources]
+    else:
+        pool = ThreadPoolExecutor if mode == "threads" else ProcessPoolExecutor
+        with pool(max_workers=workers) as executor:
+            results = list(executor.map(convert, sources, [xml_parser] * len(sources)))
+    return perf_counter() - start, results
+
+
+def main():
+    """Runs all modes and prints table."""
+
+    parser = ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--workers", type=int, default=min(4, cpu_count() or 1), help="Number of workers of pools.")
+    parser.add_argument("--copies", type=int, default=4, help="Number of conversions of each file per mode.")
+    parser.add_argument("-p", "--xml_parser", default="auto", help="Name of an XML parser.")
+    parser.add_argument("files", nargs="*", help="SVG files; all SVGs from 'examples/' by default.")
+    args = parser.parse_args()
+
+    filepaths = args.files or sorted(glob(os_path.join(ROOT, "examples", "**", "*.svg"), recursive=True))
+    sources = []
+    for filepath in filepaths:
+        with open(filepath, "rb") as file:
+            sources.extend([file.read()] * args.copies)
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled() else 'disabled'}")
+    print(f"{len(filepaths)} files x {args.copies} copies, {args.workers} workers")
+    print(f"    {'mode':<10} {'time, s':>9} {'docs/s':>8} {'speedup':>8}")
+    serial = None
+    for mode in ("serial", "threads", "processes"):
+        elapsed, results = run(mode, sources, args.workers, args.xml_parser)
+        if serial is None:
+            serial = (elapsed, results)
+        elif results != serial[1]:
+            print(f"    {mode}: results differ from those of serial conversion!", file=sys.stderr)
+            sys.exit(1)
+        print(f"    {mode:<10} {elapsed:>9.3f} {len(sources) / elapsed:>8.2f} {serial[0] / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,10 @@ Warning:
 """
 
 
+from multiprocessing import freeze_support
+
 from svg2ssa.__main__ import cli
 
+# Process pools of sequence mode and of :mod:`svg2ssa.batch` spawn workers from the frozen executable itself.
+freeze_support()
 cli()
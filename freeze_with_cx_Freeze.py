@@ -20,7 +20,16 @@ VERSION = parse(pyproject)["tool"]["poetry"]["version"]
 
 freezer = Freezer(
     [Executable(".\\boot_svg2ssa_during_freeze.py", target_name="svg2ssa", icon=".\\logo.ico")],
-    packages=["xml.etree.ElementTree", "lxml.etree", "lxml._elementpath", "gzip", "defusedxml.ElementTree"],
+    packages=[
+        "xml.etree.ElementTree",
+        "lxml.etree",
+        "lxml._elementpath",
+        "gzip",
+        "defusedxml.ElementTree",
+        # Imported by PLY dynamically, hence invisible to cx_Freeze.
+        "svg2ssa.attributes.parsetab_d",
+        "svg2ssa.attributes.parsetab_transform",
+    ],
     targetDir=f".\\dist\\svg2ssa-{VERSION}",
 )
 freezer.Freeze()
@@ -0,0 +1,18 @@
+"""Pre-generates PLY parse tables for attrs ``d`` and ``transform``.
+
+Building of LALR tables is the most expensive part of a cold start, especially for standalone executables, so tables are shipped along with the package. They must be regenerated whenever grammar changes, otherwise they'll be silently rebuilt in memory on each run.
+
+To regenerate, simply run this script from the root of the repo.
+"""
+
+
+from os import path as os_path
+
+from svg2ssa.attributes.d import SVGD
+from svg2ssa.attributes.transform import SVGTransform
+
+
+outputdir = os_path.join(os_path.dirname(os_path.abspath(__file__)), "svg2ssa", "attributes")
+
+for parser in (SVGD.parser, SVGTransform.parser):
+    parser.build(write_tables=True, outputdir=outputdir)
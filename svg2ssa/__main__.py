@@ -1,28 +1,89 @@
 """Logic for use of svg2ssa as a proper standalone app."""
 
 
-from sys import argv as sys_argv
+from sys import argv as sys_argv, stderr as sys_stderr
 from os import path as os_path
+from shlex import split as shlex_split
 from argparse import ArgumentParser
-from importlib import import_module
 
-from .document import SVG
+from .config import default_ssa_repr_config as config
 
-config = SVG.default_ssa_repr_config
+
+def magnification_level(val):
+    """Converts value of CLI option ``--magnification_level``, which is either ``auto`` or ``int``."""
+
+    return val if val == "auto" else int(val)
+
+
+def canvas_region(val):
+    """Converts value of CLI option ``--region``, which is ``x,y,w,h``, to ``tuple[float, float, float, float]``."""
+
+    coords = tuple(float(coord) for coord in val.split(","))
+    if len(coords) != 4 or coords[2] < 0 or coords[3] < 0:
+        raise ValueError(val)
+    return coords
+
+
+def print_costs(report, filepath=""):
+    """Prints report of estimated costs of rendering of events to stderr, see :func:`svg2ssa.cost.cost_report`."""
+
+    from .cost import describe_cost  # pylint: disable=import-outside-toplevel
+
+    where = f" of '{filepath}'" if filepath else ""
+    print(f"Estimated cost of rendering{where}: {report['total']:,.1f} in total", file=sys_stderr)
+    for cost in report["events"]:
+        over = " over budget" if report["budget"] and cost["cost"] > report["budget"] else ""
+        print(f"    {describe_cost(cost)}{over}", file=sys_stderr)
+
+
+def print_palette(report, filepath=""):
+    """Prints report of quantization of palette to stderr, see :func:`svg2ssa.palette.quantize_palette`."""
+
+    where = f" of '{filepath}'" if filepath else ""
+    (colors_before, colors_after), (codes_before, codes_after) = report["colors"], report["codes"]
+    # Sizes of document aren't known in sequence mode, see :func:`svg2ssa.batch.convert_sequence`.
+    sizes = ", {:,} -> {:,} bytes".format(*report["bytes"]) if "bytes" in report else ""
+    print(
+        f"Palette{where}: {colors_before} -> {colors_after} colors (max ΔE {report['max_delta_e']}), "
+        f"{codes_before} -> {codes_after} distinct override tags{sizes}",
+        file=sys_stderr,
+    )
+    entries = [f"{entry['color']} x{entry['uses']}" for entry in report["palette"]]
+    for i in range(0, len(entries), 6):
+        print(f"    {', '.join(entries[i : i + 6])}", file=sys_stderr)
 
 
 # pylint: disable=import-outside-toplevel
 def cli(
     t=list(config["unnecessary_transformations"]),
     m=config["magnification_level"],
+    e=config["magnification_tolerance"],
+    c=config["canonicalization"],
     s=config["stroke_preservation"],
     x=config["width"],
     y=config["height"],
     i="",
     o="",
-    p="defusedxml.ElementTree",
+    p="auto",
+    r=None,
+    v=False,
+    split_max_points=config["split_max_points"],
+    split_max_bytes=config["split_max_bytes"],
+    max_styles=config["max_styles"],
+    palette_max_colors=config["palette_max_colors"],
+    palette_tolerance=config["palette_tolerance"],
+    on_error=config["on_error"],
+    cost_report=config["cost_report"],
+    cost_budget=config["cost_budget"],
+    select_id=config["select_id"],
+    region=config["region"],
+    parse_workers=0,
+    metrics_out="",
 ):
-    """Reusable CLI logic."""
+    """Reusable CLI logic.
+
+    Models of SVG, PLY and XML parser are imported only after arguments were parsed, so that ``--help`` and malformed invocations return quickly.
+    """
 
     parser = ArgumentParser(
         description="Converts SVG (Rec 1.1) into SSA (v4.0+).",
@@ -30,18 +91,53 @@ def cli(
     parser.add_argument(
         "-t",
         "--unnecessary_transformations",
-        help="Trafos that should be collapsed into matrix, i.e. 'baked'.",
+        help=(
+            "Trafos that should be collapsed into matrix, i.e. 'baked'. "
+            "'auto' picks them for each path separately: the cheapest to render and the shortest of combos whose "
+            "override tags render path the same as SVG, within '--magnification_tolerance'; '-v' reports choices."
+        ),
         default=t,
-        choices=["scale", "translate", "rotate"],
+        choices=["scale", "translate", "rotate", "auto"],
         nargs="*",
     )
     parser.add_argument(
         "-m",
         "--magnification_level",
-        help="Magnification level of the coordinate system by this formula: (level - 1) ^ 2.",
+        help=(
+            "Magnification level of the coordinate system by this formula: (level - 1) ^ 2. "
+            "'auto' picks the smallest level for each path separately, see '--magnification_tolerance'."
+        ),
         default=m,
-        type=int,
-        metavar="int",
+        type=magnification_level,
+        metavar="{int,auto}",
+    )
+    parser.add_argument(
+        "-e",
+        "--magnification_tolerance",
+        help=(
+            "Max rounding error of coordinates, in pixels, allowed by '--magnification_level auto', "
+            "and max extra error of trafos allowed by '--unnecessary_transformations auto'."
+        ),
+        default=e,
+        type=float,
+        metavar="float",
+    )
+    parser.add_argument(
+        "-c",
+        "--canonicalization",
+        help=(
+            "Demote straight curves to lines, merge collinear lines and drop duplicate points after rounding, "
+            "w/o changing rendered shapes."
+        ),
+        default=c,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--no_canonicalization",
+        "--no-canonicalization",
+        help="Emit rounded segments as they are, which is the default, see '--canonicalization'.",
+        dest="canonicalization",
+        action="store_false",
     )
     parser.add_argument(
         "-s",
@@ -96,25 +192,282 @@ def cli(
     parser.add_argument(
         "-p",
         "--xml_parser",
-        help="Name of an XML parser object with an API equivalent to xml.etree.ElementTree.",
+        help=(
+            "Name of an XML parser object with an API equivalent to xml.etree.ElementTree. "
+            "'auto' picks the fastest safe one that is installed: lxml (w/o resolving entities), then defusedxml."
+        ),
         default=p,
         # Because of dynamic importing with :func:`importlib.import_module`, for safety set of available parsers must be limited to known parsers.
-        choices=["defusedxml.ElementTree", "lxml.etree", "xml.etree.ElementTree"],
+        choices=["auto", "lxml.etree", "defusedxml.ElementTree", "xml.etree.ElementTree"],
+    )
+    parser.add_argument(
+        "-r",
+        "--frame_rate",
+        help=(
+            "Enables sequence mode: '--file_in' becomes glob pattern matching numbered frames (e.g. 'frame_*.svg'), "
+            "which are converted in parallel into one SSA file, each frame lasting 1/frame_rate seconds. "
+            "Requires '--file_out'."
+        ),
+        default=r,
+        type=float,
+        metavar="float",
+    )
+    parser.add_argument(
+        "--split_max_points",
+        "--split-max-points",
+        help=(
+            "Split drawings with more points than this into several events, at boundaries of subpaths "
+            "which don't interact with each other. '0' disables splitting."
+        ),
+        default=split_max_points,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--split_max_bytes",
+        "--split-max-bytes",
+        help="Same as '--split_max_points', but for length of drawing.",
+        default=split_max_bytes,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--max_styles",
+        "--max-styles",
+        help=(
+            "Move this many most frequent combos of colors, alphas and border to styles of '[V4+ Styles]', "
+            "so that events refer to them and inline only tags that differ. '0' keeps all tags inline."
+        ),
+        default=max_styles,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--palette_max_colors",
+        "--palette-max-colors",
+        help=(
+            "Quantize colors of fill and stroke to at most this many, chosen among the most frequent ones, "
+            "and print the palette with the reduction of distinct override tags and of size to stderr. '0' means no limit."
+        ),
+        default=palette_max_colors,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--palette_tolerance",
+        "--palette-tolerance",
+        help=(
+            "Quantize colors of fill and stroke by replacing each one with a more frequent one within this "
+            "ΔE*ab (CIE76; ~1 is barely noticeable), see '--palette_max_colors'. '0' disables it."
+        ),
+        default=palette_tolerance,
+        type=float,
+        metavar="float",
+    )
+    parser.add_argument(
+        "--on_error",
+        "--on-error",
+        help=(
+            "What to do with elements that can't be converted, e.g. because of malformed 'd': "
+            "'fail' aborts conversion, 'skip' skips them and prints error report to stderr."
+        ),
+        default=on_error,
+        choices=["skip", "fail"],
+    )
+    parser.add_argument(
+        "--cost_report",
+        "--cost-report",
+        help=(
+            "Estimate cost of rendering of each event from its points, curves, area, border and alpha, "
+            "and print this many heaviest events along with total cost to stderr. '0' disables report."
+        ),
+        default=cost_report,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--cost_budget",
+        "--cost-budget",
+        help=(
+            "Fail conversion w/o writing '--file_out' if estimated cost of any event exceeds this, "
+            "see '--cost_report'; such events are always reported. '0' disables budget."
+        ),
+        default=cost_budget,
+        type=float,
+        metavar="float",
+    )
+    parser.add_argument(
+        "--select_id",
+        "--select-id",
+        help=(
+            "Convert only elements whose 'id', or 'id' of any of their ancestors, matches this glob pattern, "
+            "e.g. 'sign-*'. Other elements are skipped while SVG is read, before their attrs are parsed, "
+            "so it can't be overridden by '--variant'."
+        ),
+        default=select_id,
+        metavar="glob",
+    )
+    parser.add_argument(
+        "--region",
+        help=(
+            "Convert only paths whose bounding box, widened by stroke, overlaps this region of canvas, "
+            "given as 'x,y,w,h' in px. Box is found w/o parsing path, so paths outside are skipped cheaply."
+        ),
+        default=region,
+        type=canvas_region,
+        metavar="x,y,w,h",
+    )
+    parser.add_argument(
+        "--parse_workers",
+        "--parse-workers",
+        help=(
+            "Read SVG in parallel by this many workers, each reading a chunk of top-level elements of root 'svg' or "
+            "of a large layer. Output is identical to that of serial reading. Pays off only for large files on "
+            "several CPUs. '0' reads SVG serially."
+        ),
+        default=parse_workers,
+        type=int,
+        metavar="int",
+    )
+    parser.add_argument(
+        "--variant",
+        help=(
+            "Also write variant of SSA file converted from the same parsed SVG, whose options of conversion are overridden "
+            "by those after '=', e.g. \"--variant 'p4=-m 4 -s 1'\" writes 'out.p4.ass' along with 'out.ass'. "
+            "May be repeated."
+        ),
+        default=[],
+        action="append",
+        metavar="name=options",
+    )
+    parser.add_argument(
+        "--metrics_out",
+        "--metrics-out",
+        help=(
+            "JSON file for metrics of conversion: sizes, counts of elements and segments, timings, peak RSS etc. "
+            "With '--variant', metrics are those of the main SSA file."
+        ),
+        default=metrics_out,
+        metavar="str",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        help="Print statistics of conversion to stderr.",
+        default=v,
+        action="store_true",
     )
 
     args = vars(parser.parse_args(sys_argv[1:]))
-    args["unnecessary_transformations"] = set(args["unnecessary_transformations"])
+    args["unnecessary_transformations"] = frozenset(args["unnecessary_transformations"])
 
     file_in = args.pop("file_in")
     file_out = args.pop("file_out")
-    xml_parser = import_module(args.pop("xml_parser"))
+    frame_rate = args.pop("frame_rate")
+    verbose = args.pop("verbose")
+    metrics_out = args.pop("metrics_out")
+    parse_workers = args.pop("parse_workers")
+    variants = {}
+    for variant in args.pop("variant"):
+        name, sep, options = variant.partition("=")
+        if not sep or not name:
+            parser.error(f"variant must look like 'name=options', got '{variant}'.")
+        # Options of variant are appended to those of invocation, so that they override them and are validated in the same way; only options of conversion are used.
+        overrides = vars(parser.parse_args(sys_argv[1:] + shlex_split(options)))
+        overrides["unnecessary_transformations"] = frozenset(overrides["unnecessary_transformations"])
+        variants[name] = {key: overrides[key] for key in args if key != "xml_parser"}
 
-    if os_path.isfile(file_in):
+    if frame_rate is not None:
+        from .batch import convert_sequence
+
+        if not file_out:
+            parser.error("sequence mode requires '--file_out'.")
+        if metrics_out:
+            parser.error("sequence mode doesn't support '--metrics_out'.")
+        if variants:
+            parser.error("sequence mode doesn't support '--variant'.")
+        if parse_workers:
+            parser.error("sequence mode doesn't support '--parse_workers', frames are read in parallel anyway.")
+        from .errors import SSACostError
+
+        report = {}
+        try:
+            ssa = convert_sequence(
+                file_in, frame_rate, xml_parser=args.pop("xml_parser"), ssa_repr_config=args, report=report
+            )
+        except SSACostError as err:
+            print_costs(err.report, err.filepath)
+            parser.exit(1, f"{parser.prog}: error: {err!s}\n")
+        with open(file_out, "w+t", buffering=65536, encoding="utf-8") as ssa_file:
+            ssa_file.write(ssa)
+            ssa_file.write("\n")
+        for filepath, frame_report in report["frames"].items():
+            if frame_report["costs"] is not None:
+                print_costs(frame_report["costs"], filepath)
+        if report["palette"] is not None:
+            print_palette(report["palette"])
+        errors = [
+            (filepath, error)
+            for filepath, frame_report in report["frames"].items()
+            for error in sorted(frame_report["errors"], key=lambda error: error.position)
+        ]
+        if errors:
+            print(f"Elements skipped because of errors: {len(errors)}", file=sys_stderr)
+            for filepath, error in errors:
+                print(f"    {filepath}: {error.describe()}", file=sys_stderr)
+    elif os_path.isfile(file_in):
+        from .document import SVG
+
+        xml_parser = SVG.get_xml_parser(args.pop("xml_parser"))
         svg = SVG()
-        svg.from_svg_file(file_in, xml_parser)
+        svg.from_svg_file(file_in, xml_parser, args["on_error"], parse_workers, args["select_id"])
         # User shouldn't be able to inject anything bad because :mod:`argparse` checks whether option is supported, so this should be safe.
         # :mod:`argparse` maps data to ``--``-prefixed options instead of ``-``-prefixed, therefore this will result in something like ``stroke_preservation = 1`` and not ``s = 1`` or whatever.
-        svg.to_ssa_file(file_out if file_out else f"{file_in}.ass", args)
+        from .errors import SSACostError
+
+        file_out = file_out if file_out else f"{file_in}.ass"
+        root, ext = os_path.splitext(file_out)
+        # Main output goes last, so that metrics and statistics reported below are those of its conversion.
+        outputs = {**{f"{root}.{name}{ext}": variant_args for name, variant_args in variants.items()}, file_out: args}
+        for filepath, variant_args in outputs.items():
+            try:
+                metrics = svg.to_ssa_file(filepath, variant_args)
+            except SSACostError as err:
+                print_costs(err.report, filepath if variants else "")
+                parser.exit(1, f"{parser.prog}: error: {err!s}\n")
+            if svg.costs is not None:
+                print_costs(svg.costs, filepath if variants else "")
+            if svg.palette is not None:
+                print_palette(svg.palette, filepath if variants else "")
+        if metrics_out:
+            import json
+
+            with open(metrics_out, "w+t", encoding="utf-8") as metrics_file:
+                json.dump(metrics, metrics_file, indent=4)
+        if svg.errors:
+            print(f"Elements skipped because of errors: {len(svg.errors)}", file=sys_stderr)
+            for error in sorted(svg.errors, key=lambda error: error.position):
+                print(f"    {error.describe()}", file=sys_stderr)
+        if verbose:
+            from .attributes.d import SVGD
+
+            levels = ", ".join(f"\\p{level}: {count}" for level, count in sorted(svg.magnification_levels.items()))
+            print(f"Events per magnification level: {levels}", file=sys_stderr)
+            skipped = {key: svg.skipped_elements[key] for key in ("not selected", "outside region")}
+            if any(skipped.values()):
+                skipped = ", ".join(f"{key}: {count}" for key, count in skipped.items())
+                print(f"Elements filtered out: {skipped}", file=sys_stderr)
+            if svg.baked_trafos:
+                baked = ", ".join(f"{combo}: {count}" for combo, count in sorted(svg.baked_trafos.items()))
+                print(f"Paths per trafos baked by 'auto': {baked}", file=sys_stderr)
+            print(SVGD.parse_memo.report(), file=sys_stderr)
+            print(SVGD.geometry_memo.report(), file=sys_stderr)
+            attributes = metrics["attributes"]
+            print(
+                f"Values of attrs parsed: {attributes['parsed']} of {attributes['read']} read, "
+                f"{attributes['avoided']} avoided",
+                file=sys_stderr,
+            )
     else:
         parser.print_help()
 
@@ -3,6 +3,7 @@
 
 import re
 from ..core import SVGBasicEntity
+from ..errors import SVGAttributeError
 
 
 class SVGColor(SVGBasicEntity):
@@ -13,6 +14,8 @@ class SVGColor(SVGBasicEntity):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     color_keywords = {
         "aliceblue": ("FF", "F8", "F0"),
         "antiquewhite": ("D7", "EB", "FA"),
@@ -199,7 +202,9 @@ class SVGColor(SVGBasicEntity):
             tmp = cls.color_keywords[tmp.lower()]
         else:
             # Fixme: Currently out-of-range values raise errors, which is wrong according to SVG Rec 1.1.
-            raise TypeError(f"{cls.__name__}: The next color specified in SVG is malformed or unsupported: {data}.")
+            raise SVGAttributeError(
+                f"{cls.__name__}: The next color specified in SVG is malformed or unsupported: {data}."
+            )
         return cls(tmp)
 
     def ssa_repr(self, ssa_repr_config):
@@ -218,6 +223,8 @@ class SVGFill(SVGColor):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     svg_name = "fill"
 
 
@@ -229,6 +236,8 @@ class SVGStroke(SVGColor):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     svg_name = "stroke"
 
     def ssa_repr(self, ssa_repr_config):
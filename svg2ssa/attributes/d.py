@@ -1,9 +1,13 @@
 """Logic for the models of SVG document's attributes describing shapes."""
 
 
-from ply.lex import lex
-from ply.yacc import yacc
+import re
+from itertools import accumulate, chain
+from operator import itemgetter
+
 from ..core import SVGContainerEntity
+from ..utilities import NUMBER, Memo, PLYParser
+from ..errors import SVGAttributeError
 from .transform import SVGTrafoScale
 
 
@@ -25,12 +29,12 @@ class S2SDLex:
         t.value = float(t.value)
         return t
 
-    # pylint: disable=unsubscriptable-object
+    # pylint: disable=unsubscriptable-object,no-member
     def t_error(t):
-        # Fixme: When ``t.value[0]`` will be the last character in the sequence, ``t.value[1:11]`` may cause errors.
-        raise Exception(
-            f"The next illegal character were found in 'd' attribute: '{t.value[0]}'.\n"
-            f"These characters were right after it: {t.value[1:11]}"
+        raise SVGAttributeError(
+            f"Illegal or unsupported character '{t.value[0]}' in 'd' attribute, right before: '{t.value[1:11]}'.",
+            "d",
+            t.lexpos,
         )
 
 
@@ -178,19 +182,15 @@ class S2SDYacc:
         """a_comm_arg : NMB NMB NMB NMB NMB NMB NMB"""
 
         if (p[4] < 0 or p[4] > 1) or (p[5] < 0 or p[5] > 1):
-            raise Exception(
-                "One of the 'flags' in elliptical arc is not valid.\n" f"It were found in this sequence: {p[1:7]}."
-            )
+            raise SVGAttributeError(f"One of the 'flags' in elliptical arc is not valid: {p[1:8]}.", "d", p.lexpos(1))
         else:
             p[0] = [abs(p[1]), abs(p[2]), p[3], p[4], p[5], p[6][0], p[6][1]]
 
     # pylint: disable=missing-function-docstring
     def p_error(self, p):
-        raise Exception(
-            "Some error happened while 'yacc' were parsing 'd' attribute. "
-            "Looks like he encountered incorrect sequence of tokens.\n"
-            f"First ten characters from that sequence: {p[0:11]}.\n"
-        )
+        if p is None:
+            raise SVGAttributeError("Unexpected end of 'd' attribute.", "d")
+        raise SVGAttributeError(f"Unexpected token '{p.value}' in 'd' attribute.", "d", p.lexpos)
 
     tokens = S2SDLex.tokens
 
@@ -202,18 +202,87 @@ class SVGD(SVGContainerEntity):
     Inherited: no
     """
 
+    __slots__ = ("ctm", "raw", "origin")
+
     svg_name = "d"
 
-    def __init__(self, data):
+    parser = None
+    """svg2ssa.utilities.PLYParser: Parser shared by all instances; set right after class definition."""
+
+    # Repeated shapes (3D renders, text converted to paths) have identical ``d`` up to their first moveto, or differ only by translation in CTM, hence two memos: of parsed ``d`` moved to origin (see :meth:`normalize`), and of it converted to SSA commands using only linear part of CTM. The latter is what makes repeated shape cost only the addition of translation, along with transformed origin, to the memoized coords.
+    # Sizes are estimated from numbers of segments and of coords, each of which takes a pointer and a float.
+    parse_memo = Memo("d parse memo", 4 << 20, lambda parsed: 56 + 64 * len(parsed) + 32 * sum(map(len, parsed)))
+    """svg2ssa.utilities.Memo: Maps normalized raw ``d`` to parsed data. Parsed data is shared, therefore must not be modified."""
+    geometry_memo = Memo(
+        "d geometry memo",
+        4 << 20,
+        lambda geometry: 56 + 120 * len(geometry) + 32 * sum(map(len, map(itemgetter(1), geometry))),
+    )
+    """svg2ssa.utilities.Memo: Maps normalized raw ``d`` along with linear part of CTM to the result of :meth:`geometry`."""
+
+    first_moveto = re.compile(rf"\s*([Mm])[\s,]*({NUMBER})[\s,]*({NUMBER})(.*)", re.S)
+    """re.Pattern: Raw ``d`` split into its first moveto and the rest, for :meth:`normalize`."""
+    absolute_command = re.compile(r"[MLHVCSQTA]")
+    """re.Pattern: Commands whose coords don't depend on the first moveto, for :meth:`normalize`."""
+
+    max_magnification_level = 8
+    """int: Upper bound for :meth:`ssa_repr_adaptive`."""
+
+    scan_command = re.compile(r"([MmLlHhVvCcSsQqTtZz])")
+    """re.Pattern: Commands of raw ``d``, for :meth:`scan_bounding_box`."""
+    scan_number = re.compile(rf"{NUMBER}|[^\s,]")
+    """re.Pattern: Numbers of raw ``d``, along with illegal chars, which fail conversion to ``float``, for :meth:`scan_bounding_box`."""
+    scan_arity = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "Z": 0}
+    """dict[str, int]: Number of args per command, for :meth:`scan_bounding_box`."""
+
+    def __init__(self, data, raw=None, ctm=None, origin=(0.0, 0.0)):
         super().__init__(data)
-        self.ctm = SVGTrafoScale((1, 1)).matrix()
+        self.ctm = SVGTrafoScale((1, 1)).matrix() if ctm is None else ctm
+        """svg2ssa.attributes.transform.SVGTrafoMatrix: CTM to be applied to coords; passed by :meth:`svg2ssa.elements.SVGElementPath.ssa_repr`, so that shared instance is never modified."""
+        self.raw = raw
+        """str: Normalized raw value of attr, which is used as a key for memos; ``None`` disables memoization of instance."""
+        self.origin = origin
+        """tuple[float, float]: Point which :attr:`data` was moved from to the origin, see :meth:`normalize`."""
+
+    @classmethod
+    def normalize(cls, raw):
+        """Moves path to the origin, so that paths which differ only by translation share memoized data.
+
+        Only path whose coords after the first moveto are all relative is moved, by replacing that moveto with ``m 0 0``, which is how text converted to paths and most of other paths written by Inkscape look like. Others are left as is, since moving them would take parsing.
+
+        Args:
+            raw (str): Raw value of attr.
+        Returns:
+            tuple[str, tuple[float, float]]: Normalized raw value, and coords of the first moveto it was moved from.
+        """
+
+        match = cls.first_moveto.match(raw)
+        if match is None:
+            return raw, (0.0, 0.0)
+        comm, x, y, rest = match.groups()
+        if cls.absolute_command.search(rest):
+            return raw, (0.0, 0.0)
+        # Coords that follow absolute moveto w/o command are those of absolute lineto.
+        first = rest.lstrip(" \t\r\n,")[:1]
+        if comm == "M" and first and not first.isalpha():
+            return raw, (0.0, 0.0)
+        return f"m 0 0 {rest}", (float(x), float(y))
 
     @classmethod
     def from_raw_data(cls, data):
-        lexer = lex(module=S2SDLex)
-        lexer.input(data)
-        parser = yacc(module=S2SDYacc(), write_tables=0, debug=False)
-        return cls(parser.parse(debug=False, lexer=lexer))
+        key, origin = cls.normalize(data)
+        parsed = cls.parse_memo.get(key)
+        if parsed is None:
+            try:
+                parsed = cls.parser.parse(key)
+            except SVGAttributeError:
+                # Offsets of errors must point into value as written.
+                if key is data:
+                    raise
+                cls.parser.parse(data)
+                raise
+            cls.parse_memo[key] = parsed
+        return cls(parsed, key, origin=origin)
 
     @staticmethod
     def control_point(last_abs_seg_svg_name, last_abs_seg_data, svg_name):
@@ -225,8 +294,16 @@ class SVGD(SVGContainerEntity):
             ctrlp = last_abs_seg_data[-2:]
         return ctrlp
 
-    def ssa_repr(self, ssa_repr_config):
-        ctma, ctmb, ctmc, ctmd, ctme, ctmf = self.ctm.data
+    def geometry(self, linear):
+        """Converts path to terminal SSA commands with absolute coords, transformed by linear part of CTM.
+
+        Args:
+            linear (tuple[float, float, float, float]): First four components of CTM.
+        Returns:
+            list[tuple[str, tuple[float, ...]]]: Pairs of SSA command and its coords, translation of CTM not applied.
+        """
+
+        ctma, ctmb, ctmc, ctmd = linear
         # ``last_abs_seg_data`` -- contains "current point". Every relative point in a shape depends on a previous absolute point, except relative moveto. Also almost whole segment is needed for ``Q``, ``T``, ``S``.
         # ``last_abs_moveto_data`` -- last seen absolute moveto command. Every relative moveto point in a shape depends on a previous absolute moveto point from previous shape.
         last_abs_seg_svg_name = "M"
@@ -295,16 +372,247 @@ class SVGD(SVGContainerEntity):
                     if svg_name == "M":
                         last_abs_moveto_data = data
 
-                    # Apply CTM to terminal, abs comms.
+                    # Apply linear part of CTM to terminal, abs comms.
                     processed = []
                     for i in range(0, len(data), 2):
                         x = data[i]
                         y = data[i + 1]
-                        processed.append(str(round(ctma * x + ctmc * y + ctme)))
-                        processed.append(str(round(ctmb * x + ctmd * y + ctmf)))
+                        processed.append(ctma * x + ctmc * y)
+                        processed.append(ctmb * x + ctmd * y)
 
-                    # Convert to SSA representation.
-                    segs.append(f"{terminal_comms[svg_name]} {' '.join(processed)}")
+                    segs.append((terminal_comms[svg_name], tuple(processed)))
                     break
 
-        return " ".join(segs)
+        return segs
+
+    def memoized_geometry(self, linear):
+        """Same as :meth:`geometry`, but looks up :attr:`geometry_memo` first. Coords are relative to :attr:`origin`, see :meth:`offset`."""
+
+        if self.raw is None:
+            return self.geometry(linear)
+        key = (self.raw, linear)
+        geometry = SVGD.geometry_memo.get(key)
+        if geometry is None:
+            geometry = self.geometry(linear)
+            SVGD.geometry_memo[key] = geometry
+        return geometry
+
+    def offset(self, linear):
+        """Returns :attr:`origin` transformed by linear part of CTM, i.e. what is added to coords of :meth:`memoized_geometry` along with translation of CTM.
+
+        Args:
+            linear (tuple[float, float, float, float]): First four components of CTM.
+        Returns:
+            tuple[float, float]: Offset.
+        """
+
+        ctma, ctmb, ctmc, ctmd = linear
+        x, y = self.origin
+        return ctma * x + ctmc * y, ctmb * x + ctmd * y
+
+    @staticmethod
+    def scan_bounding_box(raw):
+        """Finds bounding box of path right from raw ``d``, w/o parsing it into segments, so that paths could be filtered by region before conversion, see :meth:`svg2ssa.elements.SVGElementPath.overlaps`.
+
+        Box encloses all points and control points, as interpreted by :meth:`geometry`, e.g. ``S`` reflects control point of ``Q`` converted to cubic curve, therefore it may be larger than path, but never smaller. Coords of a run of implicitly repeated ``M``, ``L``, ``H`` or ``V`` are summed by :func:`itertools.accumulate`, since outlines of renders and traces mostly consist of such runs.
+
+        Args:
+            raw (str): Raw value of attr.
+        Returns:
+            tuple[float, float, float, float]: Min x, min y, max x and max y in user space; ``None`` if ``d`` is empty or malformed, in which case it's left to :meth:`from_raw_data`.
+        """
+
+        parts = SVGD.scan_command.split(raw)
+        if parts[0].strip():
+            return None
+        xs = []
+        ys = []
+        cpx = cpy = mvx = mvy = 0.0
+        ctrlx = ctrly = 0.0
+        for i in range(1, len(parts), 2):
+            comm = parts[i]
+            name = comm.upper()
+            try:
+                coords = list(map(float, SVGD.scan_number.findall(parts[i + 1])))
+            except ValueError:
+                return None
+            arity = SVGD.scan_arity[name]
+            if name == "Z":
+                # ``Z`` doesn't change current point, see :class:`S2SDLex`.
+                if coords:
+                    return None
+                continue
+            if not coords or len(coords) % arity:
+                return None
+            relative = comm != name
+            if name in ("M", "L"):
+                if relative:
+                    # Relative ``m`` starts from the last moveto, see :meth:`geometry`, whereas implicit ``l`` after it starts from the previous point.
+                    start_x, start_y = (mvx, mvy) if name == "M" else (cpx, cpy)
+                    run_x = list(accumulate(chain((start_x,), coords[0::2])))[1:]
+                    run_y = list(accumulate(chain((start_y,), coords[1::2])))[1:]
+                else:
+                    run_x = coords[0::2]
+                    run_y = coords[1::2]
+                if name == "M":
+                    mvx, mvy = run_x[0], run_y[0]
+                xs.extend(run_x)
+                ys.extend(run_y)
+                cpx = ctrlx = run_x[-1]
+                cpy = ctrly = run_y[-1]
+            elif name == "H":
+                run_x = list(accumulate(chain((cpx,), coords)))[1:] if relative else coords
+                xs.extend(run_x)
+                ys.append(cpy)
+                cpx = ctrlx = run_x[-1]
+                ctrly = cpy
+            elif name == "V":
+                run_y = list(accumulate(chain((cpy,), coords)))[1:] if relative else coords
+                xs.append(cpx)
+                ys.extend(run_y)
+                cpy = ctrly = run_y[-1]
+                ctrlx = cpx
+            else:
+                for j in range(0, len(coords), arity):
+                    seg = coords[j : j + arity]
+                    if relative:
+                        seg = [coord + (cpy if k % 2 else cpx) for k, coord in enumerate(seg)]
+                    if name == "S":
+                        seg = [2 * cpx - ctrlx, 2 * cpy - ctrly] + seg
+                    elif name == "T":
+                        # Control point of ``T`` is current point, see :meth:`control_point`.
+                        seg = [cpx, cpy] + seg
+                    xs.extend(seg[0::2])
+                    ys.extend(seg[1::2])
+                    ctrlx, ctrly, cpx, cpy = seg[-4:]
+                    # Control point reflected by the next ``S`` is that of cubic curve, which ``Q`` is converted to.
+                    if name in ("Q", "T"):
+                        ctrlx = cpx + (2 / 3) * (ctrlx - cpx)
+                        ctrly = cpy + (2 / 3) * (ctrly - cpy)
+        if not xs:
+            return None
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def bounding_box(self):
+        """Same as :meth:`scan_bounding_box`, but for parsed ``d``, e.g. one built by basic shape."""
+
+        xs = []
+        ys = []
+        for _, coords in self.memoized_geometry((1, 0, 0, 1)):
+            xs.extend(coords[::2])
+            ys.extend(coords[1::2])
+        if not xs:
+            return None
+        x, y = self.origin
+        return min(xs) + x, min(ys) + y, max(xs) + x, max(ys) + y
+
+    @staticmethod
+    def canonicalize(segs):
+        """Removes redundancy from SSA commands with coords already rounded to the grid, w/o changing the outline.
+
+        Cubic curve whose control points lie on the chord between its end points, in order, traces that chord monotonically, so it's demoted to ``l``. Consecutive ``l`` going in the same direction along one line are merged, and ``l`` to the current point is dropped. Since coords are integers, tests are exact, and the traced outline, along with its direction and thus winding, stays the same, as does anything rasterized from it; implicit closing of subpaths isn't touched.
+
+        Args:
+            segs (list[tuple[str, list[int]]]): Pairs of SSA command and its rounded, absolute coords.
+        Returns:
+            list[tuple[str, list[int]]]: Canonical commands.
+        """
+
+        canonical = []
+        # Current point, and start of the last emitted command if it's ``l``, i.e. the one that might be extended.
+        cpx = cpy = None
+        line_start = None
+        for comm, coords in segs:
+            if comm == "b" and cpx is not None:
+                x1, y1, x2, y2, x3, y3 = coords
+                dx = x3 - cpx
+                dy = y3 - cpy
+                length = dx * dx + dy * dy
+                if (
+                    (x1 - cpx) * dy == (y1 - cpy) * dx
+                    and (x2 - cpx) * dy == (y2 - cpy) * dx
+                    and 0 <= (x1 - cpx) * dx + (y1 - cpy) * dy <= (x2 - cpx) * dx + (y2 - cpy) * dy <= length
+                    and (length or (x1, y1, x2, y2) == (x3, y3, x3, y3))
+                ):
+                    comm = "l"
+                    coords = [x3, y3]
+            if comm != "l" or cpx is None:
+                canonical.append((comm, coords))
+                cpx, cpy = coords[-2:]
+                line_start = None
+                continue
+            x, y = coords
+            if x == cpx and y == cpy:
+                continue
+            if line_start is not None:
+                sx, sy = line_start
+                if (cpx - sx) * (y - cpy) == (cpy - sy) * (x - cpx) and (cpx - sx) * (x - cpx) + (cpy - sy) * (
+                    y - cpy
+                ) > 0:
+                    canonical[-1] = (comm, coords)
+                    cpx, cpy = x, y
+                    continue
+            canonical.append((comm, coords))
+            line_start = (cpx, cpy)
+            cpx, cpy = x, y
+        return canonical
+
+    @staticmethod
+    def format_segments(segs, ssa_repr_config):
+        """Returns SSA drawing made of rounded commands, canonicalized by :meth:`canonicalize` if ``ssa_repr_config["canonicalization"]`` is set."""
+
+        if ssa_repr_config["canonicalization"]:
+            segs = SVGD.canonicalize(segs)
+        return " ".join(f"{comm} {' '.join(map(str, coords))}" for comm, coords in segs)
+
+    def ssa_repr(self, ssa_repr_config):
+        ctma, ctmb, ctmc, ctmd, ctme, ctmf = self.ctm.data
+        geometry = self.memoized_geometry((ctma, ctmb, ctmc, ctmd))
+        offset_x, offset_y = self.offset((ctma, ctmb, ctmc, ctmd))
+        ctme += offset_x
+        ctmf += offset_y
+
+        # Apply translation of CTM and round to the grid of SSA drawing.
+        segs = []
+        for comm, coords in geometry:
+            processed = []
+            for i in range(0, len(coords), 2):
+                processed.append(round(coords[i] + ctme))
+                processed.append(round(coords[i + 1] + ctmf))
+            segs.append((comm, processed))
+        return SVGD.format_segments(segs, ssa_repr_config)
+
+    def ssa_repr_adaptive(self, ssa_repr_config):
+        """Returns SSA representation at the smallest magnification level whose rounding error doesn't exceed ``ssa_repr_config["magnification_tolerance"]``.
+
+        Unlike with :meth:`ssa_repr`, :attr:`ctm` must not include magnification.
+
+        Args:
+            ssa_repr_config (dict): See :attr:`svg2ssa.document.SVG.default_ssa_repr_config`.
+        Returns:
+            tuple[int, str]: Magnification level and SSA representation.
+        """
+
+        ctma, ctmb, ctmc, ctmd, ctme, ctmf = self.ctm.data
+        geometry = self.memoized_geometry((ctma, ctmb, ctmc, ctmd))
+        offset_x, offset_y = self.offset((ctma, ctmb, ctmc, ctmd))
+        ctme += offset_x
+        ctmf += offset_y
+        segs = []
+        for comm, coords in geometry:
+            segs.append((comm, [coord + (ctme if i % 2 == 0 else ctmf) for i, coord in enumerate(coords)]))
+
+        # Error of rounding to the grid of level ``N`` is at most ``0.5 / 2 ** (N - 1)`` px, so the search always ends.
+        tolerance = ssa_repr_config["magnification_tolerance"]
+        for level in range(1, SVGD.max_magnification_level + 1):
+            scale = 2 ** (level - 1)
+            if all(
+                abs(round(coord * scale) - coord * scale) <= tolerance * scale for _, coords in segs for coord in coords
+            ):
+                break
+
+        segs = [(comm, [round(coord * scale) for coord in coords]) for comm, coords in segs]
+        return level, SVGD.format_segments(segs, ssa_repr_config)
+
+
+SVGD.parser = PLYParser(S2SDLex, S2SDYacc, "parsetab_d")
@@ -13,6 +13,8 @@ class SVGId(SVGBasicEntity):
     Inherited:    no
     """
 
+    __slots__ = ()
+
     svg_name = "id"
 
     @classmethod
@@ -27,6 +29,31 @@ class SVGId(SVGBasicEntity):
         return other.__class__(other.data)
 
 
+class SVGVisibility(SVGBasicEntity):
+    """Class for SVG ``visibility`` attribute.
+
+    Value:        visible | hidden | collapse | inherit
+    Initial:      visible
+    Inherited:    yes
+
+    Unlike ``display:none``, it may be overridden by descendants, therefore invisible element is still read, and only its own event is suppressed, see :meth:`svg2ssa.document.SVG.ssa_repr_events`. Data is whether element is visible; unknown values are treated as ``visible``.
+    """
+
+    __slots__ = ()
+
+    svg_name = "visibility"
+
+    @classmethod
+    def from_raw_data(cls, data):
+        return cls(data.strip() not in ("hidden", "collapse"))
+
+    def ssa_repr(self, ssa_repr_config):
+        return ""
+
+    def __add__(self, other):
+        return self.__class__(self.data)
+
+
 class SVGStrokeWidth(SVGBasicEntity):
     """Class for SVG ``stroke-width`` attribute.
 
@@ -35,6 +62,8 @@ class SVGStrokeWidth(SVGBasicEntity):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     svg_name = "stroke-width"
 
     @classmethod
@@ -47,7 +76,7 @@ class SVGStrokeWidth(SVGBasicEntity):
         if stroke == 0:
             return f"\\bord{self.data}"
         elif stroke == 1:
-            return f"\bord{self.data / 2}"
+            return f"\\bord{self.data / 2}"
         else:
             raise ValueError(f"Unknown value for ssa_repr_config['stroke_preservation']: {stroke!s}.")
 
@@ -19,6 +19,8 @@ class SVGOpacity(SVGBasicEntity):
     Inherited:    no
     """
 
+    __slots__ = ()
+
     svg_name = "opacity"
 
     # Todo: Add clamping of out-of-range values.
@@ -42,6 +44,8 @@ class SVGFillOpacity(SVGOpacity):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     svg_name = "fill-opacity"
 
     def ssa_repr(self, ssa_repr_config):
@@ -56,6 +60,8 @@ class SVGStrokeOpacity(SVGOpacity):
     Inherited:    yes
     """
 
+    __slots__ = ()
+
     svg_name = "stroke-opacity"
 
     def ssa_repr(self, ssa_repr_config):
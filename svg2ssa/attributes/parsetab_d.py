@@ -0,0 +1,82 @@
+
+# parsetab_d.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NMBsvg_path : m_drawto_grpsm_drawto_grps : m_drawto_grps m_drawto_grp\n                      | m_drawto_grp\n        m_drawto_grp  : m_comm drawto_comms\n                      | m_comm\n        drawto_comms  : drawto_comms drawto_comm\n                      | drawto_comm\n        drawto_comm : l_comm\n        | h_comm\n        | v_comm\n        | c_comm\n        | s_comm\n        | q_comm\n        | t_comm\n        | a_comm\n        h_comm : "H" h_comm_arg_seq\n               | "h" h_comm_arg_seq\n        v_comm : "V" v_comm_arg_seq\n               | "v" v_comm_arg_seq\n        l_comm : "L" l_comm_arg_seq\n               | "l" l_comm_arg_seq\n        c_comm : "C" c_comm_arg_seq\n               | "c" c_comm_arg_seq\n        s_comm : "S" s_comm_arg_seq\n               | "s" s_comm_arg_seq\n        q_comm : "Q" q_comm_arg_seq\n               | "q" q_comm_arg_seq\n        t_comm : "T" t_comm_arg_seq\n               | "t" t_comm_arg_seq\n        a_comm : "A" a_comm_arg_seq\n               | "a" a_comm_arg_seq\n        m_comm : "M" m_comm_arg_seq\n        | "m" m_comm_arg_seq\n        m_comm_arg_seq : m_comm_arg_seq NMB NMB\n                       | NMB NMB\n        l_comm_arg_seq : l_comm_arg_seq NMB NMB\n                       | NMB NMB\n        t_comm_arg_seq : t_comm_arg_seq NMB NMB\n                       | NMB NMB\n        s_comm_arg_seq : s_comm_arg_seq NMB NMB NMB NMB\n                       | NMB NMB NMB NMB\n        q_comm_arg_seq : q_comm_arg_seq NMB NMB NMB NMB\n                       | NMB NMB NMB NMB\n        c_comm_arg_seq : c_comm_arg_seq NMB NMB NMB NMB NMB NMB\n        | NMB NMB NMB NMB NMB NMB\n        h_comm_arg_seq : h_comm_arg_seq NMB\n                       | NMB\n        v_comm_arg_seq : v_comm_arg_seq NMB\n                       | NMB\n        a_comm_arg_seq : a_comm_arg_seq a_comm_arg\n        | a_comm_arg\n        a_comm_arg : NMB NMB NMB NMB NMB NMB NMB'
+    
+_lr_action_items = {'M':([0,2,3,4,7,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[5,5,-3,-5,-2,-4,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'m':([0,2,3,4,7,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[6,6,-3,-5,-2,-4,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'$end':([1,2,3,4,7,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[0,-1,-3,-5,-2,-4,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'L':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[18,18,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'l':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[19,19,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'H':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[20,20,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'h':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[21,21,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'V':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[22,22,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'v':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[23,23,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'C':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[24,24,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'c':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[25,25,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'S':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[26,26,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'s':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[27,27,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'Q':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[28,28,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'q':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[29,29,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'T':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[30,30,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'t':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[31,31,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'A':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[32,32,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'a':([4,8,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,49,50,52,53,55,56,58,59,60,62,64,66,67,68,76,77,79,80,87,92,94,98,99,102,104,105,],[33,33,-7,-8,-9,-10,-11,-12,-13,-14,-15,-32,-33,-6,-20,-21,-16,-47,-17,-18,-49,-19,-22,-23,-24,-25,-26,-27,-28,-29,-30,-51,-31,-35,-37,-46,-48,-39,-50,-34,-36,-38,-41,-43,-40,-42,-45,-44,-52,]),'NMB':([5,6,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,],[35,35,39,39,42,42,45,45,48,48,51,51,54,54,57,57,61,61,63,64,63,65,66,65,67,-47,67,68,-49,68,69,70,69,71,72,71,73,74,73,75,76,75,61,-51,78,61,79,-35,80,-37,-46,-48,81,82,83,84,85,86,87,-39,-50,88,-34,-36,89,90,91,92,93,94,-38,95,96,97,98,-41,99,-43,100,101,102,-40,-42,103,104,-45,105,-44,-52,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'svg_path':([0,],[1,]),'m_drawto_grps':([0,],[2,]),'m_drawto_grp':([0,2,],[3,7,]),'m_comm':([0,2,],[4,4,]),'drawto_comms':([4,],[8,]),'drawto_comm':([4,8,],[9,37,]),'l_comm':([4,8,],[10,10,]),'h_comm':([4,8,],[11,11,]),'v_comm':([4,8,],[12,12,]),'c_comm':([4,8,],[13,13,]),'s_comm':([4,8,],[14,14,]),'q_comm':([4,8,],[15,15,]),'t_comm':([4,8,],[16,16,]),'a_comm':([4,8,],[17,17,]),'m_comm_arg_seq':([5,6,],[34,36,]),'l_comm_arg_seq':([18,19,],[38,40,]),'h_comm_arg_seq':([20,21,],[41,43,]),'v_comm_arg_seq':([22,23,],[44,46,]),'c_comm_arg_seq':([24,25,],[47,49,]),'s_comm_arg_seq':([26,27,],[50,52,]),'q_comm_arg_seq':([28,29,],[53,55,]),'t_comm_arg_seq':([30,31,],[56,58,]),'a_comm_arg_seq':([32,33,],[59,62,]),'a_comm_arg':([32,33,59,62,],[60,60,77,77,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> svg_path","S'",1,None,None,None),
+  ('svg_path -> m_drawto_grps','svg_path',1,'p_groups_1','d.py',46),
+  ('m_drawto_grps -> m_drawto_grps m_drawto_grp','m_drawto_grps',2,'p_groups_2','d.py',51),
+  ('m_drawto_grps -> m_drawto_grp','m_drawto_grps',1,'p_groups_2','d.py',52),
+  ('m_drawto_grp -> m_comm drawto_comms','m_drawto_grp',2,'p_groups_2','d.py',53),
+  ('m_drawto_grp -> m_comm','m_drawto_grp',1,'p_groups_2','d.py',54),
+  ('drawto_comms -> drawto_comms drawto_comm','drawto_comms',2,'p_groups_2','d.py',55),
+  ('drawto_comms -> drawto_comm','drawto_comms',1,'p_groups_2','d.py',56),
+  ('drawto_comm -> l_comm','drawto_comm',1,'p_groups_3','d.py',64),
+  ('drawto_comm -> h_comm','drawto_comm',1,'p_groups_3','d.py',65),
+  ('drawto_comm -> v_comm','drawto_comm',1,'p_groups_3','d.py',66),
+  ('drawto_comm -> c_comm','drawto_comm',1,'p_groups_3','d.py',67),
+  ('drawto_comm -> s_comm','drawto_comm',1,'p_groups_3','d.py',68),
+  ('drawto_comm -> q_comm','drawto_comm',1,'p_groups_3','d.py',69),
+  ('drawto_comm -> t_comm','drawto_comm',1,'p_groups_3','d.py',70),
+  ('drawto_comm -> a_comm','drawto_comm',1,'p_groups_3','d.py',71),
+  ('h_comm -> H h_comm_arg_seq','h_comm',2,'p_comms_1','d.py',77),
+  ('h_comm -> h h_comm_arg_seq','h_comm',2,'p_comms_1','d.py',78),
+  ('v_comm -> V v_comm_arg_seq','v_comm',2,'p_comms_1','d.py',79),
+  ('v_comm -> v v_comm_arg_seq','v_comm',2,'p_comms_1','d.py',80),
+  ('l_comm -> L l_comm_arg_seq','l_comm',2,'p_comms_1','d.py',81),
+  ('l_comm -> l l_comm_arg_seq','l_comm',2,'p_comms_1','d.py',82),
+  ('c_comm -> C c_comm_arg_seq','c_comm',2,'p_comms_1','d.py',83),
+  ('c_comm -> c c_comm_arg_seq','c_comm',2,'p_comms_1','d.py',84),
+  ('s_comm -> S s_comm_arg_seq','s_comm',2,'p_comms_1','d.py',85),
+  ('s_comm -> s s_comm_arg_seq','s_comm',2,'p_comms_1','d.py',86),
+  ('q_comm -> Q q_comm_arg_seq','q_comm',2,'p_comms_1','d.py',87),
+  ('q_comm -> q q_comm_arg_seq','q_comm',2,'p_comms_1','d.py',88),
+  ('t_comm -> T t_comm_arg_seq','t_comm',2,'p_comms_1','d.py',89),
+  ('t_comm -> t t_comm_arg_seq','t_comm',2,'p_comms_1','d.py',90),
+  ('a_comm -> A a_comm_arg_seq','a_comm',2,'p_comms_1','d.py',91),
+  ('a_comm -> a a_comm_arg_seq','a_comm',2,'p_comms_1','d.py',92),
+  ('m_comm -> M m_comm_arg_seq','m_comm',2,'p_comms_2','d.py',102),
+  ('m_comm -> m m_comm_arg_seq','m_comm',2,'p_comms_2','d.py',103),
+  ('m_comm_arg_seq -> m_comm_arg_seq NMB NMB','m_comm_arg_seq',3,'p_arg_seq_1','d.py',114),
+  ('m_comm_arg_seq -> NMB NMB','m_comm_arg_seq',2,'p_arg_seq_1','d.py',115),
+  ('l_comm_arg_seq -> l_comm_arg_seq NMB NMB','l_comm_arg_seq',3,'p_arg_seq_1','d.py',116),
+  ('l_comm_arg_seq -> NMB NMB','l_comm_arg_seq',2,'p_arg_seq_1','d.py',117),
+  ('t_comm_arg_seq -> t_comm_arg_seq NMB NMB','t_comm_arg_seq',3,'p_arg_seq_1','d.py',118),
+  ('t_comm_arg_seq -> NMB NMB','t_comm_arg_seq',2,'p_arg_seq_1','d.py',119),
+  ('s_comm_arg_seq -> s_comm_arg_seq NMB NMB NMB NMB','s_comm_arg_seq',5,'p_arg_seq_2','d.py',129),
+  ('s_comm_arg_seq -> NMB NMB NMB NMB','s_comm_arg_seq',4,'p_arg_seq_2','d.py',130),
+  ('q_comm_arg_seq -> q_comm_arg_seq NMB NMB NMB NMB','q_comm_arg_seq',5,'p_arg_seq_2','d.py',131),
+  ('q_comm_arg_seq -> NMB NMB NMB NMB','q_comm_arg_seq',4,'p_arg_seq_2','d.py',132),
+  ('c_comm_arg_seq -> c_comm_arg_seq NMB NMB NMB NMB NMB NMB','c_comm_arg_seq',7,'p_arg_seq_3','d.py',142),
+  ('c_comm_arg_seq -> NMB NMB NMB NMB NMB NMB','c_comm_arg_seq',6,'p_arg_seq_3','d.py',143),
+  ('h_comm_arg_seq -> h_comm_arg_seq NMB','h_comm_arg_seq',2,'p_arg_seq_4','d.py',153),
+  ('h_comm_arg_seq -> NMB','h_comm_arg_seq',1,'p_arg_seq_4','d.py',154),
+  ('v_comm_arg_seq -> v_comm_arg_seq NMB','v_comm_arg_seq',2,'p_arg_seq_4','d.py',155),
+  ('v_comm_arg_seq -> NMB','v_comm_arg_seq',1,'p_arg_seq_4','d.py',156),
+  ('a_comm_arg_seq -> a_comm_arg_seq a_comm_arg','a_comm_arg_seq',2,'p_arg_seq_5','d.py',166),
+  ('a_comm_arg_seq -> a_comm_arg','a_comm_arg_seq',1,'p_arg_seq_5','d.py',167),
+  ('a_comm_arg -> NMB NMB NMB NMB NMB NMB NMB','a_comm_arg',7,'p_arg_1','d.py',177),
+]
@@ -0,0 +1,47 @@
+
+# parsetab_transform.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'MATRIX NMB ROTATE SCALE SKEWX SKEWY TRANSLATEtrafos_list : trafos_list trafo\n        | trafo\n        trafo : matrix\n        | translate\n        | scale\n        | rotate\n        | skewX\n        | skewY\n        matrix : MATRIX "(" NMB NMB NMB NMB NMB NMB ")" translate : TRANSLATE "(" NMB NMB ")"\n        | TRANSLATE "(" NMB ")"\n        rotate : ROTATE "(" NMB NMB NMB ")"\n        | ROTATE "(" NMB ")"\n        scale : SCALE "(" NMB NMB ")"\n        | SCALE "(" NMB ")"\n        skewX : SKEWX "(" NMB ")" skewY : SKEWY "(" NMB ")" '
+    
+_lr_action_items = {'MATRIX':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[9,9,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'TRANSLATE':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[10,10,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'SCALE':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[11,11,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'ROTATE':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[12,12,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'SKEWX':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[13,13,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'SKEWY':([0,1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[14,14,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'$end':([1,2,3,4,5,6,7,8,15,30,32,34,35,36,38,39,42,45,],[0,-2,-3,-4,-5,-6,-7,-8,-1,-11,-15,-13,-16,-17,-10,-14,-12,-9,]),'(':([9,10,11,12,13,14,],[16,17,18,19,20,21,]),'NMB':([16,17,18,19,20,21,22,23,24,25,28,33,37,41,43,],[22,23,24,25,26,27,28,29,31,33,37,40,41,43,44,]),')':([23,24,25,26,27,29,31,40,44,],[30,32,34,35,36,38,39,42,45,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'trafos_list':([0,],[1,]),'trafo':([0,1,],[2,15,]),'matrix':([0,1,],[3,3,]),'translate':([0,1,],[4,4,]),'scale':([0,1,],[5,5,]),'rotate':([0,1,],[6,6,]),'skewX':([0,1,],[7,7,]),'skewY':([0,1,],[8,8,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> trafos_list","S'",1,None,None,None),
+  ('trafos_list -> trafos_list trafo','trafos_list',2,'p_trafos_list','transform.py',194),
+  ('trafos_list -> trafo','trafos_list',1,'p_trafos_list','transform.py',195),
+  ('trafo -> matrix','trafo',1,'p_trafo','transform.py',203),
+  ('trafo -> translate','trafo',1,'p_trafo','transform.py',204),
+  ('trafo -> scale','trafo',1,'p_trafo','transform.py',205),
+  ('trafo -> rotate','trafo',1,'p_trafo','transform.py',206),
+  ('trafo -> skewX','trafo',1,'p_trafo','transform.py',207),
+  ('trafo -> skewY','trafo',1,'p_trafo','transform.py',208),
+  ('matrix -> MATRIX ( NMB NMB NMB NMB NMB NMB )','matrix',9,'p_matrix','transform.py',214),
+  ('translate -> TRANSLATE ( NMB NMB )','translate',5,'p_translate','transform.py',219),
+  ('translate -> TRANSLATE ( NMB )','translate',4,'p_translate','transform.py',220),
+  ('rotate -> ROTATE ( NMB NMB NMB )','rotate',6,'p_rotate','transform.py',226),
+  ('rotate -> ROTATE ( NMB )','rotate',4,'p_rotate','transform.py',227),
+  ('scale -> SCALE ( NMB NMB )','scale',5,'p_scale','transform.py',233),
+  ('scale -> SCALE ( NMB )','scale',4,'p_scale','transform.py',234),
+  ('skewX -> SKEWX ( NMB )','skewX',4,'p_skewX','transform.py',240),
+  ('skewY -> SKEWY ( NMB )','skewY',4,'p_skewY','transform.py',245),
+]
@@ -4,15 +4,19 @@
 # Trafos use tuple as their container for data for immutability.
 
 
+import re
 from math import radians, sin, cos, tan
-from ply.lex import lex
-from ply.yacc import yacc
+
 from ..core import SVGBasicEntity, SVGContainerEntity
+from ..utilities import PLYParser
+from ..errors import SVGAttributeError
 
 
 class SVGTrafoMixin(SVGBasicEntity):
     """Generalized superclass for SVG ``transform`` attribute and its "values"."""
 
+    __slots__ = ()
+
     def matrix(self):
         """Returns an instance of :class:`SVGTrafoMatrix` for transformations to be mergeable."""
 
@@ -32,6 +36,8 @@ class SVGTrafoMixin(SVGBasicEntity):
 class SVGTrafoMatrix(SVGTrafoMixin):
     """Class for SVG ``matrix`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     svg_name = "matrix"
 
     def matrix(self):
@@ -60,6 +66,8 @@ class SVGTrafoMatrix(SVGTrafoMixin):
 class SVGTrafoTranslate(SVGTrafoMixin):
     """Class for SVG ``translate`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data if len(data) == 2 else (data[0], 0))
 
@@ -78,6 +86,8 @@ class SVGTrafoTranslate(SVGTrafoMixin):
 class SVGTrafoRotate(SVGTrafoMixin):
     """Class for SVG ``rotate`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     svg_name = "rotate"
 
     def __init__(self, data):
@@ -100,13 +110,15 @@ class SVGTrafoRotate(SVGTrafoMixin):
         if ra == 0:
             return f"\\org({cx},{cy})"
         else:
-            return f"\\org({cx},{cy})\frz{-ra}"
+            return f"\\org({cx},{cy})\\frz{-ra}"
 
 
 # pylint: disable=invalid-name
 class SVGTrafoScale(SVGTrafoMixin):
     """Class for SVG ``scale`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     svg_name = "scale"
 
     def __init__(self, data):
@@ -117,14 +129,17 @@ class SVGTrafoScale(SVGTrafoMixin):
         return SVGTrafoMatrix((sx, 0, 0, sy, 0, 0))
 
     def ssa_repr(self, ssa_repr_config):
-        sx, sy = (round(obj) for obj in self.data)
-        return f"\\fscx{sx}\fscy{sy}"
+        # SSA scale is in percent.
+        sx, sy = (round(obj * 100) for obj in self.data)
+        return f"\\fscx{sx}\\fscy{sy}"
 
 
 # pylint: disable=invalid-name
 class SVGTrafoSkewX(SVGTrafoMixin):
     """Class for SVG ``skewX`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     svg_name = "skewX"
 
     def matrix(self):
@@ -136,6 +151,8 @@ class SVGTrafoSkewX(SVGTrafoMixin):
 class SVGTrafoSkewY(SVGTrafoMixin):
     """Class for SVG ``skewY`` from ``transform`` attr."""
 
+    __slots__ = ()
+
     svg_name = "skewY"
 
     def matrix(self):
@@ -178,12 +195,12 @@ class S2STransformLex:
         t.value = float(t.value)
         return t
 
-    # pylint: disable=unsubscriptable-object
+    # pylint: disable=unsubscriptable-object,no-member
     def t_error(t):
-        # Fixme: When ``t.value[0]`` will be the last character in the sequence, ``t.value[1:11]`` may cause errors.
-        raise Exception(
-            f"The next illegal character were found in 'transformation' attribute: '{t.value[0]}'.\n"
-            f"These characters were right after it: {t.value[1:11]}"
+        raise SVGAttributeError(
+            f"Illegal character '{t.value[0]}' in 'transform' attribute, right before: '{t.value[1:11]}'.",
+            "transform",
+            t.lexpos,
         )
 
 
@@ -249,11 +266,9 @@ class S2STransformYacc:
 
     # pylint: disable=missing-function-docstring
     def p_error(self, p):
-        raise Exception(
-            "Some error happened while 'yacc' were parsing 'transformation' attribute. "
-            "Looks like he encountered incorrect sequence of tokens.\n"
-            f"First ten characters from that sequence: {p[0:11]}.\n"
-        )
+        if p is None:
+            raise SVGAttributeError("Unexpected end of 'transform' attribute.", "transform")
+        raise SVGAttributeError(f"Unexpected token '{p.value}' in 'transform' attribute.", "transform", p.lexpos)
 
     tokens = S2STransformLex.tokens
 
@@ -265,6 +280,8 @@ class SVGTransform(SVGContainerEntity):
     Inherited: [...]
     """
 
+    __slots__ = ()
+
     trafos_all = {"matrix", "skewX", "skewY", "scale", "translate", "rotate"}
     """set[str]: IDs of all possible trafos."""
     trafos_unsupported = {"matrix", "skewX", "skewY"}
@@ -272,6 +289,9 @@ class SVGTransform(SVGContainerEntity):
 
     svg_name = "transform"
 
+    parser = None
+    """svg2ssa.utilities.PLYParser: Parser shared by all instances; set right after class definition."""
+
     def matrix(self):
         """Returns sum of all trafos as a matrix :class:`SVGTrafoMatrix`."""
 
@@ -283,10 +303,7 @@ class SVGTransform(SVGContainerEntity):
 
     @classmethod
     def from_raw_data(cls, data):
-        lexer = lex(module=S2STransformLex)
-        lexer.input(data)
-        parser = yacc(module=S2STransformYacc(), write_tables=0, debug=False)
-        return cls(parser.parse(debug=False, lexer=lexer))
+        return cls(cls.parser.parse(data))
 
     def collapse_consecutive_objects(self):
         """Collapses sequences of consecutive objects with same value of attr ``svg_name`` into one object."""
@@ -346,11 +363,40 @@ class SVGTransform(SVGContainerEntity):
         if idx_unnec != -1 or idx_repet != -1:
             # ``+1`` for making interval inclusive: [n,m] instead of [n,m).
             idx = (idx_unnec if idx_unnec > idx_repet else idx_repet) + 1
-            acc = list_of_trafos[0]
+            # Lone trafo must become matrix as well, otherwise it isn't baked, and e.g. lone ``skewX`` has no SSA representation.
+            acc = list_of_trafos[0].matrix()
             for i in range(1, idx):
                 acc += list_of_trafos[i]
             list_of_trafos[:idx] = [acc]
 
+    ssa_tag = re.compile(r"\\(pos|org)\((-?[0-9.]+),(-?[0-9.]+)\)|\\(frz|fscx|fscy)(-?[0-9.]+)")
+    """re.Pattern: Override tag of SSA trafo, as recognized by renderer."""
+
+    @staticmethod
+    def rendered_matrix(ssa):
+        """Returns matrix which renderer applies to coords of drawing (in px, i.e. already divided by magnification) positioned by override tags ``ssa``.
+
+        Drawing is scaled by ``\\fscx`` and ``\\fscy``, moved to ``\\pos``, then rotated by ``\\frz`` around ``\\org``, which defaults to ``\\pos``. Only what renderer would recognize counts, e.g. tag w/o leading backslash is ignored. Like in VSFilter, the first ``\\pos`` and ``\\org`` win, whereas the last of other tags wins.
+
+        Args:
+            ssa (str): Override tags of event.
+        Returns:
+            SVGTrafoMatrix: Matrix from coords of drawing to coords of PlayRes.
+        """
+
+        tags = {}
+        for match in SVGTransform.ssa_tag.finditer(ssa):
+            point, x, y, name, val = match.groups()
+            if point:
+                tags.setdefault(point, (float(x), float(y)))
+            else:
+                tags[name] = float(val)
+        pos = tags.get("pos", (0.0, 0.0))
+        org = tags.get("org", pos)
+        rotate = SVGTrafoRotate((-tags.get("frz", 0.0),) + org)
+        scale = SVGTrafoScale((tags.get("fscx", 100.0) / 100, tags.get("fscy", 100.0) / 100))
+        return rotate.matrix() + SVGTrafoTranslate(pos).matrix() + scale.matrix()
+
     def ssa_repr(self, ssa_repr_config):
         self.collapse_consecutive_objects()
         self.collapse_unnecessary_trafos(ssa_repr_config["unnecessary_transformations"])
@@ -366,3 +412,6 @@ class SVGTransform(SVGContainerEntity):
         else:
             raise TypeError(f"{self.__class__.__name__}: You have tried to concatenate different types of objects.")
         return SVGTransform(data)
+
+
+SVGTransform.parser = PLYParser(S2STransformLex, S2STransformYacc, "parsetab_transform")
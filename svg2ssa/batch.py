@@ -0,0 +1,346 @@
+"""Logic for conversion of many SVG documents at once."""
+
+
+import asyncio
+import re
+from bisect import bisect_left
+from collections import Counter
+from glob import glob
+from io import BytesIO
+from itertools import repeat
+
+from .config import default_ssa_repr_config
+from .document import SVG
+from .errors import SSACostError
+from .styles import extract_styles
+from .palette import quantize_palette
+from .utilities import convert_seconds_to_ssa_time, make_executor
+
+
+def convert(data, xml_parser="auto", ssa_repr_config=None):
+    """Converts contents of SVG document to contents of SSA document.
+
+    Self-contained, so that it could be run in a worker process or thread.
+
+    Args:
+        data (bytes): Contents of SVG document.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+        ssa_repr_config (dict): Overrides for :attr:`SVG.default_ssa_repr_config`.
+    Returns:
+        str: Contents of SSA document.
+    """
+
+    svg = SVG()
+    ssa_repr_config = {**svg.ssa_repr_config, **(ssa_repr_config or {})}
+    svg.from_svg_file(
+        BytesIO(data),
+        SVG.get_xml_parser(xml_parser),
+        ssa_repr_config["on_error"],
+        select_id=ssa_repr_config["select_id"],
+    )
+    return svg.ssa_repr(ssa_repr_config)
+
+
+def convert_variants(data, ssa_repr_configs, xml_parser="auto"):
+    """Converts contents of SVG document to several SSA documents, one per config, parsing SVG only once.
+
+    Self-contained, so that it could be run in a worker process or thread.
+
+    Args:
+        data (bytes): Contents of SVG document.
+        ssa_repr_configs (list[dict]): Overrides for :attr:`SVG.default_ssa_repr_config`, one per variant; ``on_error`` and ``select_id`` of the first one are used for parsing.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+    Returns:
+        list[str]: Contents of SSA documents, in order of ``ssa_repr_configs``.
+    """
+
+    svg = SVG()
+    ssa_repr_configs = [{**svg.ssa_repr_config, **ssa_repr_config} for ssa_repr_config in ssa_repr_configs]
+    if not ssa_repr_configs:
+        return []
+    svg.from_svg_file(
+        BytesIO(data),
+        SVG.get_xml_parser(xml_parser),
+        ssa_repr_configs[0]["on_error"],
+        select_id=ssa_repr_configs[0]["select_id"],
+    )
+    return [svg.ssa_repr(ssa_repr_config) for ssa_repr_config in ssa_repr_configs]
+
+
+def _read(filepath):
+    with open(filepath, "rb") as file:
+        return file.read()
+
+
+async def _convert_one(loop, executor, source, xml_parser, ssa_repr_config):
+    """Reads ``source`` w/o blocking event loop, then converts it in ``executor``."""
+
+    data = source if isinstance(source, bytes) else await loop.run_in_executor(None, _read, source)
+    ssa = await loop.run_in_executor(executor, convert, data, xml_parser, ssa_repr_config)
+    return source, ssa
+
+
+async def convert_many(
+    sources,
+    concurrency=4,
+    executor=None,
+    xml_parser="auto",
+    ssa_repr_config=None,
+):
+    """Converts many SVG documents concurrently, yielding results as they complete.
+
+    Files are read in the default executor of the event loop, whereas parsing and conversion, being CPU-bound, are done in ``executor``. At most ``concurrency`` documents are in flight at any moment, and ``sources`` are consumed lazily, so memory stays bounded even for endless iterables. Closing or cancelling the generator cancels all documents in flight.
+
+    Example::
+
+        async for source, ssa in convert_many(paths, concurrency=8):
+            ...
+
+    Args:
+        sources (Iterable[str | os.PathLike | bytes]): Paths to SVG files, or contents of SVG documents.
+        concurrency (int): Max number of documents in flight.
+        executor (concurrent.futures.Executor): Executor for conversion. If ``None``, executor with ``concurrency`` workers is created by :func:`svg2ssa.utilities.make_executor` and shut down on exit.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+        ssa_repr_config (dict): Overrides for :attr:`SVG.default_ssa_repr_config`.
+    Yields:
+        tuple[str | os.PathLike | bytes, str]: Source and contents of SSA document.
+    """
+
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be positive, got {concurrency!s}.")
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = make_executor(concurrency)
+    ssa_repr_config = {**default_ssa_repr_config, **(ssa_repr_config or {})}
+    sources = iter(sources)
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    source = next(sources)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    pending.add(
+                        asyncio.ensure_future(_convert_one(loop, executor, source, xml_parser, ssa_repr_config))
+                    )
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+def convert_frame(filepath, xml_parser="auto", ssa_repr_config=None):
+    """Converts SVG file to size of SSA document and fields of its events.
+
+    Self-contained, so that it could be run in a worker process or thread.
+
+    Args:
+        filepath (str): Path to SVG file to be read.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+        ssa_repr_config (dict): Overrides for :attr:`SVG.default_ssa_repr_config`.
+    Returns:
+        tuple[tuple[int, int], list[dict[str, str]], dict]: See :meth:`SVG.playres` and :meth:`SVG.ssa_repr_events`, and report of frame: its ``costs`` and ``errors``, see :attr:`SVG.costs` and :attr:`SVG.errors`.
+    """
+
+    svg = SVG()
+    ssa_repr_config = {**svg.ssa_repr_config, **(ssa_repr_config or {})}
+    svg.from_svg_file(
+        filepath, SVG.get_xml_parser(xml_parser), ssa_repr_config["on_error"], select_id=ssa_repr_config["select_id"]
+    )
+    try:
+        events = svg.ssa_repr_events(ssa_repr_config)
+    except SSACostError as err:
+        raise SSACostError(err.report, filepath) from None
+    return svg.playres(ssa_repr_config), events, dict(costs=svg.costs, errors=svg.errors)
+
+
+def natural_sort_key(filepath):
+    """Returns key for sorting of paths such that ``frame_10.svg`` goes after ``frame_9.svg``."""
+
+    return [int(obj) if obj.isdigit() else obj for obj in re.split(r"([0-9]+)", filepath)]
+
+
+def event_identity(fields):
+    """Returns key by which event is matched with events of the previous frame: ``id`` of its element, or all of its fields if element has none."""
+
+    return ("id", fields["actor"]) if fields["actor"] else ("fields", tuple(sorted(fields.items())))
+
+
+def longest_increasing(keys):
+    """Returns indices of the longest strictly increasing subsequence of ``keys``, skipping ``None``.
+
+    Args:
+        keys (list): Comparable keys, or ``None``.
+    Returns:
+        set[int]: Indices of keys in subsequence.
+    """
+
+    # The least last key of increasing subsequence of each length found so far.
+    tails = []
+    tail_indices = []
+    previous = {}
+    for i, key in enumerate(keys):
+        if key is None:
+            continue
+        length = bisect_left(tails, key)
+        if length == len(tails):
+            tails.append(key)
+            tail_indices.append(i)
+        else:
+            tails[length] = key
+            tail_indices[length] = i
+        previous[i] = tail_indices[length - 1] if length else None
+    result = set()
+    i = tail_indices[-1] if tail_indices else None
+    while i is not None:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+def merge_frame(events, open_events, frame_events, frame):
+    """Merges events of frame into events of the previous frames, see :func:`convert_sequence`.
+
+    Each event is matched with the next event of the same identity (see :func:`event_identity`) in the previous frame, and continues it if the two are identical. Stacking order is kept by layers: events render in order of ``(layer, order in SSA document)``, which must grow in order of frame, therefore only the longest run of matched events whose order holds is continued (see :func:`longest_increasing`), so that an inserted, removed or moved element only breaks its own event. New events are put right above the previous event of frame, at the next layer if that's still below the next continued event, otherwise at the same layer, which works since they are appended to SSA document.
+
+    Args:
+        events (list[list]): Events of the previous frames as ``[fields, first_frame, last_frame, layer]``, in order of SSA document; new events are appended.
+        open_events (dict[tuple, list[int]]): Indices in ``events`` of events of the previous frame per identity, in stacking order.
+        frame_events (list[dict[str, str]]): Fields of events of frame, in stacking order.
+        frame (int): Index of frame.
+    Returns:
+        dict[tuple, list[int]]: ``open_events`` for the next frame.
+    """
+
+    identities = [event_identity(fields) for fields in frame_events]
+    seen = Counter()
+    candidates = []
+    for identity, fields in zip(identities, frame_events):
+        matches = open_events.get(identity, ())
+        nth = seen[identity]
+        seen[identity] += 1
+        index = matches[nth] if nth < len(matches) and events[matches[nth]][0] == fields else None
+        candidates.append(None if index is None else (events[index][3], index))
+    continued = longest_increasing(candidates)
+
+    # Layer of the next continued event, which new events must stay below.
+    bounds = []
+    bound = None
+    for i in reversed(range(len(frame_events))):
+        bounds.append(bound)
+        if i in continued:
+            bound = candidates[i][0]
+    bounds.reverse()
+
+    next_open_events = {}
+    previous = None
+    for i, (identity, fields) in enumerate(zip(identities, frame_events)):
+        # Event can't be continued if new events already took its place in stacking order.
+        if i in continued and (previous is None or candidates[i] > previous):
+            index = candidates[i][1]
+            events[index][2] = frame
+        else:
+            layer = -1 if previous is None else previous[0]
+            layer = layer + 1 if bounds[i] is None or layer + 1 < bounds[i] else max(layer, 0)
+            index = len(events)
+            events.append([fields, frame, frame, layer])
+        previous = (events[index][3], index)
+        next_open_events.setdefault(identity, []).append(index)
+    return next_open_events
+
+
+def convert_sequence(
+    pattern,
+    fps,
+    executor=None,
+    xml_parser="auto",
+    ssa_repr_config=None,
+    report=None,
+):
+    """Converts numbered SVG frames to one SSA document, where each frame lasts ``1 / fps`` seconds.
+
+    Frames are converted in ``executor``. Event that is emitted without any change in consecutive frames is merged into one event spanning all of them, see :func:`merge_frame`, which also keeps stacking order of each frame by layers of events.
+
+    Args:
+        pattern (str): Glob pattern matching frames, e.g. ``frame_*.svg``. Matches are sorted by the numbers in their paths.
+        fps (float): Frame rate.
+        executor (concurrent.futures.Executor): Executor for conversion. If ``None``, executor is created by :func:`svg2ssa.utilities.make_executor` and shut down on exit.
+        xml_parser (str): Name of an XML parser, see :meth:`SVG.get_xml_parser`.
+        ssa_repr_config (dict): Overrides for :attr:`SVG.default_ssa_repr_config`.
+        report (dict): If passed, it's filled with ``frames``, which maps path to each frame to its report (see :func:`convert_frame`), and with report of quantization of ``palette``, see :func:`svg2ssa.palette.quantize_palette`, or ``None`` if palette isn't quantized.
+    Returns:
+        str: Contents of SSA document.
+    """
+
+    if fps <= 0:
+        raise ValueError(f"Frame rate must be positive, got {fps!s}.")
+    filepaths = sorted(glob(pattern), key=natural_sort_key)
+    if not filepaths:
+        raise FileNotFoundError(f"No frames match pattern '{pattern}'.")
+    ssa_repr_config = {**default_ssa_repr_config, **(ssa_repr_config or {}), "fps": fps}
+    if report is None:
+        report = {}
+    report["frames"] = {}
+    report["palette"] = None
+
+    own_executor = executor is None
+    if own_executor:
+        executor = make_executor()
+    try:
+        playres = None
+        # Each event is ``[fields, first_frame, last_frame, layer]``.
+        events = []
+        open_events = {}
+        frames = executor.map(convert_frame, filepaths, repeat(xml_parser), repeat(ssa_repr_config))
+        max_colors = ssa_repr_config["palette_max_colors"]
+        tolerance = ssa_repr_config["palette_tolerance"]
+        if max_colors or tolerance:
+            # Palette is built from colors of all frames, so that it's shared by the whole document, and so that events are quantized before they are merged.
+            frames = list(frames)
+            quantized, report["palette"] = quantize_palette(
+                [fields for _, frame_events, _ in frames for fields in frame_events], max_colors, tolerance
+            )
+            quantized = iter(quantized)
+            frames = [
+                (frame_playres, [next(quantized) for _ in frame_events], frame_report)
+                for frame_playres, frame_events, frame_report in frames
+            ]
+        for frame, (frame_playres, frame_events, frame_report) in enumerate(frames):
+            if playres is None:
+                playres = frame_playres
+            report["frames"][filepaths[frame]] = frame_report
+            open_events = merge_frame(events, open_events, frame_events, frame)
+    finally:
+        if own_executor:
+            executor.shutdown()
+    # Styles are extracted from events of all frames, so that they are shared by the whole document.
+    styles = ""
+    if ssa_repr_config["max_styles"]:
+        styles, styled = extract_styles(
+            [event[0] for event in events], ssa_repr_config["max_styles"], ssa_repr_config["style_template"]
+        )
+        for event, fields in zip(events, styled):
+            event[0] = fields
+    width, height = playres
+    ssa = [ssa_repr_config["header_template"].format(width=width, height=height, fps=fps, styles=styles)]
+    event_template = ssa_repr_config["event_template"]
+    for fields, first_frame, last_frame, layer in events:
+        ssa.append(
+            event_template.format(
+                layer=layer,
+                start=convert_seconds_to_ssa_time(first_frame / fps),
+                end=convert_seconds_to_ssa_time((last_frame + 1) / fps),
+                **fields,
+            )
+        )
+    return "\n".join(ssa)
@@ -0,0 +1,250 @@
+"""Logic for parallel reading of a single large SVG document, which is split into chunks at boundaries of elements.
+
+SVG file is pre-scanned for byte offsets of elements w/o parsing their attrs. Children of root ``svg`` are grouped into chunks of roughly equal size, except that ``g`` larger than a chunk, like layer of Inkscape, is entered, and its children are grouped in turn. Each chunk is read by a worker as standalone document: its elements are wrapped in copies of start tags of their ancestors, so that namespaces are declared, whereas models of ancestors are inherited from the main process, see :meth:`svg2ssa.document.SVG.chunk_context`. Meanwhile the main process reads the skeleton of document, i.e. document w/o chunks, and merges models of chunks in document order, so that result is identical to that of serial reading.
+
+Models of chunks are pickled by worker processes and unpickled by the main one, which isn't much cheaper than building them, so reading in chunks pays off only with several CPUs, or in threads of free-threaded build of CPython (see :func:`svg2ssa.utilities.make_executor`).
+"""
+
+
+import re
+from io import BytesIO
+
+from .errors import SVGElementError
+from .utilities import LXMLParser, make_executor
+
+
+CHUNKS_PER_WORKER = 4
+"""int: Number of chunks per worker, so that workers which got simpler chunks aren't idle."""
+
+MIN_CHUNK_BYTES = 1 << 16
+"""int: Min size of chunk, below which overhead of worker outweighs its work."""
+
+token = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>|<!(?:[^>\"'\[]|\"[^\"]*\"|'[^']*'|\[.*?\])*>"
+    rb"|<(/?)([^\s/>]+)(?:[^>\"']|\"[^\"]*\"|'[^']*')*>",
+    re.S,
+)
+prolog = re.compile(rb"(?:\xef\xbb\xbf)?<\?xml.*?\?>", re.S)
+
+
+def scan_elements(data):
+    """Finds byte offsets of elements of XML document w/o parsing their attrs.
+
+    Args:
+        data (bytes): Contents of XML document in ASCII-compatible encoding.
+    Returns:
+        list: Root element as ``[name, start, end of start tag, end, children]``, where children are such lists too; ``None`` if document can't be scanned reliably, e.g. because it's malformed, declares entities in its DTD or has nested ``svg``.
+    """
+
+    root = None
+    stack = []
+    for match in token.finditer(data):
+        name = match.group(2)
+        if name is None:
+            # Entities declared by internal subset of DTD can't be resolved in chunks.
+            if match.group().startswith(b"<!DOCTYPE") and b"[" in match.group():
+                return None
+            continue
+        if match.group(1):
+            if not stack or stack[-1][0] != name:
+                return None
+            stack.pop()[3] = match.end()
+            continue
+        # Nested ``svg`` sets size of document, see :meth:`svg2ssa.document.SVG._svg_started`, which chunk couldn't pass on.
+        if name == b"svg" and root is not None:
+            return None
+        node = [name, match.start(), match.end(), match.end(), []]
+        if stack:
+            stack[-1][4].append(node)
+        elif root is None:
+            root = node
+        else:
+            return None
+        if not match.group().endswith(b"/>"):
+            stack.append(node)
+    return None if stack else root
+
+
+def split_document(data, chunks, min_bytes=MIN_CHUNK_BYTES):
+    """Splits SVG document into skeleton and chunks, see :mod:`svg2ssa.chunks`.
+
+    Skeleton consists of root ``svg`` and the entered ``g``, whereas text of chunks is replaced by its newlines, so that line numbers of elements don't change.
+
+    Args:
+        data (bytes): Contents of SVG document.
+        chunks (int): Desired number of chunks.
+        min_bytes (int): Min size of chunk, unless it's the last one at its level.
+    Returns:
+        tuple[bytes, list[tuple[int, bytes, int, int]]]: Skeleton, and chunks in document order, each as number of start and end tags of skeleton preceding it, standalone document, difference between line numbers in SVG file and in that document, and number of enclosing elements copied into that document; ``None`` if document can't be split in at least two chunks.
+    """
+
+    root = scan_elements(data)
+    if root is None or root[0] != b"svg":
+        return None
+    match = prolog.match(data)
+    declaration = match.group() if match else b""
+    target = max((root[3] - root[1]) / chunks, min_bytes)
+    skeleton = []
+    result = []
+    pos = 0
+    events = 0
+
+    def flush(group, ancestors):
+        nonlocal pos
+        if not group:
+            return
+        start, stop = group[0][1], group[-1][3]
+        header = declaration + b"".join(data[node[1] : node[2]] for node in ancestors)
+        footer = b"".join(b"</" + node[0] + b">" for node in reversed(ancestors))
+        line_offset = data.count(b"\n", 0, start) - header.count(b"\n")
+        result.append((events, header + data[start:stop] + footer, line_offset, len(ancestors)))
+        skeleton.append(data[pos:start])
+        skeleton.append(b"\n" * data.count(b"\n", start, stop))
+        pos = stop
+        group.clear()
+
+    def visit(node, ancestors):
+        nonlocal events
+        events += 1
+        ancestors = ancestors + (node,)
+        group = []
+        for child in node[4]:
+            # Layer may redeclare default namespace, in which case its children aren't SVG elements.
+            if (
+                child[0] == b"g"
+                and child[4]
+                and child[3] - child[1] > target
+                and b"xmlns" not in data[child[1] : child[2]]
+            ):
+                flush(group, ancestors)
+                visit(child, ancestors)
+            else:
+                group.append(child)
+                if group[-1][3] - group[0][1] >= target:
+                    flush(group, ancestors)
+        flush(group, ancestors)
+        events += 1
+
+    visit(root, ())
+    skeleton.append(data[pos:])
+    if len(result) < 2:
+        return None
+    return b"".join(skeleton), result
+
+
+def mark_chunks(events, chunks):
+    """Inserts pairs of ``chunk`` and index of chunk among events of skeleton, see :meth:`svg2ssa.document.SVG.read_events`."""
+
+    chunks = iter(enumerate(chunks))
+    index, chunk = next(chunks, (None, None))
+    for count, event in enumerate(events):
+        while chunk is not None and chunk[0] == count:
+            yield "chunk", index
+            index, chunk = next(chunks, (None, None))
+        yield event
+    while chunk is not None:
+        yield "chunk", index
+        index, chunk = next(chunks, (None, None))
+
+
+def drop_enclosing(events, depth):
+    """Drops events of ``depth`` outermost elements, which were copied into chunk from skeleton."""
+
+    level = 0
+    for action, element in events:
+        if action == "start":
+            level += 1
+            if level > depth:
+                yield action, element
+        else:
+            if level > depth:
+                yield action, element
+            level -= 1
+
+
+def read_chunk(cls, data, xml_parser, on_error, line_offset, depth, context, hidden, skipped):
+    """Reads chunk of SVG document, see :func:`split_document`.
+
+    Self-contained, so that it could be run in a worker process or thread.
+
+    Args:
+        cls (type): :class:`svg2ssa.document.SVG` or its subclass, which models chunk.
+        data (bytes): Chunk as standalone document.
+        xml_parser (str): Name of an XML parser, see :meth:`svg2ssa.document.SVG.get_xml_parser`.
+        on_error (str): See :meth:`svg2ssa.document.SVG.from_svg_file`.
+        line_offset (int): Difference between line numbers in SVG file and in chunk.
+        depth (int): Number of enclosing elements copied into chunk.
+        context (tuple): See :meth:`svg2ssa.document.SVG.chunk_context`.
+        hidden (int): See :meth:`svg2ssa.document.SVG.read_events`.
+        skipped (int): See :meth:`svg2ssa.document.SVG.read_events`.
+    Returns:
+        svg2ssa.document.SVG: Model of chunk, to be merged by :meth:`svg2ssa.document.SVG.merge_chunk`.
+    """
+
+    svg = cls.from_chunk_context(context)
+    events = cls.get_xml_parser(xml_parser).iterparse(BytesIO(data), ("start", "end"))
+    svg.read_events(drop_enclosing(events, depth), on_error, line_offset, hidden, skipped)
+    return svg
+
+
+def read_in_chunks(svg, filepath, xml_parser, on_error, workers, executor=None):
+    """Reads SVG document into ``svg`` in parallel, see :mod:`svg2ssa.chunks`. Document which can't be split is read serially.
+
+    Args:
+        svg (svg2ssa.document.SVG): Model of document being read.
+        filepath (str): Path to SVG file to be read, or file object.
+        xml_parser (xml.etree.ElementTree): See :meth:`svg2ssa.document.SVG.from_svg_file`. It must be returned by :meth:`svg2ssa.document.SVG.get_xml_parser`, so that workers could get the same one by its name.
+        on_error (str): See :meth:`svg2ssa.document.SVG.from_svg_file`.
+        workers (int): Number of workers.
+        executor (concurrent.futures.Executor): Executor for reading of chunks. If ``None``, executor is created by :func:`svg2ssa.utilities.make_executor` and shut down on exit.
+    """
+
+    if hasattr(filepath, "read"):
+        data = filepath.read()
+    else:
+        with open(filepath, "rb") as file:
+            data = file.read()
+    document = split_document(data, CHUNKS_PER_WORKER * workers)
+    if document is None:
+        svg.read_events(xml_parser.iterparse(BytesIO(data), ("start", "end")), on_error)
+        return
+    skeleton, chunks = document
+    name = "lxml.etree" if isinstance(xml_parser, LXMLParser) else xml_parser.__name__
+
+    own_executor = executor is None
+    if own_executor:
+        executor = make_executor(workers)
+    futures = []
+    # Skeleton is read twice: first by a scout, which finds context of each chunk, so that all chunks are read at once, then by ``svg`` itself, which merges them in document order.
+    scout = svg.__class__()
+    scout.select_id = svg.select_id
+
+    def submit(index, hidden, skipped):
+        _, data, line_offset, depth = chunks[index]
+        context = scout.chunk_context()
+        futures.append(
+            executor.submit(
+                read_chunk, svg.__class__, data, name, on_error, line_offset, depth, context, hidden, skipped
+            )
+        )
+
+    def merge(index, hidden, skipped):
+        # pylint: disable=unused-argument
+        try:
+            chunk = futures[index].result()
+        except SVGElementError as err:
+            raise svg.moved_error(err, svg.position) from err.__cause__
+        svg.merge_chunk(chunk)
+
+    try:
+        scout.read_events(
+            mark_chunks(xml_parser.iterparse(BytesIO(skeleton), ("start", "end")), chunks), "skip", on_chunk=submit
+        )
+        svg.read_events(
+            mark_chunks(xml_parser.iterparse(BytesIO(skeleton), ("start", "end")), chunks), on_error, on_chunk=merge
+        )
+    finally:
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
@@ -0,0 +1,69 @@
+"""Default config for conversion of SVG to SSA.
+
+Kept apart from the models of SVG so that CLI could be set up w/o importing them. Config is read-only, and so are its values, so that it could be shared by documents converted in several threads; override it by merging, e.g. ``{**default_ssa_repr_config, "width": 1280}``.
+"""
+
+
+from types import MappingProxyType
+
+
+default_ssa_repr_config = MappingProxyType(
+    dict(
+        width=1920,
+        height=1088,
+        unnecessary_transformations=frozenset(),
+        stroke_preservation=0,
+        magnification_level=3,
+        magnification_tolerance=0.125,
+        canonicalization=False,
+        split_max_points=0,
+        split_max_bytes=0,
+        max_styles=0,
+        palette_max_colors=0,
+        palette_tolerance=0.0,
+        on_error="fail",
+        cost_report=0,
+        cost_budget=0.0,
+        select_id=None,
+        region=None,
+        fps=23.976,
+        start="0:00:00.00",
+        end="0:00:02.00",
+        header_template=(
+            "[Script Info]\n"
+            "; Script generated by svg2ssa for use in Aegisub\n"
+            "; svg2ssa: https://github.com/8day/svg2ssa\n"
+            "; Aegisub: https://github.com/Aegisub/Aegisub\n"
+            "ScriptType: v4.00+\n"
+            "Title: SSA subtitle generated from SVG\n"
+            "WrapStyle: 0\n"
+            "PlayResX: {width}\n"
+            "PlayResY: {height}\n"
+            "ScaledBorderAndShadow: yes\n"
+            "Video File: ?dummy:{fps:f}:100000:{width}:{height}:255:255:255:\n"
+            "\n"
+            "[V4+ Styles]\n"
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+            "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
+            "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+            "Alignment, MarginL, MarginR, MarginV, Encoding\n"
+            "Style: s2s.default,Arial,20,"
+            "&H00FFFFFF,&H000000FF,&H00000000,&H00000000,"
+            "0,0,0,0,100,100,0,0,1,0,0,7,0,0,0,1\n"
+            "{styles}"
+            "\n"
+            "[Events]\n"
+            "Format: Layer, Start, End, Style, Name, "
+            "MarginL, MarginR, MarginV, Effect, Text"
+        ),
+        style_template=(
+            "Style: {name},Arial,20,{primary},&H000000FF,{outline},&H00000000,"
+            "0,0,0,0,100,100,0,0,1,{bord},0,7,0,0,0,1"
+        ),
+        event_template=(
+            "Dialogue: {layer},{start},{end},{style},{actor},0000,0000,0000,,"
+            "{{\\p{m_lev}{trans}{codes}}} {drwng} {{\\p0}}"
+        ),
+    )
+)
+"""types.MappingProxyType: Config for conversion to SSA; see :meth:`svg2ssa.document.SVG.ssa_repr`."""
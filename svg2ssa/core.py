@@ -4,6 +4,9 @@
 class SVGBasicEntity:
     """Abstract class for modeling misc SVG entities: elements, attributes, and their data."""
 
+    # Large documents create hundreds of thousands of entities, hence no per-instance ``__dict__``. Subclasses must declare ``__slots__`` as well, and keep metadata like ``svg_name`` at class level.
+    __slots__ = ("data",)
+
     def __init__(self, data):
         self.data = data
         """Any: Data."""
@@ -65,6 +68,8 @@ class SVGBasicEntity:
 class SVGContainerEntity(SVGBasicEntity):
     """Similar to :class:`SVGBasicEntity`, but not an abstract class (mixin), and only for containers."""
 
+    __slots__ = ()
+
     def __bool__(self):
         return bool(self.data)
 
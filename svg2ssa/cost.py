@@ -0,0 +1,130 @@
+"""Logic for estimation of cost of rendering of SSA events, so that events which make renderers like VSFilter drop frames could be found before playback.
+
+Cost is a rough, unitless figure meant only to rank events and to be compared against a budget. It adds up work per point of outline, where each Bezier curve is flattened into :data:`CURVE_POINTS` points and border multiplies outline by its width, and work per pixel of bounding box in PlayRes pixels, which is rasterized, and blended unless it's fully transparent.
+"""
+
+
+import re
+
+from .drawing import bord
+
+
+CURVE_POINTS = 8
+"""int: Number of points each Bezier curve is flattened into by renderer."""
+
+PIXEL_COST = 1 / 64
+"""float: Cost of rasterization or blending of one pixel, relative to processing of one point of outline."""
+
+alpha = re.compile(r"\\(1a|3a|alpha)&H([0-9A-Fa-f]{2})&")
+scale = re.compile(r"\\fsc([xy])(-?[0-9.]+)")
+
+
+def measure_drawing(drwng):
+    """Counts points and curves of SSA drawing and finds its bounding box.
+
+    Args:
+        drwng (str): SSA drawing.
+    Returns:
+        tuple[int, int, tuple[float, float, float, float]]: Number of points, including control ones, number of Bezier curves, and bounding box ``(min_x, min_y, max_x, max_y)``.
+    """
+
+    points = curves = run = 0
+    command = None
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
+    odd = True
+    for token in drwng.split():
+        if token.isalpha():
+            command = token
+            run = 0
+            continue
+        val = float(token)
+        if odd:
+            min_x = min(min_x, val)
+            max_x = max(max_x, val)
+        else:
+            min_y = min(min_y, val)
+            max_y = max(max_y, val)
+            points += 1
+            run += 1
+            # Command ``b`` may be followed by several triplets of points.
+            if command == "b" and run % 3 == 0:
+                curves += 1
+        odd = not odd
+    if not points:
+        return 0, 0, (0.0, 0.0, 0.0, 0.0)
+    return points, curves, (min_x, min_y, max_x, max_y)
+
+
+def estimate_event_cost(fields):
+    """Estimates cost of rendering of SSA event.
+
+    Args:
+        fields (dict[str, str]): Fields of event, see :meth:`svg2ssa.document.SVG.ssa_repr_events`.
+    Returns:
+        dict: Number of ``points`` and ``curves``, ``area`` of bounding box in PlayRes pixels, ``bord``, alphas of fill and border as ``alpha`` (``0`` is opaque, ``255`` is transparent), and ``cost``.
+    """
+
+    points, curves, (min_x, min_y, max_x, max_y) = measure_drawing(fields["drwng"])
+    lines = points - 3 * curves
+    factors = {"x": 1.0, "y": 1.0}
+    # Scale is in percent, and the last tag wins, see :meth:`svg2ssa.attributes.transform.SVGTransform.rendered_matrix`.
+    for axis, val in scale.findall(fields["trans"]):
+        factors[axis] = abs(float(val)) / 100
+    unit = 2 ** (int(fields["m_lev"]) - 1)
+    width = (max_x - min_x) / unit * factors["x"]
+    height = (max_y - min_y) / unit * factors["y"]
+    codes = fields["codes"]
+    search_result = bord.search(codes)
+    border = float(search_result.group(1)) if search_result else 0.0
+    alphas = {"1a": 0, "3a": 0}
+    for tag, val in alpha.findall(codes):
+        for key in alphas if tag == "alpha" else (tag,):
+            alphas[key] = int(val, 16)
+
+    outline = lines + CURVE_POINTS * curves
+    fill_area = width * height
+    border_area = (width + 2 * border) * (height + 2 * border) - fill_area if border else 0.0
+    blended = (fill_area if alphas["1a"] < 255 else 0.0) + (border_area if alphas["3a"] < 255 else 0.0)
+    cost = outline * (1 + border) + PIXEL_COST * (fill_area + border_area + blended)
+    return dict(
+        points=points,
+        curves=curves,
+        area=round(fill_area, 1),
+        bord=border,
+        alpha=[alphas["1a"], alphas["3a"]],
+        cost=round(cost, 1),
+    )
+
+
+def cost_report(events, top=0, budget=0.0):
+    """Estimates cost of rendering of each SSA event, see :func:`estimate_event_cost`.
+
+    Args:
+        events (list[dict[str, str]]): Fields of events, see :meth:`svg2ssa.document.SVG.ssa_repr_events`.
+        top (int): Number of the heaviest events to report; ``0`` means all of them.
+        budget (float): Max cost of one event; ``0`` means no limit. Events over budget are reported even if there are more of them than ``top``.
+    Returns:
+        dict: ``total`` cost of all events, ``budget``, number of events ``over_budget``, and the heaviest ``events``, sorted by descending cost; each one is described by its 1-based ``index`` among events, ``actor``, and estimates.
+    """
+
+    costs = []
+    for index, fields in enumerate(events, 1):
+        costs.append(dict(index=index, actor=fields["actor"], **estimate_event_cost(fields)))
+    total = round(sum(cost["cost"] for cost in costs), 1)
+    costs.sort(key=lambda cost: (-cost["cost"], cost["index"]))
+    over_budget = sum(1 for cost in costs if cost["cost"] > budget) if budget else 0
+    if top:
+        costs = costs[: max(top, over_budget)]
+    return dict(total=total, budget=budget, over_budget=over_budget, events=costs)
+
+
+def describe_cost(cost):
+    """Returns one-line description of cost of event, suitable for report."""
+
+    actor = f' "{cost["actor"]}"' if cost["actor"] else ""
+    return (
+        f"event #{cost['index']}{actor}: cost {cost['cost']:,.1f} "
+        f"({cost['points']} points, {cost['curves']} curves, {cost['area']:,.0f} px², "
+        f"bord {cost['bord']:g}, alpha {cost['alpha'][0]:02X}/{cost['alpha'][1]:02X})"
+    )
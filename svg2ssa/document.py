@@ -1,64 +1,137 @@
 """Logic for the model of SVG document."""
 
 
-import re
+from collections import Counter
+from fnmatch import fnmatchcase
+from functools import partial, wraps
+from importlib import import_module
+from os import path as os_path
+from time import perf_counter
+from types import MappingProxyType
+
+from .elements import (
+    parse_stats,
+    SVGElementG,
+    SVGElementPath,
+    SVGElementUse,
+    SVGElementRect,
+    SVGElementCircle,
+    SVGElementEllipse,
+    SVGElementLine,
+    SVGElementPolyline,
+    SVGElementPolygon,
+)
+from .utilities import LXMLParser, convert_svglength_to_pixels, get_peak_rss
+from .config import default_ssa_repr_config
+from .drawing import bord, split_drawing
+from .cost import cost_report
+from .styles import default_style, extract_styles
+from .palette import quantize_palette
+from .chunks import read_in_chunks
+from .errors import SSACostError, SVGElementError
+
+
+def counting_parses(method):
+    """Decorates method of :class:`SVG`, so that attrs read and parsed by models while it runs are counted in :attr:`SVG.parse_stats` of its instance."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = parse_stats.set(self.parse_stats)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            parse_stats.reset(token)
 
-from .elements import SVGElementG, SVGElementPath
-from .utilities import convert_svglength_to_pixels
+    return wrapper
 
 
 class SVG:
     """Models Scalable Vector Graphics document convertable to SubStation Alpha subtitle document."""
 
-    default_ssa_repr_config = dict(
-        width=1920,
-        height=1088,
-        unnecessary_transformations=set(),
-        stroke_preservation=0,
-        magnification_level=3,
-        header_template=(
-            "[Script Info]\n"
-            "; Script generated by svg2ssa for use in Aegisub\n"
-            "; svg2ssa: https://github.com/8day/svg2ssa\n"
-            "; Aegisub: https://github.com/Aegisub/Aegisub\n"
-            "ScriptType: v4.00+\n"
-            "Title: SSA subtitle generated from SVG\n"
-            "WrapStyle: 0\n"
-            "PlayResX: {width}\n"
-            "PlayResY: {height}\n"
-            "ScaledBorderAndShadow: yes\n"
-            "Video File: ?dummy:23.976000:100000:{width}:{height}:255:255:255:\n"
-            "\n"
-            "[V4+ Styles]\n"
-            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
-            "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
-            "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
-            "Alignment, MarginL, MarginR, MarginV, Encoding\n"
-            "Style: s2s.default,Arial,20,"
-            "&H00FFFFFF,&H000000FF,&H00000000,&H00000000,"
-            "0,0,0,0,100,100,0,0,1,0,0,7,0,0,0,1\n"
-            "\n"
-            "[Events]\n"
-            "Format: Layer, Start, End, Style, Name, "
-            "MarginL, MarginR, MarginV, Effect, Text"
-        ),
-        event_template=(
-            "Dialogue: 0,0:00:00.00,0:00:02.00,s2s.default,{actor},0000,0000,0000,,"
-            "{{\\p{m_lev}{trans}{codes}}} {drwng} {{\\p0}}"
-        ),
-    )
+    default_ssa_repr_config = default_ssa_repr_config
+    """dict: See :data:`svg2ssa.config.default_ssa_repr_config`."""
+
+    namespace = "{http://www.w3.org/2000/svg}"
+    """str: Namespace of SVG elements, as used in qualified tags."""
+
+    xml_parsers = ("auto", "lxml.etree", "defusedxml.ElementTree", "xml.etree.ElementTree")
+    """tuple[str]: Names of XML parsers known to :meth:`get_xml_parser`."""
 
     def __init__(self):
         self.terminal_element_stack = []
         """list: Sequence with terminal elements convertable to SSA."""
+        self.terminal_element_positions = []
+        """list[int]: Value of :attr:`position` for each item of :attr:`terminal_element_stack`, for error reporting."""
+        self.position = 0
+        """int: Ordinal number of the last read element in document order, starting from ``1``."""
+        self.errors = []
+        """list[svg2ssa.errors.SVGElementError]: Elements skipped because of errors, when ``on_error`` is ``skip``."""
+        self.error_positions = set()
+        """set[int]: Value of :attr:`position` for each item of :attr:`errors`, so that element that owns malformed attr is reported once, however many descendants fail because of it, see :meth:`handle_error`."""
+        self.origin = None
+        """tuple[str, str, int, int]: Local name, ``id``, :attr:`position` and line number of the element being read, for :attr:`svg2ssa.elements.SVGElementMixin.origin` of its model."""
+        self.parse_errors = 0
+        """int: Number of the first items of :attr:`errors` found while reading SVG; the rest were found by the last conversion to SSA."""
         self.container_element_stack = []
         """list: Sequence with container elements whose attrs must be passed to enclosed terminal elements."""
+        self.reusable_elements = []
+        """list[tuple]: Terminal elements in document order, as ``(model, ancestors, level)``: model built only out of element's own attrs, tuple with such models of its container ancestors, and :attr:`definition_depth` of element. Instances created by ``use`` are built out of these."""
+        self.reusable_element_stack = [()]
+        """list[tuple]: Tuples of ancestors for :attr:`reusable_elements`, one per open container element."""
+        self.definitions = {}
+        """dict[str, tuple[int, int, int, int]]: Maps ``id`` of element to slice of :attr:`reusable_elements` that it consists of, the number of its ancestors, and its :attr:`definition_depth`."""
+        self.open_definitions = []
+        """list[tuple]: ``id``, start of slice, number of ancestors and :attr:`definition_depth` of each open container element, see :attr:`definitions`."""
+        self.definition_depth = 0
+        """int: Number of open ``defs``, ``symbol`` and alike elements, whose children aren't rendered unless referenced by ``use``, see :meth:`_defs_started`."""
+        self.select_id = None
+        """str: Glob pattern for ``id`` of elements to be rendered, see :meth:`is_selected`; ``None`` renders all of them."""
+        self.selected_depth = 0
+        """int: Number of open container elements whose ``id`` matches :attr:`select_id`, so that all their descendants are selected."""
         self.width = SVG.default_ssa_repr_config["width"]
         """int: Default width for the generated SSA document."""
         self.height = SVG.default_ssa_repr_config["height"]
         """int: Default height for the generated SSA document."""
-        self.ssa_repr_config = dict(**SVG.default_ssa_repr_config)
-        """dict: Config for conversion to SSA."""
+        self.ssa_repr_config = SVG.default_ssa_repr_config
+        """types.MappingProxyType: Read-only config for conversion to SSA, which is overridden by config passed to :meth:`to_ssa_file`."""
+        self.magnification_levels = Counter()
+        """collections.Counter: Number of events per magnification level, as emitted by the last conversion to SSA."""
+        self.elements_seen = Counter()
+        """collections.Counter: Number of elements of SVG namespace per local name, as read from SVG."""
+        self.unsupported_elements = Counter()
+        """collections.Counter: Number of elements ignored because they aren't supported, per local name."""
+        self.skipped_elements = Counter()
+        """collections.Counter: Number of supported elements which were read, but won't be emitted, per reason."""
+        self.baked_trafos = Counter()
+        """collections.Counter: Number of paths with ``transform`` per combo of trafos baked into their coords, such as ``rotate+translate`` or ``none``, as chosen by the last conversion to SSA when ``unnecessary_transformations`` is ``auto``, see :meth:`svg2ssa.elements.SVGElementPath.choose_baked_trafos`."""
+        self.segments = Counter()
+        """collections.Counter: Number of segments of emitted paths per SVG command, as emitted by the last conversion to SSA."""
+        self.events = 0
+        """int: Number of events emitted by the last conversion to SSA."""
+        self.palette = None
+        """dict: Report of quantization of palette by the last conversion to SSA, see :func:`svg2ssa.palette.quantize_palette`, along with size of SSA document w/o and with quantization as ``bytes``; ``None`` unless ``palette_max_colors`` or ``palette_tolerance`` is set."""
+        self.costs = None
+        """dict: Estimated costs of rendering of events emitted by the last conversion to SSA, see :func:`svg2ssa.cost.cost_report`; ``None`` unless ``cost_report`` or ``cost_budget`` is set."""
+        self.timings = {}
+        """dict[str, float]: Wall time of phases of conversion (``parse``, ``convert``, ``write``), in seconds."""
+        self.hidden_bytes = 0
+        """int: Size of attrs of elements in hidden subtrees, which were skipped w/o being parsed, see :meth:`is_hidden`."""
+        self.parse_stats = Counter()
+        """collections.Counter: Number of raw values of attrs ``read`` by models of this document, and of those ``parsed``, see :meth:`svg2ssa.elements.SVGElementMixin.parsed`."""
+        self.input_bytes = None
+        """int: Size of SVG file."""
+        self.output_bytes = None
+        """int: Size of SSA file."""
+
+    def __getstate__(self):
+        # Models of chunks of document are sent back by worker processes, see :mod:`svg2ssa.chunks`, and read-only config can't be pickled.
+        state = self.__dict__.copy()
+        del state["ssa_repr_config"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.ssa_repr_config = SVG.default_ssa_repr_config
 
     @staticmethod
     def make_round_and_mod(nmb, mod):
@@ -76,6 +149,47 @@ class SVG:
             nmb += mod - (nmb % mod)
         return nmb
 
+    @staticmethod
+    def is_hidden(atts):
+        """Returns whether element isn't rendered along with all its children, judging by its raw attrs, so that the whole subtree could be skipped w/o building any models.
+
+        Element is hidden by ``display:none`` or ``opacity:0``, set either as attrs or as properties in ``style``, which take precedence. Neither can be overridden by descendants. Unlike them, ``visibility:hidden`` can, therefore such element is read as usual, and only events of invisible elements are suppressed, see :class:`svg2ssa.attributes.misc.SVGVisibility`.
+
+        Args:
+            atts (dict[str, str]): Attributes of an element.
+        Returns:
+            bool: Whether element is hidden.
+        """
+
+        props = {key: atts[key] for key in ("display", "opacity") if key in atts}
+        style = atts.get("style")
+        # Most styles don't hide anything, so they are only split if they might.
+        if style and ("none" in style or "opacity" in style):
+            for declaration in style.split(";"):
+                key, sep, val = declaration.partition(":")
+                key = key.strip()
+                if sep and key in ("display", "opacity"):
+                    props[key] = val
+        if not props:
+            return False
+        if props.get("display", "").strip() == "none":
+            return True
+        try:
+            return float(props.get("opacity", "1")) <= 0
+        except ValueError:
+            return False
+
+    def is_selected(self, atts):
+        """Returns whether element is selected by :attr:`select_id`, judging by its raw ``id``, or by that of any of its open ancestors. Checked before any attr of element is parsed.
+
+        Args:
+            atts (dict[str, str]): Attributes of an element.
+        Returns:
+            bool: Whether element is selected.
+        """
+
+        return self.select_id is None or self.selected_depth > 0 or fnmatchcase(atts.get("id", ""), self.select_id)
+
     def _g_started(self, atts):
         """Builds model of SVG ``g`` element out of its attrs and adds it to :attr:`container_element_stack`. Also merges attrs from parent elements.
 
@@ -83,38 +197,144 @@ class SVG:
             atts (dict[str, str]): Attributes of an element.
         """
 
-        curr = SVGElementG.from_raw_data(atts)
+        local = SVGElementG.from_raw_data(atts)
+        local.origin = self.origin
+        curr = local.copy()
         try:
             prev = self.container_element_stack[-1]
             curr += prev
         except IndexError:
             pass
         self.container_element_stack.append(curr)
+        if self.select_id is not None and fnmatchcase(atts.get("id", ""), self.select_id):
+            self.selected_depth += 1
+        ancestors = self.reusable_element_stack[-1]
+        self.open_definitions.append(
+            (atts.get("id"), len(self.reusable_elements), len(ancestors), self.definition_depth)
+        )
+        self.reusable_element_stack.append(ancestors + (local,))
 
     def _g_ended(self):
-        """Pops built model of SVG ``g`` element from :attr:`container_element_stack`."""
+        """Pops built model of SVG ``g`` element from :attr:`container_element_stack`, and records its slice of :attr:`reusable_elements` if it has ``id``."""
 
         if self.container_element_stack:
             del self.container_element_stack[-1]
+        if self.open_definitions:
+            key, start, depth, level = self.open_definitions.pop()
+            del self.reusable_element_stack[-1]
+            if key:
+                self.definitions[key] = (start, len(self.reusable_elements), depth, level)
+            if self.select_id is not None and fnmatchcase(key or "", self.select_id):
+                self.selected_depth -= 1
 
-    def _path_started(self, atts):
-        """Builds model of SVG ``path`` element out of its attrs and adds it to :attr:`terminal_element_stack`. Also merges attrs from parent elements.
+    def _defs_started(self, atts):
+        """Same as :meth:`_g_started`, but children of ``defs`` and ``symbol`` are only rendered via ``use``. Same goes for elements which are never rendered directly, like ``clipPath``, as they aren't supported.
+
+        Args:
+            atts (dict[str, str]): Attributes of an element.
+        """
+
+        self.definition_depth += 1
+        self._g_started(atts)
+
+    def _defs_ended(self):
+        """Same as :meth:`_g_ended`."""
+
+        self._g_ended()
+        self.definition_depth -= 1
+
+    def _terminal_started(self, atts, cls):
+        """Builds model of terminal element out of its attrs and records it in :attr:`reusable_elements`. Unless it's within ``defs`` or ``symbol``, or isn't selected (see :meth:`is_selected`), adds it to :attr:`terminal_element_stack`, merging attrs from parent elements. Element that isn't selected is still recorded, since it may be referenced by ``use`` that is.
+
+        Basic shapes (``rect``, ``circle`` etc.) are handled here as well, see :class:`svg2ssa.elements.SVGElementShapeMixin`.
 
         Args:
             atts (dict[str, str]): Attributes of an element.
+            cls (type): Class of model.
         """
 
-        curr = SVGElementPath.from_raw_data(atts)
+        local = cls.from_raw_data(atts)
+        local.origin = self.origin
+        # E.g. ``rect`` with zero width, which isn't rendered.
+        if isinstance(local, SVGElementPath) and not local.data.get("d"):
+            self.skipped_elements["empty"] += 1
+            return
+        ancestors = self.reusable_element_stack[-1]
+        key = atts.get("id")
+        if key:
+            start = len(self.reusable_elements)
+            self.definitions[key] = (start, start + 1, len(ancestors), self.definition_depth)
+        self.reusable_elements.append((local, ancestors, self.definition_depth))
+        if self.definition_depth:
+            self.skipped_elements["definition"] += 1
+            return
+        if not self.is_selected(atts):
+            self.skipped_elements["not selected"] += 1
+            return
+        curr = local.copy()
         try:
             prev = self.container_element_stack[-1]
             curr += prev
         except IndexError:
             pass
         self.terminal_element_stack.append(curr)
+        self.terminal_element_positions.append(self.position)
+
+    def _path_started(self, atts):
+        """Builds model of SVG ``path`` element, see :meth:`_terminal_started`.
+
+        Args:
+            atts (dict[str, str]): Attributes of an element.
+        """
+
+        self._terminal_started(atts, SVGElementPath)
 
     def _path_ended(self):
         """No processing is required for end tag of element ``path``."""
 
+    def _use_started(self, atts):
+        """Builds model of SVG ``use`` element, see :meth:`_terminal_started`. It's replaced by instances of referenced element once the whole document is read, see :meth:`instantiate`.
+
+        Args:
+            atts (dict[str, str]): Attributes of an element.
+        """
+
+        self._terminal_started(atts, SVGElementUse)
+
+    def _use_ended(self):
+        """No processing is required for end tag of element ``use``."""
+
+    def instantiate(self, use, refs=()):
+        """Creates instances of terminal elements referenced by ``use``.
+
+        Each instance is a copy of model built only out of element's own attrs, merged with attrs of its ancestors up to the referenced element, and then with attrs of ``use`` itself (which were already merged with attrs of ancestors of ``use``). Attr ``d`` is shared by all instances, so path data is parsed once and its geometry is memoized once per linear part of CTM (see :meth:`svg2ssa.attributes.d.SVGD.memoized_geometry`), i.e. each instance only adds its own trafos.
+
+        Args:
+            use (svg2ssa.elements.SVGElementUse): Model of ``use`` with attrs of its ancestors merged.
+            refs (tuple[str]): ``id`` of elements being instantiated by outer ``use``, to break circular references.
+        Returns:
+            list[svg2ssa.elements.SVGElementPath]: Instances, in document order of referenced elements.
+        """
+
+        if use.href not in self.definitions or use.href in refs:
+            self.skipped_elements["unresolved use"] += 1
+            return []
+        start, stop, depth, level = self.definitions[use.href]
+        instances = []
+        for local, ancestors, local_level in self.reusable_elements[start:stop]:
+            # Children of ``defs`` or ``symbol`` nested in the referenced element aren't rendered.
+            if local_level > level:
+                continue
+            curr = local.copy()
+            for prev in reversed(ancestors[depth:]):
+                curr += prev
+            curr += use
+            if isinstance(curr, SVGElementUse):
+                instances.extend(self.instantiate(curr, refs + (use.href,)))
+            else:
+                instances.append(curr)
+        return instances
+
     def _svg_started(self, atts):
         """Stores SVG :attr:`width` and :attr:`height`.
 
@@ -128,28 +348,314 @@ class SVG:
     def _svg_ended(self):
         """No processing is required for end tag of element ``svg``."""
 
-    _start = dict(path=_path_started, g=_g_started, svg=_svg_started)
-    """dict[str, Callable[None, [dict, dict]]]: Maps names of elements to handlers of their start tag."""
+    _start = MappingProxyType(
+        dict(
+            path=_path_started,
+            g=_g_started,
+            svg=_svg_started,
+            defs=_defs_started,
+            symbol=_defs_started,
+            clipPath=_defs_started,
+            mask=_defs_started,
+            marker=_defs_started,
+            pattern=_defs_started,
+            use=_use_started,
+            rect=partial(_terminal_started, cls=SVGElementRect),
+            circle=partial(_terminal_started, cls=SVGElementCircle),
+            ellipse=partial(_terminal_started, cls=SVGElementEllipse),
+            line=partial(_terminal_started, cls=SVGElementLine),
+            polyline=partial(_terminal_started, cls=SVGElementPolyline),
+            polygon=partial(_terminal_started, cls=SVGElementPolygon),
+        )
+    )
+    """types.MappingProxyType[str, Callable[None, [dict, dict]]]: Maps names of elements to handlers of their start tag."""
+
+    _end = MappingProxyType(
+        dict(
+            path=_path_ended,
+            g=_g_ended,
+            svg=_svg_ended,
+            defs=_defs_ended,
+            symbol=_defs_ended,
+            clipPath=_defs_ended,
+            mask=_defs_ended,
+            marker=_defs_ended,
+            pattern=_defs_ended,
+            use=_use_ended,
+            **dict.fromkeys(("rect", "circle", "ellipse", "line", "polyline", "polygon"), _path_ended),
+        )
+    )
+    """types.MappingProxyType[str, Callable[None, [dict, dict]]]: Maps names of elements to handlers of their end tag."""
+
+    def handle_error(self, err, on_error, element, element_id, position, line=None):
+        """Either raises :class:`svg2ssa.errors.SVGElementError` caused by ``err``, or records it in :attr:`errors`.
+
+        Malformed attr is parsed only when it's needed (see :meth:`svg2ssa.elements.SVGElementMixin.parsed`), e.g. by a descendant of element that owns it, in which case error is reported against the owner, and only once: the rest of its descendants are skipped silently, same as children of malformed element.
+
+        Args:
+            err (Exception): Original error.
+            on_error (str): ``fail`` to raise error, ``skip`` to record it and go on.
+            element (str): Local name of element.
+            element_id (str): Attr ``id`` of element, if any.
+            position (int): Ordinal number of element in document order.
+            line (int): Line number of element in SVG file, if known.
+        """
+
+        origin = getattr(err, "origin", None)
+        if origin is not None:
+            element, element_id, position, line = origin
+            if position in self.error_positions:
+                return
+        error = SVGElementError(err, element, element_id, position, line)
+        if on_error == "fail":
+            raise error from err
+        if on_error != "skip":
+            raise ValueError(f"Unknown value for 'on_error': {on_error!s}.")
+        self.errors.append(error)
+        self.error_positions.add(position)
+        self.skipped_elements["error"] += 1
+
+    @classmethod
+    def get_xml_parser(cls, name="auto"):
+        """Returns XML parser suitable for :meth:`from_svg_file`.
+
+        ``lxml.etree`` is wrapped by :class:`svg2ssa.utilities.LXMLParser`, which only yields elements of SVG namespace, so that subtrees of other namespaces, like metadata of Inkscape, never reach Python. Other parsers yield them, but they are ignored by :meth:`read_events`, therefore :attr:`elements_seen`, :attr:`unsupported_elements` and :attr:`position` don't depend on parser. ``auto`` picks the fastest safe parser that's installed: ``lxml.etree``, then ``defusedxml.ElementTree``, and built-in ``xml.etree.ElementTree`` as the last resort.
 
-    _end = dict(path=_path_ended, g=_g_ended, svg=_svg_ended)
-    """dict[str, Callable[None, [dict, dict]]]: Maps names of elements to handlers of their end tag."""
+        Args:
+            name (str): One of :attr:`xml_parsers`.
+        Returns:
+            Any: Object with an API equivalent to :mod:`xml.etree.ElementTree`.
+        """
 
-    def from_svg_file(self, filepath, xml_parser):
+        if name not in cls.xml_parsers:
+            raise ValueError(f"Unknown XML parser: {name!s}.")
+        if name in ("auto", "lxml.etree"):
+            try:
+                return LXMLParser([cls.namespace + "*"])
+            except ImportError:
+                if name != "auto":
+                    raise
+            try:
+                return import_module("defusedxml.ElementTree")
+            except ImportError:
+                name = "xml.etree.ElementTree"
+        return import_module(name)
+
+    def from_svg_file(
+        self,
+        filepath,
+        xml_parser,
+        on_error=default_ssa_repr_config["on_error"],
+        workers=0,
+        select_id=default_ssa_repr_config["select_id"],
+    ):
         """Constructs :class:`SVG` out of SVG file stored under ``filepath``.
 
+        Subtrees of hidden elements (see :meth:`is_hidden`) are skipped as soon as start tag of their root arrives: neither models are built nor attrs are parsed, and thus they can't be referenced by ``use`` either. Number of skipped elements and size of their attrs are recorded in :attr:`skipped_elements` and :attr:`hidden_bytes`. Likewise, terminal elements which aren't selected by ``select_id`` aren't merged with their ancestors.
+
         Args:
             filepath (str): Path to SVG file to be read.
             xml_parser (xml.etree.ElementTree): XML parser with an API equivalent to :class:`xml.etree.ElementTree`.
+            on_error (str): ``fail`` to abort on the first malformed element, ``skip`` to skip it along with its children, see :meth:`handle_error`.
+            workers (int): Number of worker processes reading chunks of document in parallel, see :func:`svg2ssa.chunks.read_in_chunks`; ``0`` reads it serially.
+            select_id (str): Glob pattern for ``id`` of elements to be rendered, see :meth:`is_selected`; ``None`` renders all of them.
+        """
+
+        start = perf_counter()
+        self.select_id = select_id
+        if isinstance(filepath, str) and os_path.isfile(filepath):
+            self.input_bytes = os_path.getsize(filepath)
+        if workers:
+            read_in_chunks(self, filepath, xml_parser, on_error, workers)
+        else:
+            self.read_events(xml_parser.iterparse(filepath, ("start", "end")), on_error)
+        self.resolve_uses(on_error)
+        self.parse_errors = len(self.errors)
+        self.timings["parse"] = self.timings.get("parse", 0.0) + perf_counter() - start
+
+    @counting_parses
+    def read_events(self, events, on_error, line_offset=0, hidden=0, skipped=0, on_chunk=None):
+        """Builds models out of events of :func:`xml.etree.ElementTree.iterparse`.
+
+        Args:
+            events (Iterable[tuple[str, Any]]): Pairs of ``start`` or ``end`` and element, along with pairs of ``chunk`` and index of chunk of document read elsewhere, see :mod:`svg2ssa.chunks`.
+            on_error (str): See :meth:`from_svg_file`.
+            line_offset (int): Added to line numbers of elements, when events come from a part of SVG file.
+            hidden (int): Initial depth of subtree of hidden element, when events come from its part.
+            skipped (int): Initial depth of subtree of malformed element, when events come from its part.
+            on_chunk (Callable[None, [int, int, int]]): Called with index of chunk, and depths of subtrees of hidden and malformed elements at its place.
         """
 
-        for action, element in xml_parser.iterparse(filepath, ("start", "end")):
-            _, local_name = re.search(r"^(\{.+?\})(.+)$", element.tag).group(1, 2)
+        elements_seen = self.elements_seen
+        namespace = SVG.namespace
+        for action, element in events:
+            if action in ("start", "end") and not (isinstance(element.tag, str) and element.tag.startswith(namespace)):
+                # Elements of other namespaces, e.g. Inkscape's metadata, aren't rendered, and they aren't counted either, so that counts and positions don't depend on whether XML parser filters them out, see :meth:`get_xml_parser`. Only depths of skipped subtrees are kept balanced.
+                step = 1 if action == "start" else -1
+                if skipped:
+                    skipped += step
+                elif hidden:
+                    hidden += step
+                continue
             if action == "start":
-                if local_name in SVG._start:
-                    SVG._start[local_name](self, element.attrib)
+                local_name = element.tag[len(namespace) :]
+                self.position += 1
+                elements_seen[local_name] += 1
+                if skipped:
+                    skipped += 1
+                # Any element may hide its subtree, even one that isn't supported, like ``a`` or ``switch``.
+                elif hidden or SVG.is_hidden(element.attrib):
+                    hidden += 1
+                    self.skipped_elements["hidden"] += 1
+                    self.hidden_bytes += sum(len(key) + len(val) for key, val in element.attrib.items())
+                elif local_name in SVG._start:
+                    line = getattr(element, "sourceline", None)
+                    if line is not None:
+                        line += line_offset
+                    self.origin = (local_name, element.attrib.get("id"), self.position, line)
+                    # pylint: disable=broad-except
+                    try:
+                        SVG._start[local_name](self, element.attrib)
+                    except Exception as err:
+                        self.handle_error(err, on_error, *self.origin)
+                        skipped = 1
+                else:
+                    self.unsupported_elements[local_name] += 1
+            elif action == "end":
+                if skipped:
+                    skipped -= 1
+                elif hidden:
+                    hidden -= 1
+                else:
+                    local_name = element.tag[len(namespace) :]
+                    if local_name in SVG._end:
+                        SVG._end[local_name](self)
             else:
-                if local_name in SVG._end:
-                    SVG._end[local_name](self)
+                on_chunk(element, hidden, skipped)
+
+    @counting_parses
+    def resolve_uses(self, on_error=default_ssa_repr_config["on_error"]):
+        """Replaces models of ``use`` in :attr:`terminal_element_stack` with instances of referenced elements, see :meth:`instantiate`.
+
+        Args:
+            on_error (str): See :meth:`from_svg_file`. ``use`` whose instances can't be created, because of malformed attr of referenced element or of its ancestors, is skipped.
+        """
+
+        # ``use`` may refer to an element which comes later in document, so it's resolved only after the whole document is read.
+        if not self.elements_seen["use"]:
+            return
+        terminal_element_stack = []
+        terminal_element_positions = []
+        for element, position in zip(self.terminal_element_stack, self.terminal_element_positions):
+            # pylint: disable=broad-except
+            try:
+                instances = self.instantiate(element) if isinstance(element, SVGElementUse) else [element]
+            except Exception as err:
+                self.handle_error(err, on_error, *element.origin)
+                continue
+            terminal_element_stack.extend(instances)
+            terminal_element_positions.extend([position] * len(instances))
+        self.terminal_element_stack = terminal_element_stack
+        self.terminal_element_positions = terminal_element_positions
+
+    def chunk_context(self):
+        """Returns state of open container elements, which chunk of document read elsewhere inherits, see :meth:`from_chunk_context`.
+
+        Models of open container elements are copied, and ordinal number in their :attr:`svg2ssa.elements.SVGElementMixin.origin` is replaced by negative index of element among them, as ordinal numbers within chunk start from ``1`` and the rest are only known once preceding chunks are merged, see :meth:`moved_error`.
+        """
+
+        ancestors = self.reusable_element_stack[-1]
+        copies = tuple(
+            model.__class__(model.data, model.origin[:2] + (-1 - index,) + model.origin[3:])
+            for index, model in enumerate(ancestors)
+        )
+        # Merged model of the innermost container element has origin of its own model, see :meth:`_g_started`.
+        containers = [self.container_element_stack[-1].copy()] if self.container_element_stack else []
+        if containers:
+            containers[0].origin = copies[-1].origin
+        return (
+            containers,
+            copies,
+            self.definition_depth,
+            self.select_id,
+            self.selected_depth,
+        )
+
+    @classmethod
+    def from_chunk_context(cls, context):
+        """Creates :class:`SVG` for chunk of document, whose elements are enclosed by open container elements of another one, see :meth:`chunk_context`."""
+
+        svg = cls()
+        container_element_stack, ancestors, svg.definition_depth, svg.select_id, svg.selected_depth = context
+        svg.container_element_stack = list(container_element_stack)
+        svg.reusable_element_stack = [ancestors]
+        return svg
+
+    def merge_chunk(self, chunk):
+        """Appends everything read from chunk of document, see :meth:`from_chunk_context`, as if it was read by this :class:`SVG` itself.
+
+        Args:
+            chunk (SVG): Model of chunk, which must be the next one in document order. Its ordinal numbers of elements start from ``1``.
+        """
+
+        base = self.position
+        offset = len(self.reusable_elements)
+        # Copies of open container elements (see :meth:`chunk_context`) are replaced by their own models, and the rest of models get ordinal numbers of this document.
+        ancestors = self.reusable_element_stack[-1]
+        moved = set()
+        for model in chunk.models():
+            if id(model) not in moved and model.origin is not None and model.origin[2] > 0:
+                moved.add(id(model))
+                model.origin = model.origin[:2] + (model.origin[2] + base,) + model.origin[3:]
+        self.terminal_element_stack.extend(chunk.terminal_element_stack)
+        self.terminal_element_positions.extend(position + base for position in chunk.terminal_element_positions)
+        self.reusable_elements.extend(
+            (local, ancestors + local_ancestors[len(ancestors) :], level)
+            for local, local_ancestors, level in chunk.reusable_elements
+        )
+        for key, (start, stop, depth, level) in chunk.definitions.items():
+            self.definitions[key] = (start + offset, stop + offset, depth, level)
+        for error in chunk.errors:
+            error = self.moved_error(error, base)
+            # Malformed attr of open container element may be found by several chunks.
+            if error.position in self.error_positions:
+                self.skipped_elements["error"] -= 1
+                continue
+            self.errors.append(error)
+            self.error_positions.add(error.position)
+        self.position += chunk.position
+        self.elements_seen.update(chunk.elements_seen)
+        self.unsupported_elements.update(chunk.unsupported_elements)
+        self.skipped_elements.update(chunk.skipped_elements)
+        self.hidden_bytes += chunk.hidden_bytes
+        self.parse_stats.update(chunk.parse_stats)
+
+    def models(self):
+        """Yields models of elements read by this :class:`SVG`, some of them more than once.
+
+        Yields:
+            svg2ssa.elements.SVGElementMixin: Model.
+        """
+
+        yield from self.terminal_element_stack
+        for local, ancestors, _ in self.reusable_elements:
+            yield local
+            yield from ancestors
+
+    def moved_error(self, error, base):
+        """Returns error found in chunk of document, see :meth:`merge_chunk`, with ordinal number of element in this document.
+
+        Args:
+            error (svg2ssa.errors.SVGElementError): Error, whose element is either one of chunk, or one of open container elements at its place, see :meth:`chunk_context`.
+            base (int): Value of :attr:`position` at the place of chunk.
+        Returns:
+            svg2ssa.errors.SVGElementError: Moved error.
+        """
+
+        if error.position is not None and error.position < 0:
+            ancestor = self.reusable_element_stack[-1][-1 - error.position]
+            return error.moved(ancestor.origin[2] - error.position)
+        return error.moved(base)
 
     def to_ssa_file(self, filepath, ssa_repr_config):
         """Converts :class:`SVG` to its SSA representation using ``ssa_repr_config``, then saves it under ``filepath``.
@@ -157,23 +663,77 @@ class SVG:
         Args:
             filepath (str): Path to SSA file to be written.
             ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+        Returns:
+            dict: See :meth:`metrics`.
         """
 
+        start = perf_counter()
         ssa = self.ssa_repr({**self.ssa_repr_config, **ssa_repr_config})
+        self.timings["convert"] = perf_counter() - start
+        start = perf_counter()
         with open(filepath, "w+t", buffering=65536, encoding="utf-8") as ssa_file:
             ssa_file.write(ssa)
             ssa_file.write("\n")
+        self.timings["write"] = perf_counter() - start
+        self.output_bytes = len(ssa.encode("utf-8")) + 1
+        return self.metrics()
 
-    def ssa_repr(self, ssa_repr_config):
-        """Creates SSA representation from an instance of :class:`SVG`.
+    def to_ssa_files(self, variants):
+        """Converts :class:`SVG` to several SSA files from the same parsed document, one per config.
+
+        Conversion doesn't modify parsed document, so variants differing by e.g. ``magnification_level``, ``stroke_preservation`` or ``unnecessary_transformations`` don't require SVG to be parsed again.
 
         Args:
-            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+            variants (dict[str, dict]): Maps path to SSA file to be written to ``ssa_repr_config`` for it, see :meth:`to_ssa_file`.
         Returns:
-            str: Contents of SSA document.
+            dict[str, dict]: Maps path to SSA file to metrics of its conversion, see :meth:`metrics`.
+        """
+
+        return {filepath: self.to_ssa_file(filepath, ssa_repr_config) for filepath, ssa_repr_config in variants.items()}
+
+    def metrics(self):
+        """Returns metrics of conversion, suitable for serialization to JSON.
+
+        Returns:
+            dict: Sizes of input and output, counts of elements, events and segments, trafos baked by ``auto``, errors, timings of phases, peak RSS of process, statistics of lazy parsing of attrs and of memos (the latter are accumulated by the whole process), estimated costs of rendering of events and report of quantization of palette, if any.
         """
 
-        ssa = []
+        # pylint: disable=import-outside-toplevel
+        from .attributes.d import SVGD
+
+        read = self.parse_stats["read"]
+        parsed = self.parse_stats["parsed"]
+
+        return dict(
+            input_bytes=self.input_bytes,
+            output_bytes=self.output_bytes,
+            elements_seen=dict(self.elements_seen),
+            paths_read=len(self.terminal_element_stack),
+            events_emitted=self.events,
+            segments=dict(self.segments),
+            magnification_levels={str(key): val for key, val in self.magnification_levels.items()},
+            baked_trafos=dict(self.baked_trafos),
+            unsupported_elements=dict(self.unsupported_elements),
+            skipped_elements=dict(self.skipped_elements),
+            hidden_bytes=self.hidden_bytes,
+            timings=dict(self.timings),
+            peak_rss=get_peak_rss(),
+            errors=[error.to_dict() for error in sorted(self.errors, key=lambda error: error.position)],
+            # Instances created by ``use`` parse values of their own copies, so there may be more parses than values read.
+            attributes=dict(read=read, parsed=parsed, avoided=max(read - parsed, 0)),
+            memos={memo.name: memo.stats() for memo in (SVGD.parse_memo, SVGD.geometry_memo)},
+            costs=self.costs,
+            palette=self.palette,
+        )
+
+    def playres(self, ssa_repr_config):
+        """Returns ``PlayResX`` and ``PlayResY`` of SSA document.
+
+        Args:
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+        Returns:
+            tuple[int, int]: Width and height.
+        """
 
         if self.width is not None and self.height is not None:
             width = convert_svglength_to_pixels(self.width)
@@ -181,21 +741,186 @@ class SVG:
             width = SVG.make_round_and_mod(width, 16)
             height = SVG.make_round_and_mod(height, 16)
         else:
-            width = ssa_repr_config["default_playresx"]
-            height = ssa_repr_config["default_playresx"]
-        ssa.append(ssa_repr_config["header_template"].format(width=width, height=height))
+            # CLI sets them by ``--default_playresx`` and ``--default_playresy``, otherwise config has only ``width`` and ``height``.
+            width = ssa_repr_config.get("default_playresx", ssa_repr_config["width"])
+            height = ssa_repr_config.get("default_playresy", ssa_repr_config["height"])
+        return width, height
 
-        event_template = ssa_repr_config["event_template"]
-        for element in self.terminal_element_stack:
-            atts = element.ssa_repr(ssa_repr_config)
-            ssa.append(
-                event_template.format(
-                    actor=atts.pop("id"),
-                    trans=atts.pop("transform"),
-                    drwng=atts.pop("d"),
-                    m_lev=ssa_repr_config["magnification_level"],
-                    codes="".join(atts.values()),
-                )
-            )
+    def ssa_repr_header(self, ssa_repr_config, styles=""):
+        """Creates header of SSA document, i.e. everything up to the first event.
+
+        Args:
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+            styles (str): Lines of ``[V4+ Styles]`` besides ``s2s.default``, see :func:`svg2ssa.styles.extract_styles`.
+        Returns:
+            str: Header of SSA document.
+        """
+
+        width, height = self.playres(ssa_repr_config)
+        return ssa_repr_config["header_template"].format(
+            width=width, height=height, fps=ssa_repr_config["fps"], styles=styles
+        )
+
+    @counting_parses
+    def ssa_repr_events(self, ssa_repr_config):
+        """Creates fields of SSA events, one per terminal element, w/o timing.
+
+        Args:
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+        Returns:
+            list[dict[str, str]]: Fields for ``event_template`` from ``ssa_repr_config``, except ``layer``, ``start`` and ``end``.
+
+        Drawings exceeding ``split_max_points`` or ``split_max_bytes`` are split into several events with same override tags, see :func:`svg2ssa.drawing.split_drawing`. All events refer to style ``s2s.default``; see :func:`svg2ssa.styles.extract_styles` for moving their override tags to styles.
+
+        Elements made invisible by ``visibility`` are skipped, and their number is recorded in :attr:`skipped_elements` as ``invisible``.
 
+        If ``region`` is set, paths which don't overlap it are skipped before their ``d`` is parsed, see :meth:`svg2ssa.elements.SVGElementPath.overlaps`, and their number is recorded in :attr:`skipped_elements` as ``outside region``.
+
+        If ``cost_report`` or ``cost_budget`` is set, costs of rendering of events are estimated into :attr:`costs`, and :class:`svg2ssa.errors.SSACostError` is raised if any event exceeds ``cost_budget``.
+        """
+
+        # Errors of the previous conversion are discarded, so that each conversion reports only its own.
+        if len(self.errors) > self.parse_errors:
+            self.skipped_elements["error"] -= len(self.errors) - self.parse_errors
+            del self.errors[self.parse_errors :]
+            self.error_positions = {error.position for error in self.errors}
+        # Statistics are assigned only at the end, so that conversions of the same document with different configs wouldn't mix them up.
+        events = []
+        magnification_levels = Counter()
+        baked_trafos = Counter()
+        segments = Counter()
+        max_points = ssa_repr_config["split_max_points"]
+        max_bytes = ssa_repr_config["split_max_bytes"]
+        on_error = ssa_repr_config["on_error"]
+        region = ssa_repr_config["region"]
+        filtered = Counter()
+        style = default_style[0]
+        for element, position in zip(self.terminal_element_stack, self.terminal_element_positions):
+            # pylint: disable=broad-except
+            try:
+                if "visibility" in element.data and not element.parsed("visibility").data:
+                    filtered["invisible"] += 1
+                    continue
+                if region is not None and not element.overlaps(region):
+                    filtered["outside region"] += 1
+                    continue
+                atts = element.ssa_repr(ssa_repr_config)
+            except Exception as err:
+                element_id = element.parsed("id").data if "id" in element.data else None
+                # Instance created by ``use`` has origin of the referenced element, whose line isn't that of ``use``.
+                line = element.origin[3] if element.origin is not None and element.origin[2] == position else None
+                self.handle_error(err, on_error, element.svg_name, element_id, position, line)
+                continue
+            for seg in element.data["d"].data:
+                segments[seg[0]] += 1
+            m_lev = atts.pop("magnification_level", ssa_repr_config["magnification_level"])
+            magnification_levels[m_lev] += 1
+            baked = atts.pop("baked_trafos", None)
+            if baked is not None:
+                baked_trafos["+".join(sorted(baked)) or "none"] += 1
+            actor = atts.pop("id")
+            trans = atts.pop("transform")
+            drwng = atts.pop("d")
+            codes = "".join(atts.values())
+            if max_points or max_bytes:
+                # Border and one more pixel of antialiasing, in units of drawing.
+                search_result = bord.search(codes)
+                margin = (float(search_result.group(1)) if search_result else 0.0) + 1
+                drwngs = split_drawing(drwng, max_points, max_bytes, margin * 2 ** (m_lev - 1))
+            else:
+                drwngs = [drwng]
+            for drwng in drwngs:
+                events.append(dict(style=style, actor=actor, trans=trans, drwng=drwng, m_lev=m_lev, codes=codes))
+        self.magnification_levels = magnification_levels
+        self.baked_trafos = baked_trafos
+        for reason in ("invisible", "outside region"):
+            if filtered[reason]:
+                self.skipped_elements[reason] = filtered[reason]
+            else:
+                self.skipped_elements.pop(reason, None)
+        self.segments = segments
+        self.events = len(events)
+        top = ssa_repr_config["cost_report"]
+        budget = ssa_repr_config["cost_budget"]
+        self.costs = cost_report(events, top, budget) if top or budget else None
+        if budget and self.costs["over_budget"]:
+            raise SSACostError(self.costs)
+        return events
+
+    def ssa_repr(self, ssa_repr_config):
+        """Creates SSA representation from an instance of :class:`SVG`.
+
+        If ``palette_max_colors`` or ``palette_tolerance`` is set, palette of colors of events is quantized, see :func:`svg2ssa.palette.quantize_palette`, and the report is kept in :attr:`palette`. If ``max_styles`` is set, recurring combos of colors, alphas and border are moved from events to styles, see :func:`svg2ssa.styles.extract_styles`.
+
+        Args:
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+        Returns:
+            str: Contents of SSA document.
+        """
+
+        events = self.ssa_repr_events(ssa_repr_config)
+        max_colors = ssa_repr_config["palette_max_colors"]
+        tolerance = ssa_repr_config["palette_tolerance"]
+        if not max_colors and not tolerance:
+            self.palette = None
+            return self.ssa_repr_document(events, ssa_repr_config)
+        quantized, self.palette = quantize_palette(events, max_colors, tolerance)
+        styles, styled = self.ssa_repr_styles(quantized, ssa_repr_config)
+        ssa = self.ssa_repr_document(styled, ssa_repr_config, styles)
+        size = len(ssa.encode("utf-8")) + 1
+        # Quantization only changes override tags of events, and thus their styles, so size of document w/o it is told by sizes of these alone, w/o making the whole document again.
+        original_styles, original = self.ssa_repr_styles(events, ssa_repr_config)
+        delta = SVG.styles_bytes(original_styles, original) - SVG.styles_bytes(styles, styled)
+        self.palette["bytes"] = [size + delta, size]
+        return ssa
+
+    @staticmethod
+    def ssa_repr_styles(events, ssa_repr_config):
+        """Moves override tags of events to styles if ``max_styles`` is set, see :func:`svg2ssa.styles.extract_styles`.
+
+        Args:
+            events (list[dict[str, str]]): See :meth:`ssa_repr_events`.
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+        Returns:
+            tuple[str, list[dict[str, str]]]: Lines of styles, if any, and fields of events referring to them.
+        """
+
+        if not ssa_repr_config["max_styles"]:
+            return "", events
+        return extract_styles(events, ssa_repr_config["max_styles"], ssa_repr_config["style_template"])
+
+    @staticmethod
+    def styles_bytes(styles, events):
+        """Returns size of the parts of SSA document which depend on override tags of events: lines of styles, and styles and override tags of events.
+
+        Args:
+            styles (str): Lines of styles, see :meth:`ssa_repr_styles`.
+            events (list[dict[str, str]]): Fields of events referring to them.
+        Returns:
+            int: Size in bytes.
+        """
+
+        return len(styles.encode("utf-8")) + sum(
+            len(fields["style"].encode("utf-8")) + len(fields["codes"].encode("utf-8")) for fields in events
+        )
+
+    def ssa_repr_document(self, events, ssa_repr_config, styles=None):
+        """Creates contents of SSA document out of fields of its events.
+
+        Args:
+            events (list[dict[str, str]]): See :meth:`ssa_repr_events`.
+            ssa_repr_config (dict): See :attr:`SVG.default_ssa_repr_config`.
+            styles (str): Lines of styles which ``events`` already refer to, see :meth:`ssa_repr_styles`; if ``None``, they are made here.
+        Returns:
+            str: Contents of SSA document.
+        """
+
+        if styles is None:
+            styles, events = self.ssa_repr_styles(events, ssa_repr_config)
+        ssa = [self.ssa_repr_header(ssa_repr_config, styles)]
+        event_template = ssa_repr_config["event_template"]
+        start = ssa_repr_config["start"]
+        end = ssa_repr_config["end"]
+        for fields in events:
+            ssa.append(event_template.format(layer=0, start=start, end=end, **fields))
         return "\n".join(ssa)
@@ -0,0 +1,112 @@
+"""Logic for post-processing of SSA drawings, i.e. strings like ``m 0 0 l 10 0 b 10 10 0 10 0 0``."""
+
+
+import re
+
+
+bord = re.compile(r"\\bord([0-9.]+(?:e[-+]?[0-9]+)?)")
+
+
+def parse_subpaths(drwng):
+    """Splits SSA drawing into subpaths, each of which starts with ``m``.
+
+    Args:
+        drwng (str): SSA drawing.
+    Returns:
+        list[tuple[list[str], int, tuple[float, float, float, float]]]: Tokens of subpath, its number of points, and its bounding box ``(min_x, min_y, max_x, max_y)`` of all points, including control ones.
+    """
+
+    subpaths = []
+    tokens = []
+    coords = []
+    for token in drwng.split():
+        if token == "m" and tokens:
+            subpaths.append(_subpath(tokens, coords))
+            tokens = []
+            coords = []
+        tokens.append(token)
+        if token not in ("m", "n", "l", "b", "s", "p", "c"):
+            coords.append(float(token))
+    if tokens:
+        subpaths.append(_subpath(tokens, coords))
+    return subpaths
+
+
+def _subpath(tokens, coords):
+    xs = coords[0::2] or [0.0]
+    ys = coords[1::2] or [0.0]
+    return tokens, len(coords) // 2, (min(xs), min(ys), max(xs), max(ys))
+
+
+def group_independent_subpaths(subpaths, margin):
+    """Groups subpaths which may interact with each other, so that each group could be rendered separately.
+
+    Under ``nonzero`` fill rule two subpaths can't affect each other's winding numbers if their bounding boxes don't overlap, so bounding boxes are used as a conservative test. ``margin`` is added to boxes to account for border and antialiasing.
+
+    Args:
+        subpaths (list): See :func:`parse_subpaths`.
+        margin (float): Margin around bounding boxes, in units of drawing.
+    Returns:
+        list[list[int]]: Groups of indices of subpaths, in order of their first subpath; indices within group are sorted.
+    """
+
+    parents = list(range(len(subpaths)))
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    # Sweep along X: only boxes whose X-intervals overlap are compared by Y.
+    order = sorted(range(len(subpaths)), key=lambda i: subpaths[i][2][0])
+    active = []
+    for i in order:
+        min_x, min_y, _, max_y = subpaths[i][2]
+        active = [j for j in active if subpaths[j][2][2] + margin >= min_x - margin]
+        for j in active:
+            _, other_min_y, _, other_max_y = subpaths[j][2]
+            if other_min_y - margin <= max_y + margin and min_y - margin <= other_max_y + margin:
+                parents[find(j)] = find(i)
+        active.append(i)
+
+    groups = {}
+    for i in range(len(subpaths)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values(), key=lambda group: group[0])
+
+
+def split_drawing(drwng, max_points=0, max_bytes=0, margin=0.0):
+    """Splits SSA drawing at subpath boundaries into several drawings, none of which exceeds given thresholds unless it consists of subpaths that can't be separated.
+
+    Args:
+        drwng (str): SSA drawing.
+        max_points (int): Max number of points per drawing; ``0`` means no limit.
+        max_bytes (int): Max length of drawing; ``0`` means no limit.
+        margin (float): See :func:`group_independent_subpaths`.
+    Returns:
+        list[str]: Drawings, or just ``[drwng]`` if it doesn't exceed thresholds.
+    """
+
+    if (not max_points or drwng.count(" ") < max_points) and (not max_bytes or len(drwng) <= max_bytes):
+        return [drwng]
+    subpaths = parse_subpaths(drwng)
+    chunks = []
+    chunk = []
+    chunk_points = chunk_bytes = 0
+    for group in group_independent_subpaths(subpaths, margin):
+        tokens = [token for i in group for token in subpaths[i][0]]
+        points = sum(subpaths[i][1] for i in group)
+        size = sum(len(token) + 1 for token in tokens)
+        if chunk and (
+            (max_points and chunk_points + points > max_points) or (max_bytes and chunk_bytes + size > max_bytes)
+        ):
+            chunks.append(" ".join(chunk))
+            chunk = []
+            chunk_points = chunk_bytes = 0
+        chunk.extend(tokens)
+        chunk_points += points
+        chunk_bytes += size
+    if chunk:
+        chunks.append(" ".join(chunk))
+    return chunks
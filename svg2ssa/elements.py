@@ -2,24 +2,35 @@
 
 
 import re
+from contextvars import ContextVar
+from math import sqrt
 
 from .core import SVGContainerEntity
-from .attributes.misc import SVGId, SVGStrokeWidth
+from .attributes.misc import SVGId, SVGStrokeWidth, SVGVisibility
 from .attributes.color import SVGColor, SVGFill, SVGStroke
 from .attributes.opacity import SVGOpacity, SVGFillOpacity, SVGStrokeOpacity
-from .attributes.transform import SVGTransform, SVGTrafoRotate, SVGTrafoScale
+from .attributes.transform import SVGTransform, SVGTrafoRotate, SVGTrafoScale, SVGTrafoTranslate
 from .attributes.d import SVGD
+from .cost import estimate_event_cost
+from .utilities import NUMBER, convert_svglength_to_pixels
+from .errors import SVGAttributeError
+
+
+parse_stats = ContextVar("parse_stats", default=None)
+"""contextvars.ContextVar: Counter of raw values of attrs ``read``, and of those ``parsed``, by models of document being read or converted, see :attr:`svg2ssa.document.SVG.parse_stats`; ``None`` outside of it. Context is local to thread, so that documents read by several threads at once count only their own attrs."""
 
 
 class SVGElementMixin(SVGContainerEntity):
     """Contains common attributes and methods to model SVG elements."""
 
+    __slots__ = ("origin",)
+
     atts_color = {"color", "fill", "stroke"}
     """set[str]: Set of color attrs."""
     atts_opacity = {"opacity", "fill-opacity", "stroke-opacity"}
     """set[str]: Set of opacity attrs."""
-    atts_rest = {"stroke-width"}
-    """set[str]: Other attrs that can be translated to SSA."""
+    atts_rest = {"stroke-width", "visibility"}
+    """set[str]: Other attrs that can be translated to SSA, or that decide whether element is emitted."""
     atts_style = atts_color | atts_opacity | atts_rest
     """set[str]: Attrs that can be contained by attr ``style``."""
     atts_to_class_mapping = {
@@ -31,14 +42,25 @@ class SVGElementMixin(SVGContainerEntity):
         "stroke": SVGStroke,
         "stroke-opacity": SVGStrokeOpacity,
         "stroke-width": SVGStrokeWidth,
+        "visibility": SVGVisibility,
         "d": SVGD,
         "id": SVGId,
     }
     """dict[str, type]: Maps all attrs, that can be specified in SVG elements, to their classes."""
+    atts_accumulated = {"transform", "opacity", "fill-opacity", "stroke-opacity"}
+    """set[str]: Attrs whose values are combined with those of ancestors, rather than overridden by own value."""
+
+    def __init__(self, data, origin=None):
+        super().__init__(data)
+        self.origin = origin
+        """tuple[str, str, int, int]: Local name, ``id``, ordinal number and line number of element whose own attrs are kept raw in :attr:`data`, see :meth:`parsed`; ``None`` if unknown."""
 
     @classmethod
     def from_raw_data(cls, data):
-        """Instantiates classes to model SVG elements, from mapping of attrs in ``data``."""
+        """Instantiates classes to model SVG elements, from mapping of attrs in ``data``.
+
+        Values of attrs are kept raw until they are accessed with :meth:`parsed`, so that values overridden by descendants, or belonging to elements which won't be emitted, are never parsed.
+        """
 
         # Filter out unsupported attrs.
         atts = {key: val for key, val in data.items() if key in cls.supported}
@@ -51,25 +73,66 @@ class SVGElementMixin(SVGContainerEntity):
                     if key in cls.atts_style:
                         atts[key] = val
             del atts["style"]
-        # Process attrs.
-        atts = {key: cls.atts_to_class_mapping[key].from_raw_data(val) for key, val in atts.items()}
+        # Absent attr is what ``inherit`` means for ``visibility``, since value of ancestor is merged then, see :meth:`__add__`.
+        if atts.get("visibility", "").strip() == "inherit":
+            del atts["visibility"]
+        stats = parse_stats.get()
+        if stats is not None:
+            stats["read"] += len(atts)
         return cls(atts)
 
+    def parsed(self, key):
+        """Returns model of attr ``key``, parsing its raw value on first access. Parsed value replaces raw one.
+
+        Raw value is always element's own, as values of ancestors are parsed when they are merged, see :meth:`__add__`. Hence error of parsing, which may surface only when a descendant is merged or converted, carries :attr:`origin`, so that it's reported against element that owns malformed attr.
+
+        Args:
+            key (str): Name of attr.
+        Returns:
+            svg2ssa.core.SVGBasicEntity: Model of attr.
+        """
+
+        val = self.data[key]
+        if isinstance(val, str):
+            stats = parse_stats.get()
+            if stats is not None:
+                stats["parsed"] += 1
+            try:
+                val = self.atts_to_class_mapping[key].from_raw_data(val)
+            except SVGAttributeError as err:
+                err.attribute = key
+                err.origin = self.origin
+                raise
+            except (TypeError, ValueError) as err:
+                raise SVGAttributeError(str(err), key, origin=self.origin) from err
+            self.data[key] = val
+        return val
+
+    def copy(self):
+        """Returns shallow copy of the model, so that attrs merged into the copy (see :meth:`__add__`) won't affect the original one."""
+
+        return self.__class__(dict(self.data), self.origin)
+
     # Beware of mutability issues.
     def __add__(self, other):
         curr = self.data
         prev = other.data
         for key in prev:
             if key in curr:
-                curr[key] += prev[key]
+                # Own value of attr that isn't accumulated wins, so value of ancestor doesn't even need to be parsed.
+                if key in self.atts_accumulated:
+                    curr[key] = self.parsed(key) + other.parsed(key)
             else:
-                curr[key] = prev[key]
+                # Parsed value is stored by ancestor, so that it's parsed once for all of its descendants.
+                curr[key] = other.parsed(key)
         return self
 
 
 class SVGElementG(SVGElementMixin):
     """Model for SVG element ``g``."""
 
+    __slots__ = ()
+
     supported = {"transform", "style"} | SVGElementMixin.atts_style
     """set[str]: Set of attrs supported by SVG element ``g``."""
 
@@ -79,55 +142,191 @@ class SVGElementG(SVGElementMixin):
 class SVGElementPath(SVGElementMixin):
     """Model for SVG element ``path``."""
 
+    __slots__ = ()
+
     supported = {"d", "id", "transform", "style"} | SVGElementMixin.atts_style
     """set[str]: Set of attrs supported by SVG element ``path``."""
 
     svg_name = "path"
 
-    def ssa_repr(self, ssa_repr_config):
-        # Process exceptional cases.
-        atts = self.data
-        # Process trafos.
-        if "transform" in atts:
-            trafos = atts["transform"]
-            # Create ``\org`` if it is absent so that each next SSA layer automatically layed on top of previous w/o any shifting.
-            # ATM only VSFilter behaves like this, maybe libass as well, but not ffdshow subtitles filter.
-            # ``\pos`` also will do the trick, but if it's not ``\pos(0,0)``.
-            if trafos.contains_obj_with_svg_name("rotate"):
-                if trafos.contains_obj_with_svg_name("translate"):
-                    for i, trafo in enumerate(trafos):
-                        # If there's empty ``\pos``, then there's no need in it, so remove ``\pos``, -- there's still ``\org`` after all.
-                        if trafo.svg_name == "translate" and trafo.data[0] == 0 and trafo.data[1] == 0:
-                            del trafos.data[i]
-                            break
-                else:
-                    # There's still ``\org``, so everything is OK.
-                    pass
-            else:
-                if trafos.contains_obj_with_svg_name("translate"):
-                    for i, trafo in enumerate(trafos):
-                        # If there's empty ```\pos``, then there's no need in it, so remove ``\pos``, but add ``\org(0,0)`` to maintain collision detection override.
-                        if trafo.svg_name == "translate" and trafo.data[0] == 0 and trafo.data[1] == 0:
-                            del trafos.data[i]
-                            atts["transform"] = trafos + SVGTrafoRotate((0, 0, 0))
-                            break
-                else:
-                    # There's no ``\org``, so add it.
-                    atts["transform"] = trafos + SVGTrafoRotate((0, 0, 0))
-            # Create CTM for path to emulate subpixel precision.
-            if trafos.contains_obj_with_svg_name("matrix"):
-                val = 2 ** (ssa_repr_config["magnification_level"] - 1)
-                path_ctm = SVGTrafoScale((val, val)).matrix() + trafos.data[0]
+    trafos_bakeable = ("rotate", "scale", "translate")
+    """tuple[str]: Trafos which have SSA equivalents, so that baking them is optional."""
+
+    @staticmethod
+    def bake_trafos(transform, val, unnecessary_transformations):
+        """Splits trafos of path into those converted to override tags and CTM baked into its coords.
+
+        Args:
+            transform (svg2ssa.attributes.transform.SVGTransform): Trafos of path, if any; it isn't modified.
+            val (int): Magnification of coordinate system.
+            unnecessary_transformations (Iterable[str]): Trafos to be baked, besides those w/o SSA equivalents.
+        Returns:
+            tuple[svg2ssa.attributes.transform.SVGTransform, svg2ssa.attributes.transform.SVGTrafoMatrix]: Trafos to be converted to override tags, and CTM.
+        """
+
+        # Create CTM for path to emulate subpixel precision.
+        path_ctm = SVGTrafoScale((val, val)).matrix()
+        if transform is None:
+            # Create trafos with ``\org(0,0)``.
+            return SVGTransform([SVGTrafoRotate((0, 0, 0))]), path_ctm
+        # Lists of trafos are shared between elements and conversions, so they are copied before they are modified.
+        trafos = SVGTransform(list(transform.data))
+        # Create ``\org`` if it is absent so that each next SSA layer automatically layed on top of previous w/o any shifting.
+        # ATM only VSFilter behaves like this, maybe libass as well, but not ffdshow subtitles filter.
+        # ``\pos`` also will do the trick, but if it's not ``\pos(0,0)``.
+        if trafos.contains_obj_with_svg_name("rotate"):
+            if trafos.contains_obj_with_svg_name("translate"):
+                for i, trafo in enumerate(trafos):
+                    # If there's empty ``\pos``, then there's no need in it, so remove ``\pos``, -- there's still ``\org`` after all.
+                    if trafo.svg_name == "translate" and trafo.data[0] == 0 and trafo.data[1] == 0:
+                        del trafos.data[i]
+                        break
             else:
-                val = 2 ** (ssa_repr_config["magnification_level"] - 1)
-                path_ctm = SVGTrafoScale((val, val)).matrix()
+                # There's still ``\org``, so everything is OK.
+                pass
         else:
-            # Create trafos with ``\org(0,0)`` and CTM for path.
-            atts["transform"] = SVGTransform([SVGTrafoRotate((0, 0, 0))])
-            val = 2 ** (ssa_repr_config["magnification_level"] - 1)
-            path_ctm = SVGTrafoScale((val, val)).matrix()
+            if trafos.contains_obj_with_svg_name("translate"):
+                for i, trafo in enumerate(trafos):
+                    # If there's empty ```\pos``, then there's no need in it, so remove ``\pos``, but add ``\org(0,0)`` to maintain collision detection override.
+                    if trafo.svg_name == "translate" and trafo.data[0] == 0 and trafo.data[1] == 0:
+                        del trafos.data[i]
+                        trafos = trafos + SVGTrafoRotate((0, 0, 0))
+                        break
+            else:
+                # There's no ``\org``, so add it.
+                trafos = trafos + SVGTrafoRotate((0, 0, 0))
+        # Trafos w/o SSA equivalent are collapsed into matrix at the start of the list, which is baked into path's coords. Collapsing again during conversion of trafos to SSA changes nothing.
+        trafos.collapse_consecutive_objects()
+        trafos.collapse_unnecessary_trafos(unnecessary_transformations)
+        if trafos and trafos.data[0].svg_name == "matrix":
+            path_ctm += trafos.data[0]
+            del trafos.data[0]
+        return trafos, path_ctm
+
+    def choose_baked_trafos(self, atts, val, ssa_repr_config):
+        """Chooses trafos to be baked into coords of path, when ``unnecessary_transformations`` is ``auto``.
+
+        Each combo of trafos present in path is tried. Combo is rejected if override tags it leaves render path differently from SVG, i.e. if corners of bounding box of path, transformed as renderer would do it (see :meth:`svg2ssa.attributes.transform.SVGTransform.rendered_matrix`), are farther than ``magnification_tolerance`` px from where fully baked path puts them. This accounts for rounding of tags, for their fixed order in SSA, and for rounding errors of drawing magnified by ``\\fscx``. Out of the rest, combo with the lowest estimated cost of rendering (see :func:`svg2ssa.cost.estimate_event_cost`; border and alpha are ignored, since they don't depend on combo), then with the shortest output, is chosen.
+
+        Args:
+            atts (dict): Parsed attrs of path, see :meth:`ssa_repr`.
+            val (int): Magnification of coordinate system.
+            ssa_repr_config (dict): See :attr:`svg2ssa.document.SVG.default_ssa_repr_config`.
+        Returns:
+            frozenset[str]: Trafos to be baked.
+        """
+
+        transform = atts.get("transform")
+        present = {trafo.svg_name for trafo in transform} & set(self.trafos_bakeable) if transform else set()
+        if not present:
+            return frozenset()
+        level = ssa_repr_config["magnification_level"]
+        tolerance = ssa_repr_config["magnification_tolerance"]
+        # Error of rounding of drawing, in px.
+        rounding = tolerance if level == "auto" else 0.5 / val
+        combos = [
+            frozenset(name for i, name in enumerate(sorted(present)) if mask >> i & 1)
+            for mask in range(1 << len(present))
+        ]
+        candidates = []
+        for combo in combos:
+            trafos, ctm = self.bake_trafos(transform, val, combo)
+            trans = trafos.ssa_repr({**ssa_repr_config, "unnecessary_transformations": combo})
+            candidates.append((combo, trans, ctm))
+
+        # Bounding box is found in coords of fully baked path, which are memoized for its conversion anyway, and then mapped back to user space; it still encloses the path, since mapping is affine.
+        ctma, ctmb, ctmc, ctmd = candidates[-1][2].data[:4]
+        det = ctma * ctmd - ctmb * ctmc
+        linear = (ctma, ctmb, ctmc, ctmd) if det else (1, 0, 0, 1)
+        xs, ys = [], []
+        for _, coords in atts["d"].memoized_geometry(linear):
+            xs.extend(coords[::2])
+            ys.extend(coords[1::2])
+        offset_x, offset_y = atts["d"].offset(linear)
+        corners = (
+            [(x + offset_x, y + offset_y) for x in (min(xs), max(xs)) for y in (min(ys), max(ys))] if xs else [(0, 0)]
+        )
+        if det:
+            corners = [((ctmd * x - ctmc * y) / det, (ctma * y - ctmb * x) / det) for x, y in corners]
+
+        exact = transform.matrix().data
+        errors = []
+        for _, trans, ctm in candidates:
+            tags = SVGTransform.rendered_matrix(trans)
+            rendered = (tags + SVGTrafoScale((1 / val, 1 / val)).matrix() + ctm).data
+            worst = 0.0
+            for x, y in corners:
+                dx = rendered[0] * x + rendered[2] * y + rendered[4] - (exact[0] * x + exact[2] * y + exact[4])
+                dy = rendered[1] * x + rendered[3] * y + rendered[5] - (exact[1] * x + exact[3] * y + exact[5])
+                worst = max(worst, sqrt(dx * dx + dy * dy))
+            # Rounding error of drawing grows along with its scale by tags.
+            tag_a, tag_b, tag_c, tag_d, _, _ = tags.data
+            errors.append(worst + rounding * max(abs(tag_a) + abs(tag_c), abs(tag_b) + abs(tag_d), 1))
+        accepted = [candidate for candidate, err in zip(candidates, errors) if err <= errors[-1] + tolerance]
+        if len(accepted) == 1:
+            return accepted[0][0]
+
+        # Fully baked candidate is always accepted, since it's the reference for errors.
+        best_key, best_combo = None, accepted[-1][0]
+        for combo, trans, ctm in accepted:
+            d = SVGD(atts["d"].data, atts["d"].raw, ctm, atts["d"].origin)
+            if level == "auto":
+                m_lev, drwng = d.ssa_repr_adaptive(ssa_repr_config)
+            else:
+                m_lev, drwng = level, d.ssa_repr(ssa_repr_config)
+            cost = estimate_event_cost(dict(trans=trans, drwng=drwng, m_lev=m_lev, codes=""))["cost"]
+            key = (cost, len(trans) + len(drwng))
+            if best_key is None or key < best_key:
+                best_key, best_combo = key, combo
+        return best_combo
+
+    def overlaps(self, region):
+        """Returns whether path may be visible within region of canvas, judging by its bounding box, so that path outside of region could be skipped w/o converting it, or even parsing its ``d``, see :meth:`svg2ssa.attributes.d.SVGD.scan_bounding_box`.
+
+        Box is mapped to canvas by CTM of path, and is expanded by its ``stroke-width`` and one more pixel of antialiasing. Path whose box can't be found is assumed to overlap region, so that conversion reports its errors.
+
+        Args:
+            region (tuple[float, float, float, float]): X and y of top left corner, width and height of region, in px.
+        Returns:
+            bool: Whether path overlaps region.
+        """
+
+        d = self.data["d"]
+        box = SVGD.scan_bounding_box(d) if isinstance(d, str) else d.bounding_box()
+        if box is None:
+            return True
+        min_x, min_y, max_x, max_y = box
+        if "transform" in self.data:
+            # Box of affinely mapped box is the sum of extents of mapped sides.
+            ctma, ctmb, ctmc, ctmd, ctme, ctmf = self.parsed("transform").matrix().data
+            low_ax, high_ax = sorted((ctma * min_x, ctma * max_x))
+            low_cy, high_cy = sorted((ctmc * min_y, ctmc * max_y))
+            low_bx, high_bx = sorted((ctmb * min_x, ctmb * max_x))
+            low_dy, high_dy = sorted((ctmd * min_y, ctmd * max_y))
+            min_x, max_x = low_ax + low_cy + ctme, high_ax + high_cy + ctme
+            min_y, max_y = low_bx + low_dy + ctmf, high_bx + high_dy + ctmf
+        margin = (self.parsed("stroke-width").data if "stroke-width" in self.data else 0.0) + 1
+        x, y, width, height = region
+        return (
+            min_x - margin <= x + width and max_x + margin >= x and min_y - margin <= y + height and max_y + margin >= y
+        )
+
+    def ssa_repr(self, ssa_repr_config):
+        # Process exceptional cases. Models of attrs are shared between elements and conversions, so they are processed within a shallow copy of attrs.
+        atts = {key: self.parsed(key) for key in self.data}
+        # Magnification of coordinate system emulates subpixel precision. With ``auto`` it's chosen for each path by :meth:`SVGD.ssa_repr_adaptive`.
+        level = ssa_repr_config["magnification_level"]
+        val = 1 if level == "auto" else 2 ** (level - 1)
+        # Process trafos.
+        baked = None
+        if "auto" in ssa_repr_config["unnecessary_transformations"]:
+            baked = self.choose_baked_trafos(atts, val, ssa_repr_config)
+            ssa_repr_config = {**ssa_repr_config, "unnecessary_transformations": baked}
+        atts["transform"], path_ctm = self.bake_trafos(
+            atts.get("transform"), val, ssa_repr_config["unnecessary_transformations"]
+        )
         # Process path.
-        atts["d"].ctm = path_ctm
+        atts["d"] = SVGD(atts["d"].data, atts["d"].raw, path_ctm, atts["d"].origin)
         # Process color.
         # ``fill`` attribute has higher priority over ``color``!
         if "fill" in atts:
@@ -162,4 +361,239 @@ class SVGElementPath(SVGElementMixin):
         # Process ``id``.
         if not "id" in atts:
             atts["id"] = SVGId("")
-        return {key: att.ssa_repr(ssa_repr_config) for key, att in atts.items()}
+        ssa = {}
+        for key, att in atts.items():
+            if key == "d" and level == "auto":
+                ssa["magnification_level"], ssa[key] = att.ssa_repr_adaptive(ssa_repr_config)
+            else:
+                ssa[key] = att.ssa_repr(ssa_repr_config)
+        if baked is not None and "transform" in self.data:
+            ssa["baked_trafos"] = baked
+        return ssa
+
+
+class SVGElementShapeMixin(SVGElementPath):
+    """Contains common logic to model basic shapes, whose attr ``d`` is built right out of their numeric attrs, w/o textual ``d`` to be parsed."""
+
+    __slots__ = ()
+
+    supported = {"id", "transform", "style"} | SVGElementMixin.atts_style
+    """set[str]: Set of attrs supported by basic shapes, except those in :attr:`atts_geometry`."""
+
+    atts_geometry = ()
+    """tuple[str]: Attrs which define geometry of shape."""
+
+    kappa = 4 * (sqrt(2) - 1) / 3
+    """float: Distance from end point to control point of cubic Bezier curve approximating quarter of unit circle."""
+
+    @classmethod
+    def from_raw_data(cls, data):
+        element = super().from_raw_data(data)
+        # Raw values of geometric attrs act as raw ``d`` for memos of :class:`SVGD`, so that repeated shapes are built and converted once, same as repeated paths.
+        key = (cls.svg_name,) + tuple(data.get(att) for att in cls.atts_geometry)
+        parsed = SVGD.parse_memo.get(key)
+        if parsed is None:
+            parsed = cls.segments(data)
+            SVGD.parse_memo[key] = parsed
+        element.data["d"] = SVGD(parsed, key)
+        return element
+
+    @classmethod
+    def segments(cls, data):
+        """Builds segments of shape in the format of parsed attr ``d``, see :class:`svg2ssa.attributes.d.S2SDYacc`.
+
+        Args:
+            data (dict[str, str]): Attributes of an element.
+        Returns:
+            list[list]: Segments with absolute coords; empty list if shape isn't rendered.
+        """
+
+        raise NotImplementedError(f"{cls.__name__}: 'segments' class method is not redefined.")
+
+    @staticmethod
+    def length(data, att):
+        """Returns length from attr ``att`` of ``data`` in pixels, or ``0.0`` if it's absent."""
+
+        if att not in data:
+            return 0.0
+        try:
+            return convert_svglength_to_pixels(data[att])
+        except TypeError as err:
+            raise SVGAttributeError(str(err), att) from err
+
+    @classmethod
+    def ellipse(cls, cx, cy, rx, ry):
+        """Builds four cubic Bezier curves approximating ellipse, starting at ``(cx + rx, cy)``, as SVG Rec. says."""
+
+        kx = cls.kappa * rx
+        ky = cls.kappa * ry
+        return [
+            ["M", cx + rx, cy],
+            ["C", cx + rx, cy + ky, cx + kx, cy + ry, cx, cy + ry],
+            ["C", cx - kx, cy + ry, cx - rx, cy + ky, cx - rx, cy],
+            ["C", cx - rx, cy - ky, cx - kx, cy - ry, cx, cy - ry],
+            ["C", cx + kx, cy - ry, cx + rx, cy - ky, cx + rx, cy],
+        ]
+
+
+class SVGElementRect(SVGElementShapeMixin):
+    """Model for SVG element ``rect``."""
+
+    __slots__ = ()
+
+    atts_geometry = ("x", "y", "width", "height", "rx", "ry")
+
+    svg_name = "rect"
+
+    @classmethod
+    def segments(cls, data):
+        x = cls.length(data, "x")
+        y = cls.length(data, "y")
+        w = cls.length(data, "width")
+        h = cls.length(data, "height")
+        if w <= 0 or h <= 0:
+            return []
+        # If only one radius is specified, the other one is equal to it.
+        rx = cls.length(data, "rx" if "rx" in data else "ry")
+        ry = cls.length(data, "ry" if "ry" in data else "rx")
+        rx = min(max(rx, 0), w / 2)
+        ry = min(max(ry, 0), h / 2)
+        if rx == 0 or ry == 0:
+            return [["M", x, y], ["L", x + w, y], ["L", x + w, y + h], ["L", x, y + h]]
+        kx = cls.kappa * rx
+        ky = cls.kappa * ry
+        return [
+            ["M", x + rx, y],
+            ["L", x + w - rx, y],
+            ["C", x + w - rx + kx, y, x + w, y + ry - ky, x + w, y + ry],
+            ["L", x + w, y + h - ry],
+            ["C", x + w, y + h - ry + ky, x + w - rx + kx, y + h, x + w - rx, y + h],
+            ["L", x + rx, y + h],
+            ["C", x + rx - kx, y + h, x, y + h - ry + ky, x, y + h - ry],
+            ["L", x, y + ry],
+            ["C", x, y + ry - ky, x + rx - kx, y, x + rx, y],
+        ]
+
+
+class SVGElementCircle(SVGElementShapeMixin):
+    """Model for SVG element ``circle``."""
+
+    __slots__ = ()
+
+    atts_geometry = ("cx", "cy", "r")
+
+    svg_name = "circle"
+
+    @classmethod
+    def segments(cls, data):
+        r = cls.length(data, "r")
+        if r <= 0:
+            return []
+        return cls.ellipse(cls.length(data, "cx"), cls.length(data, "cy"), r, r)
+
+
+class SVGElementEllipse(SVGElementShapeMixin):
+    """Model for SVG element ``ellipse``."""
+
+    __slots__ = ()
+
+    atts_geometry = ("cx", "cy", "rx", "ry")
+
+    svg_name = "ellipse"
+
+    @classmethod
+    def segments(cls, data):
+        rx = cls.length(data, "rx")
+        ry = cls.length(data, "ry")
+        if rx <= 0 or ry <= 0:
+            return []
+        return cls.ellipse(cls.length(data, "cx"), cls.length(data, "cy"), rx, ry)
+
+
+class SVGElementLine(SVGElementShapeMixin):
+    """Model for SVG element ``line``."""
+
+    __slots__ = ()
+
+    atts_geometry = ("x1", "y1", "x2", "y2")
+
+    svg_name = "line"
+
+    @classmethod
+    def segments(cls, data):
+        return [
+            ["M", cls.length(data, "x1"), cls.length(data, "y1")],
+            ["L", cls.length(data, "x2"), cls.length(data, "y2")],
+        ]
+
+
+class SVGElementPolyline(SVGElementShapeMixin):
+    """Model for SVG element ``polyline``.
+
+    Since SSA drawings are always closed, it's the same as ``polygon``.
+    """
+
+    __slots__ = ()
+
+    atts_geometry = ("points",)
+
+    svg_name = "polyline"
+
+    number = re.compile(NUMBER)
+    """re.Pattern: Coords within attr ``points``."""
+
+    @classmethod
+    def segments(cls, data):
+        coords = [float(coord) for coord in cls.number.findall(data.get("points", ""))]
+        # Odd number of coords is an error, in which case the last one is ignored.
+        segs = [["L", coords[i], coords[i + 1]] for i in range(0, len(coords) - 1, 2)]
+        if segs:
+            segs[0][0] = "M"
+        return segs
+
+
+class SVGElementPolygon(SVGElementPolyline):
+    """Model for SVG element ``polygon``."""
+
+    __slots__ = ()
+
+    svg_name = "polygon"
+
+
+class SVGElementUse(SVGElementMixin):
+    """Model for SVG element ``use``, i.e. reference to another element which is rendered in place of ``use``.
+
+    Referenced element isn't stored here, only its ``id`` in :attr:`href`, as it isn't an attr inherited by instances. ``x`` and ``y`` are appended to ``transform`` as ``translate(x,y)``, as SVG Rec. says.
+    """
+
+    __slots__ = ("href",)
+
+    supported = {"transform", "style"} | SVGElementMixin.atts_style
+    """set[str]: Set of attrs supported by SVG element ``use``."""
+
+    svg_name = "use"
+
+    xlink_href = "{http://www.w3.org/1999/xlink}href"
+    """str: Qualified name of attr ``xlink:href``, used by SVG Rec. 1.1 instead of ``href``."""
+
+    def __init__(self, data, href=None, origin=None):
+        super().__init__(data, origin)
+        self.href = href
+        """str: ``id`` of referenced element, or ``None`` if it's not a reference within the same document."""
+
+    @classmethod
+    def from_raw_data(cls, data):
+        use = super().from_raw_data(data)
+        href = data.get("href", data.get(cls.xlink_href, ""))
+        use.href = href[1:] if href.startswith("#") else None
+        tx = convert_svglength_to_pixels(data.get("x", "0"))
+        ty = convert_svglength_to_pixels(data.get("y", "0"))
+        if tx or ty:
+            trafo = SVGTrafoTranslate((tx, ty))
+            use.data["transform"] = (
+                use.parsed("transform") + trafo if "transform" in use.data else SVGTransform([trafo])
+            )
+        return use
+
+    def copy(self):
+        return self.__class__(dict(self.data), self.href, self.origin)
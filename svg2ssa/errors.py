@@ -0,0 +1,132 @@
+"""Exceptions raised when SVG document's elements or attributes are malformed or unsupported."""
+
+
+class SVG2SSAError(Exception):
+    """Base class for all errors of conversion from SVG to SSA."""
+
+
+class SVGAttributeError(SVG2SSAError, ValueError):
+    """Value of attr is malformed or unsupported.
+
+    Args:
+        message (str): Description of error.
+        attribute (str): Name of attr; set by model of element if it isn't known where error is raised.
+        offset (int): Position within value of attr where error was found, if known.
+        origin (tuple[str, str, int, int]): Element that owns attr; set by model of element, see :attr:`svg2ssa.elements.SVGElementMixin.origin`.
+    """
+
+    def __init__(self, message, attribute=None, offset=None, origin=None):
+        super().__init__(message)
+        self.attribute = attribute
+        """str: Name of attr."""
+        self.offset = offset
+        """int: Position within value of attr where error was found."""
+        self.origin = origin
+        """tuple[str, str, int, int]: Local name, ``id``, ordinal number and line number of element that owns attr, if known."""
+
+    def __reduce__(self):
+        # Error may be raised in a worker process, see :mod:`svg2ssa.chunks`.
+        return self.__class__, (str(self), self.attribute, self.offset)
+
+
+class SVGElementError(SVG2SSAError):
+    """Element can't be converted because of another error, which is available as ``__cause__``.
+
+    Raised by :class:`svg2ssa.document.SVG` when ``on_error`` is ``fail``, and collected in :attr:`svg2ssa.document.SVG.errors` when it's ``skip``.
+
+    Args:
+        cause (Exception): Original error.
+        element (str): Local name of element.
+        element_id (str): Attr ``id`` of element, if any.
+        position (int): Ordinal number of element in document order, starting from ``1``.
+        line (int): Line number of element in SVG file, if provided by XML parser.
+    """
+
+    def __init__(self, cause, element, element_id=None, position=None, line=None):
+        self.element = element
+        """str: Local name of element."""
+        self.element_id = element_id
+        """str: Attr ``id`` of element."""
+        self.position = position
+        """int: Ordinal number of element in document order."""
+        self.line = line
+        """int: Line number of element in SVG file."""
+        self.attribute = getattr(cause, "attribute", None)
+        """str: Name of malformed attr, if known."""
+        self.offset = getattr(cause, "offset", None)
+        """int: Position within value of malformed attr, if known."""
+        self.reason = f"{cause.__class__.__name__}: {cause!s}"
+        """str: Type and message of original error."""
+        super().__init__(self.describe())
+        self.__cause__ = cause
+
+    def __reduce__(self):
+        # Error may be raised in a worker process, see :mod:`svg2ssa.chunks`.
+        return self.__class__, (self.__cause__, self.element, self.element_id, self.position, self.line)
+
+    def moved(self, offset):
+        """Returns the same error, whose element's ordinal number is greater by ``offset``, e.g. because it was found in a chunk of document, see :mod:`svg2ssa.chunks`."""
+
+        # Constructor isn't used, because ``__cause__`` of error raised in worker process is replaced by its traceback.
+        error = Exception.__new__(self.__class__)
+        error.__dict__.update(self.__dict__)
+        if self.position is not None:
+            error.position += offset
+        error.args = (error.describe(),)
+        error.__cause__ = self.__cause__
+        return error
+
+    def describe(self):
+        """Returns one-line description of error, suitable for error report."""
+
+        where = [f"element #{self.position}"] if self.position is not None else []
+        if self.line is not None:
+            where.append(f"line {self.line}")
+        what = f"<{self.element}" + (f' id="{self.element_id}"' if self.element_id else "") + ">"
+        if where:
+            what += f" ({', '.join(where)})"
+        if self.attribute is not None:
+            what += f", attr '{self.attribute}'"
+            if self.offset is not None:
+                what += f" at offset {self.offset}"
+        reason = " ".join(self.reason.split())
+        return f"{what}: {reason}"
+
+    def to_dict(self):
+        """Returns error as a dict suitable for serialization to JSON."""
+
+        return dict(
+            element=self.element,
+            id=self.element_id,
+            position=self.position,
+            line=self.line,
+            attribute=self.attribute,
+            offset=self.offset,
+            reason=self.reason,
+        )
+
+
+class SSACostError(SVG2SSAError):
+    """Some SSA events are estimated to be more expensive to render than budget allows.
+
+    Raised by :class:`svg2ssa.document.SVG` when ``cost_budget`` is set.
+
+    Args:
+        report (dict): See :func:`svg2ssa.cost.cost_report`.
+        filepath (str): Path to SVG file whose events are over budget, if it's one of many, see :func:`svg2ssa.batch.convert_frame`.
+    """
+
+    def __init__(self, report, filepath=""):
+        self.report = report
+        """dict: Report of costs of events, including all events over budget."""
+        self.filepath = filepath
+        """str: Path to SVG file whose events are over budget, or an empty string."""
+        where = f"'{filepath}': " if filepath else ""
+        super().__init__(
+            f"{where}{report['over_budget']} event(s) exceed cost budget of {report['budget']:,.1f}, "
+            f"the heaviest one costs {report['events'][0]['cost']:,.1f}."
+        )
+
+    def __reduce__(self):
+        # Error may be raised in a worker process, see :mod:`svg2ssa.batch`.
+        return self.__class__, (self.report, self.filepath)
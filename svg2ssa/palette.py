@@ -0,0 +1,167 @@
+"""Logic for quantization of palette of colors of SSA events.
+
+Nearly identical colors, e.g. those of bitmap traces, are replaced by one of them, so that override tags repeat, which lets events be merged and styles be reused. Distance between colors is ΔE*ab (CIE76), i.e. Euclidean distance in CIELAB, where ``1`` is roughly the smallest noticeable difference.
+"""
+
+
+import re
+from collections import Counter
+from math import sqrt
+
+
+color = re.compile(r"(\\[13]c&H)([0-9A-Fa-f]{6})(&)")
+
+
+def _linear(channel):
+    channel /= 255
+    return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _f(val):
+    return val ** (1 / 3) if val > (6 / 29) ** 3 else val / (3 * (6 / 29) ** 2) + 4 / 29
+
+
+def ssa_color_to_lab(ssa_color):
+    """Converts SSA color to CIELAB.
+
+    Args:
+        ssa_color (str): Hex color in SSA order, i.e. ``BBGGRR``.
+    Returns:
+        tuple[float, float, float]: ``L*``, ``a*`` and ``b*`` under D65.
+    """
+
+    blue, green, red = (_linear(int(ssa_color[i : i + 2], 16)) for i in (0, 2, 4))
+    x = (0.4124 * red + 0.3576 * green + 0.1805 * blue) / 0.95047
+    y = 0.2126 * red + 0.7152 * green + 0.0722 * blue
+    z = (0.0193 * red + 0.1192 * green + 0.9505 * blue) / 1.08883
+    fx, fy, fz = _f(x), _f(y), _f(z)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def delta_e(lab1, lab2):
+    """Returns ΔE*ab (CIE76) between two colors in CIELAB."""
+
+    return sqrt(sum((i - j) ** 2 for i, j in zip(lab1, lab2)))
+
+
+def count_colors(events):
+    """Counts uses of colors by override tags ``\\1c`` and ``\\3c`` of events.
+
+    Args:
+        events (Iterable[dict[str, str]]): Fields of events, see :meth:`svg2ssa.document.SVG.ssa_repr_events`.
+    Returns:
+        collections.Counter: Number of uses per color, in upper case.
+    """
+
+    counts = Counter()
+    for fields in events:
+        for _, val, _ in color.findall(fields["codes"]):
+            counts[val.upper()] += 1
+    return counts
+
+
+def build_palette(counts, max_colors=0, tolerance=0.0):
+    """Maps colors to their representatives, which are chosen among colors themselves.
+
+    First, colors are visited from the most frequent one, and each becomes representative unless there's already one within ``tolerance``, in which case it's mapped to the nearest one. Then, if there are still more than ``max_colors`` representatives, they are grouped by median cut in CIELAB, weighted by number of uses, and the most frequent representative of each group represents the whole group.
+
+    Args:
+        counts (collections.Counter): Number of uses per color, see :func:`count_colors`.
+        max_colors (int): Max number of colors in palette; ``0`` means no limit.
+        tolerance (float): Max ΔE*ab between color and its representative at the first stage; ``0`` disables the stage.
+    Returns:
+        dict[str, str]: Maps each color to its representative.
+    """
+
+    colors = sorted(counts, key=lambda key: (-counts[key], key))
+    labs = {key: ssa_color_to_lab(key) for key in colors}
+    leaders = []
+    mapping = {}
+    for key in colors:
+        nearest = None
+        if tolerance > 0:
+            distance = tolerance
+            for leader in leaders:
+                dist = delta_e(labs[key], labs[leader])
+                if dist <= distance:
+                    nearest, distance = leader, dist
+        if nearest is None:
+            leaders.append(key)
+            nearest = key
+        mapping[key] = nearest
+
+    if max_colors and len(leaders) > max_colors:
+        weights = Counter()
+        for key, leader in mapping.items():
+            weights[leader] += counts[key]
+        boxes = [leaders]
+        while len(boxes) < max_colors:
+            # Split the box with the widest range along any axis at its weighted median along that axis.
+            widest_extent, widest = None, None
+            for i, box in enumerate(boxes):
+                if len(box) < 2:
+                    continue
+                for axis in range(3):
+                    vals = [labs[key][axis] for key in box]
+                    extent = max(vals) - min(vals)
+                    if widest_extent is None or extent > widest_extent:
+                        widest_extent, widest = extent, (i, axis)
+            if widest is None:
+                break
+            i, axis = widest
+            box = sorted(boxes[i], key=lambda key: (labs[key][axis], key))
+            half = sum(weights[key] for key in box) / 2
+            cumulative = 0
+            for cut, key in enumerate(box[:-1], 1):
+                cumulative += weights[key]
+                if cumulative >= half:
+                    break
+            boxes[i : i + 1] = [box[:cut], box[cut:]]
+        representatives = {}
+        for box in boxes:
+            representative = max(box, key=lambda key: (weights[key], key))
+            for key in box:
+                representatives[key] = representative
+        mapping = {key: representatives[leader] for key, leader in mapping.items()}
+    return mapping
+
+
+def apply_palette(events, mapping):
+    """Returns copies of fields of events whose colors are replaced according to ``mapping``, see :func:`build_palette`."""
+
+    def replace(match):
+        return match.group(1) + mapping.get(match.group(2).upper(), match.group(2)) + match.group(3)
+
+    return [{**fields, "codes": color.sub(replace, fields["codes"])} for fields in events]
+
+
+def quantize_palette(events, max_colors=0, tolerance=0.0):
+    """Quantizes palette of colors of events, see :func:`build_palette`.
+
+    Args:
+        events (list[dict[str, str]]): Fields of events, see :meth:`svg2ssa.document.SVG.ssa_repr_events`.
+        max_colors (int): See :func:`build_palette`.
+        tolerance (float): See :func:`build_palette`.
+    Returns:
+        tuple[list[dict[str, str]], dict]: Fields of events using quantized palette, and report: ``palette`` as a list of colors with their number of uses, sorted by the latter; numbers of distinct ``colors`` and of distinct override strings (``codes``) before and after; and ``max_delta_e`` between color and its representative.
+    """
+
+    counts = count_colors(events)
+    mapping = build_palette(counts, max_colors, tolerance)
+    quantized = apply_palette(events, mapping)
+    uses = Counter()
+    for key, representative in mapping.items():
+        uses[representative] += counts[key]
+    max_delta = max(
+        (delta_e(ssa_color_to_lab(key), ssa_color_to_lab(val)) for key, val in mapping.items() if key != val),
+        default=0.0,
+    )
+    report = dict(
+        palette=[
+            dict(color=f"&H{key}&", uses=val) for key, val in sorted(uses.items(), key=lambda item: (-item[1], item[0]))
+        ],
+        colors=[len(counts), len(uses)],
+        codes=[len({fields["codes"] for fields in events}), len({fields["codes"] for fields in quantized})],
+        max_delta_e=round(max_delta, 2),
+    )
+    return quantized, report
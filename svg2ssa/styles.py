@@ -0,0 +1,101 @@
+"""Logic for extraction of recurring combos of colors, alphas and border of SSA events into styles of ``[V4+ Styles]``, so that events could refer to them instead of repeating the same override tags."""
+
+
+import re
+from collections import Counter
+
+
+tag = re.compile(r"\\(1c|1a|3c|3a|alpha)&H([0-9A-Fa-f]+)&|\\bord([0-9.]+(?:e[-+]?[0-9]+)?)")
+
+tags = ("1c", "1a", "3c", "3a", "bord")
+"""tuple[str]: Override tags that are moved to styles, in order of their emission."""
+
+default_style = ("s2s.default", ("FFFFFF", "00", "000000", "00", "0.0"))
+"""tuple[str, tuple[str, ...]]: Name of style defined by ``header_template``, and its values of :data:`tags`."""
+
+
+def parse_codes(codes):
+    """Finds values of :data:`tags` set by override tags of event, starting with those of :data:`default_style`.
+
+    Args:
+        codes (str): Override tags, e.g. ``\\1c&H0000FF&\\bord2.0``.
+    Returns:
+        tuple[tuple[str, ...], str]: Values of :data:`tags`, and override tags which aren't among them.
+    """
+
+    state = dict(zip(tags, default_style[1]))
+    rest = []
+    pos = 0
+    for match in tag.finditer(codes):
+        rest.append(codes[pos : match.start()])
+        pos = match.end()
+        name, val, bord = match.groups()
+        if bord is not None:
+            state["bord"] = str(float(bord))
+        elif name == "alpha":
+            state["1a"] = state["3a"] = val.upper()
+        else:
+            state[name] = val.upper()
+    rest.append(codes[pos:])
+    return tuple(state[name] for name in tags), "".join(rest)
+
+
+def format_codes(base, combo):
+    """Returns override tags turning values of :data:`tags` from ``base`` into ``combo``."""
+
+    codes = []
+    for name, old, new in zip(tags, base, combo):
+        if old != new:
+            codes.append(f"\\bord{new}" if name == "bord" else f"\\{name}&H{new}&")
+    return "".join(codes)
+
+
+def extract_styles(events, max_styles, style_template):
+    """Moves the most frequent combos of colors, alphas and border of events to styles.
+
+    Each of the ``max_styles`` most frequent combos gets its own style. Every event refers to style which differs from its combo by the least number of tags, and inlines only those tags.
+
+    Args:
+        events (list[dict[str, str]]): Fields of events, see :meth:`svg2ssa.document.SVG.ssa_repr_events`.
+        max_styles (int): Max number of styles besides :data:`default_style`.
+        style_template (str): Template of line of ``[V4+ Styles]``, see :attr:`svg2ssa.document.SVG.default_ssa_repr_config`.
+    Returns:
+        tuple[str, list[dict[str, str]]]: Lines of styles, each ending with newline, and fields of events referring to them.
+    """
+
+    parsed = [parse_codes(fields["codes"]) for fields in events]
+    counts = Counter(combo for combo, _ in parsed)
+    name, combo = default_style
+    styles = {combo: name}
+    for combo, _ in counts.most_common():
+        if len(styles) > max_styles:
+            break
+        styles.setdefault(combo, f"s2s.{len(styles)}")
+
+    lines = []
+    for combo, name in styles.items():
+        if name != default_style[0]:
+            primary_color, primary_alpha, outline_color, outline_alpha, bord = combo
+            lines.append(
+                style_template.format(
+                    name=name,
+                    primary=f"&H{primary_alpha}{primary_color}",
+                    outline=f"&H{outline_alpha}{outline_color}",
+                    bord=bord,
+                )
+                + "\n"
+            )
+
+    bases = {}
+    styled = []
+    for fields, (combo, rest) in zip(events, parsed):
+        base = bases.get(combo)
+        if base is None:
+            base = (
+                combo
+                if combo in styles
+                else min(styles, key=lambda style, combo=combo: format_codes(style, combo).count("\\"))
+            )
+            bases[combo] = base
+        styled.append({**fields, "style": styles[base], "codes": format_codes(base, combo) + rest})
+    return "".join(lines), styled
@@ -2,6 +2,10 @@
 
 
 import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock, local
 
 
 # Code below is slightly modified SVG path BNF for coordinates.
@@ -50,3 +54,267 @@ def convert_svglength_to_pixels(data):
     else:
         raise TypeError(f"Wrong length unit! String that caused the error contained this: '{data!s}'.")
     return data
+
+
+class LXMLParser:
+    """Fast and safe XML parser built on top of :func:`lxml.etree.iterparse`, with an API equivalent to :mod:`xml.etree.ElementTree` as far as :meth:`svg2ssa.document.SVG.from_svg_file` is concerned.
+
+    - Only elements with tags from ``tags`` are yielded, and filtering is done by lxml in C, so e.g. with ``{http://www.w3.org/2000/svg}*`` children of ``metadata`` or ``sodipodi:namedview``, which belong to other namespaces, never reach Python.
+    - Elements are cleared after their end tag is processed, along with preceding siblings, so that memory is bounded by depth of document rather than its size.
+    - Entities aren't resolved, DTD isn't loaded and network isn't accessed. Because of that ``huge_tree`` is safe to enable: it only lifts limits on depth of tree and size of text nodes, which large exports hit.
+
+    Args:
+        tags (list[str]): Qualified tags of elements to be yielded; ``None`` yields all of them.
+    Raises:
+        ImportError: If :mod:`lxml` isn't installed.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    def __init__(self, tags=None):
+        from lxml import etree
+
+        self.etree = etree
+        self.tags = tags
+
+    def iterparse(self, source, events=("end",)):
+        """Same as :func:`xml.etree.ElementTree.iterparse`."""
+
+        context = self.etree.iterparse(
+            source,
+            events=events,
+            tag=self.tags,
+            huge_tree=True,
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
+        )
+        for event, element in context:
+            yield event, element
+            if event == "end":
+                element.clear()
+                # Root has no parent, though it may have siblings like comments.
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+
+class PLYParser:
+    """Lazily built pair of PLY lexer and parser, shared by all values of a single attr.
+
+    Building of LALR tables is by far the most expensive part of PLY, therefore tables are read from pre-generated module ``tabmodule`` (see ``generate_parse_tables.py``), and neither :mod:`ply.lex` nor :mod:`ply.yacc` are imported until the first value is parsed. If ``tabmodule`` is missing or outdated, tables are built in memory, as before.
+
+    PLY parser keeps the state of parsing in itself, therefore each thread gets its own parser, whereas lexer is shared, since it's cloned for each value anyway.
+    """
+
+    def __init__(self, lex_module, yacc_module, tabmodule):
+        self.lex_module = lex_module
+        """type: Class with PLY Lex rules."""
+        self.yacc_module = yacc_module
+        """type: Class with PLY Yacc rules."""
+        self.tabmodule = tabmodule
+        """str: Name of the module with parse tables, relative to the package of ``yacc_module``."""
+        self.lexer = None
+        """ply.lex.Lexer: Lexer, cloned for each parsed value."""
+        self.local = local()
+        """threading.local: Storage for parser of each thread, ``ply.yacc.LRParser``."""
+        self.lock = Lock()
+        """threading.Lock: Guards building, which isn't thread-safe in PLY."""
+
+    # pylint: disable=import-outside-toplevel
+    def build(self, write_tables=False, outputdir=None):
+        """Builds lexer, unless it's built already, and parser for the current thread.
+
+        Args:
+            write_tables (bool): Whether to (re)write ``tabmodule`` when it doesn't match grammar.
+            outputdir (str): Dir for ``tabmodule``; defaults to the dir of the package of ``yacc_module``.
+        Returns:
+            ply.yacc.LRParser: Parser.
+        """
+
+        from ply.lex import lex
+        from ply.yacc import yacc
+
+        with self.lock:
+            if self.lexer is None:
+                self.lexer = lex(module=self.lex_module)
+            self.local.parser = yacc(
+                module=self.yacc_module(),
+                tabmodule=self.tabmodule,
+                outputdir=outputdir,
+                write_tables=write_tables,
+                debug=False,
+            )
+        return self.local.parser
+
+    def parse(self, data):
+        """Parses ``data``, building lexer and parser first if need be.
+
+        Args:
+            data (str): Raw value of an attr.
+        Returns:
+            Any: Result of parsing.
+        """
+
+        parser = getattr(self.local, "parser", None)
+        if parser is None:
+            parser = self.build()
+        lexer = self.lexer.clone()
+        lexer.input(data)
+        return parser.parse(debug=False, lexer=lexer)
+
+
+class Memo:
+    """Bounded mapping with eviction of least recently used items, which also counts its hits and misses.
+
+    Bound is in bytes, as estimated by ``sizeof``, rather than in items, since memoized paths may differ in size by orders of magnitude.
+
+    Memos are shared by all documents converted by the process, possibly in several threads, hence every operation holds a lock.
+    """
+
+    def __init__(self, name, maxbytes, sizeof):
+        self.name = name
+        """str: Name used in reports."""
+        self.maxbytes = maxbytes
+        """int: Max estimated size of items; ``0`` disables memoization altogether."""
+        self.sizeof = sizeof
+        """Callable[[Any], int]: Returns estimated size of item in bytes."""
+        self.data = OrderedDict()
+        """collections.OrderedDict: Memoized items along with their sizes, from least to most recently used."""
+        self.bytes = 0
+        """int: Estimated size of memoized items."""
+        self.hits = 0
+        """int: Number of successful lookups."""
+        self.misses = 0
+        """int: Number of failed lookups."""
+        self.evictions = 0
+        """int: Number of items evicted because of :attr:`maxbytes`."""
+        self.lock = Lock()
+        """threading.Lock: Guards :attr:`data` and counters."""
+
+    def get(self, key):
+        """Returns memoized item, or ``None`` if there is none.
+
+        Args:
+            key (Hashable): Key.
+        Returns:
+            Any: Memoized item.
+        """
+
+        with self.lock:
+            try:
+                val, _ = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.data.move_to_end(key)
+            self.hits += 1
+            return val
+
+    def __setitem__(self, key, val):
+        if self.maxbytes <= 0:
+            return
+        size = self.sizeof(val)
+        # Item that alone exceeds bound would only evict everything else.
+        if size > self.maxbytes:
+            return
+        with self.lock:
+            if key in self.data:
+                self.bytes -= self.data[key][1]
+            self.data[key] = (val, size)
+            self.bytes += size
+            while self.bytes > self.maxbytes:
+                _, (_, evicted) = self.data.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        """Drops memoized items and resets counters."""
+
+        with self.lock:
+            self.data.clear()
+            self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns counters of memo.
+
+        Returns:
+            dict[str, int | float]: Number of items, their estimated size and its bound, hits, misses, evictions and hit rate.
+        """
+
+        with self.lock:
+            size, nbytes, hits, misses, evictions = len(self.data), self.bytes, self.hits, self.misses, self.evictions
+        lookups = hits + misses
+        return dict(
+            size=size,
+            bytes=nbytes,
+            maxbytes=self.maxbytes,
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+            hit_rate=hits / lookups if lookups else 0.0,
+        )
+
+    def report(self):
+        """Returns human-readable summary of :meth:`stats`."""
+
+        stats = self.stats()
+        return (
+            f"{self.name}: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%} hit rate), "
+            f"{stats['evictions']} evictions, {stats['size']} items of {stats['bytes']:,}/{stats['maxbytes']:,} bytes"
+        )
+
+
+def convert_seconds_to_ssa_time(seconds):
+    """Converts time in seconds to SSA timestamp, i.e. ``H:MM:SS.CC``, rounded to centiseconds.
+
+    Args:
+        seconds (float): Time in seconds.
+    Returns:
+        str: SSA timestamp.
+    """
+
+    centiseconds = round(seconds * 100)
+    hours, centiseconds = divmod(centiseconds, 360000)
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    seconds, centiseconds = divmod(centiseconds, 100)
+    return f"{hours}:{minutes:02}:{seconds:02}.{centiseconds:02}"
+
+
+# pylint: disable=import-outside-toplevel
+def get_peak_rss():
+    """Returns peak resident set size of current process in bytes, or ``None`` where :mod:`resource` is unavailable (Windows)."""
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def is_gil_enabled():
+    """Returns whether GIL is enabled, which is always the case before CPython 3.13 and in its default builds."""
+
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def make_executor(max_workers=None, threads=None):
+    """Creates executor suitable for CPU-bound conversion.
+
+    Converter is reentrant: it keeps no state in globals besides memos, which are locked, so it can be run in threads. Threads share memos and avoid pickling of results, but only scale when GIL is disabled, i.e. in free-threaded builds of CPython; otherwise processes are used.
+
+    Args:
+        max_workers (int): Max number of workers; ``None`` means number of CPUs.
+        threads (bool): Force thread pool (``True``) or process pool (``False``); ``None`` picks thread pool only if GIL is disabled.
+    Returns:
+        concurrent.futures.Executor: Executor, to be shut down by caller.
+    """
+
+    if threads is None:
+        threads = not is_gil_enabled()
+    return ThreadPoolExecutor(max_workers=max_workers) if threads else ProcessPoolExecutor(max_workers=max_workers)